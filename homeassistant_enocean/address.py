@@ -8,6 +8,8 @@ For more information on EnOcean addressing, see
   - https://www.enocean.com/de/faq-knowledge-base/what-is-difference-between-base-id-and-chip-id/
 """
 
+from weakref import WeakValueDictionary
+
 
 class EnOceanAddress:
     """Implementation of the EnOcean four byte (32 bit) addresses to identify devices.
@@ -35,26 +37,60 @@ class EnOceanAddress:
     look at the EnOcean [knowledge base](https://www.enocean.com/de/faq-knowledge-base/what-is-difference-between-base-id-and-chip-id/) for the official explanation of the differences between chip ID and base IDs.
 
     Base IDs are always in the range FF:80:00:00 to FF:FF:FF:80.
+
+    Addresses are immutable and interned: constructing an address returns the instance
+    shared by all addresses of the same class and value, e.g.
+    'EnOceanAddress(0x0123ABCD) is EnOceanAddress("01:23:AB:CD")'. The instances are
+    held weakly, so the addresses of senders which are only heard once do not accumulate.
     """
 
-    def __init__(self, from_value: int | str) -> None:
-        """Initialize the EnOceanID from an integer or string."""
-        numeric_id = -1
+    __slots__ = ("__address", "__weakref__")
+
+    _instances: "WeakValueDictionary[int, EnOceanAddress]" = WeakValueDictionary()
+    """Interned instances of this class, keyed by numeric address (one dictionary per class)."""
+
+    def __init_subclass__(cls, **kwargs) -> None:
+        super().__init_subclass__(**kwargs)
+        cls._instances = WeakValueDictionary()
+
+    def __new__(cls, from_value: int | str) -> "EnOceanAddress":
+        """Return the EnOcean address for an integer or string."""
         if isinstance(from_value, str):
-            numeric_id = EnOceanAddress.from_string(from_value).to_number()
-        if isinstance(from_value, int):
-            numeric_id = from_value
-        if not isinstance(numeric_id, int):
+            from_value = EnOceanAddress._parse_string(from_value)
+        if not isinstance(from_value, int):
             raise TypeError(
                 "ID must be an integer or a hex string that can be converted to an integer."
             )
+
+        address = cls._instances.get(from_value)
+        if address is None:
+            cls._check_range(from_value)
+            # the slot is private and only exposed via 'to_number'
+            address = object.__new__(cls)
+            object.__setattr__(address, "_EnOceanAddress__address", from_value)
+            cls._instances[from_value] = address
+        return address
+
+    @classmethod
+    def _check_range(cls, numeric_id: int) -> None:
+        """Raise a ValueError if the numeric address is not valid for this class."""
         if numeric_id < 0:
             raise ValueError("ID out of bounds (must be at least 0).")
         if numeric_id > 0xFFFFFFFF:
             raise ValueError(
                 "ID out of bounds (must be smaller than 0xFFFFFFFF = 4294967295)."
             )
-        self.__address = numeric_id
+
+    @staticmethod
+    def _parse_string(id_string: str) -> int:
+        """Parse a colon-separated string to a numeric address."""
+        if not id_string:
+            raise ValueError("from_string called with undefined argument")
+        parts = id_string.strip().split(":")
+        if len(parts) != 4:
+            raise ValueError("Wrong format.")
+        hex_string = "".join(part.zfill(2) for part in parts)
+        return int(hex_string, 16)
 
     @classmethod
     def from_number(cls, id: int) -> "EnOceanAddress":
@@ -64,13 +100,7 @@ class EnOceanAddress:
     @classmethod
     def from_string(cls, id_string: str) -> "EnOceanAddress":
         """Create an EnOceanID instance from a colon-separated string."""
-        if not id_string:
-            raise ValueError("from_string called with undefined argument")
-        parts = id_string.strip().split(":")
-        if len(parts) != 4:
-            raise ValueError("Wrong format.")
-        hex_string = "".join(part.zfill(2) for part in parts)
-        return cls(int(hex_string, 16))
+        return cls(cls._parse_string(id_string))
 
     @classmethod
     def broadcast(cls) -> "EnOceanAddress":
@@ -119,12 +149,34 @@ class EnOceanAddress:
         """Return the EnOcean address as string."""
         return self.to_string()
 
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({self.to_string()!r})"
+
     def __hash__(self):
         return self.__address
 
     def __eq__(self, other):
+        if self is other:
+            return True
+        if not isinstance(other, EnOceanAddress):
+            return NotImplemented
         return self.__address == other.__address
 
+    def __setattr__(self, name: str, value) -> None:
+        raise AttributeError(f"{type(self).__name__} is immutable.")
+
+    def __delattr__(self, name: str) -> None:
+        raise AttributeError(f"{type(self).__name__} is immutable.")
+
+    def __reduce__(self):
+        return (type(self), (self.__address,))
+
+    def __copy__(self) -> "EnOceanAddress":
+        return self
+
+    def __deepcopy__(self, memo) -> "EnOceanAddress":
+        return self
+
 
 class EnOceanDeviceAddress(EnOceanAddress):
     """Representation of an EnOcean device address (EnOcean Unique Radio Identifier / EURID).
@@ -132,22 +184,15 @@ class EnOceanDeviceAddress(EnOceanAddress):
     Device addresses are in the range 00:00:00:00 to FF:7F:FF:FF.
     """
 
-    def __init__(self, from_value: int | str) -> None:
-        """Initialize the EnOcean device address from an integer or string."""
-        numeric_address = -1
-        if isinstance(from_value, str):
-            numeric_address = EnOceanAddress.from_string(from_value).to_number()
-        if isinstance(from_value, int):
-            numeric_address = from_value
-        if not isinstance(numeric_address, int):
-            raise TypeError(
-                "Address must be an integer or a hex string that can be converted to an integer."
-            )
+    __slots__ = ()
+
+    @classmethod
+    def _check_range(cls, numeric_address: int) -> None:
+        """Raise a ValueError if the numeric address is not a device address."""
         if not (0x00000000 <= numeric_address <= 0xFF7FFFFF):
             raise ValueError(
                 f"Device address must be in the range 00:00:00:00 to FF:7F:FF:FF, but is {numeric_address:08X}."
             )
-        super().__init__(numeric_address)
 
 
 class EnOceanBaseAddress(EnOceanAddress):
@@ -156,19 +201,12 @@ class EnOceanBaseAddress(EnOceanAddress):
     Base addresses are in the range FF:80:00:00 to FF:FF:FF:80.
     """
 
-    def __init__(self, from_value: int | str) -> None:
-        """Initialize the EnOcean base address from an integer or string."""
-        numeric_address = -1
-        if isinstance(from_value, str):
-            numeric_address = EnOceanAddress.from_string(from_value).to_number()
-        if isinstance(from_value, int):
-            numeric_address = from_value
-        if not isinstance(numeric_address, int):
-            raise TypeError(
-                "Address must be an integer or a hex string that can be converted to an integer."
-            )
+    __slots__ = ()
+
+    @classmethod
+    def _check_range(cls, numeric_address: int) -> None:
+        """Raise a ValueError if the numeric address is not a base address."""
         if not (0xFF800000 <= numeric_address <= 0xFFFFFF80):
             raise ValueError(
                 "Base address must be in the range FF:80:00:00 to FF:FF:FF:80."
             )
-        super().__init__(numeric_address)
@@ -0,0 +1,301 @@
+"""asyncio-based communication with an EnOcean module (TCM300/310) via ESP3.
+
+In contrast to the threaded 'EnOceanSerialCommunicator', the classes in this module
+read from the serial port (or pseudo terminal) using the event loop's reader
+callbacks. Received ESP3 packets are framed in 'data_received' and dispatched
+directly on the event loop, i.e. without any reader thread or packet queue.
+
+Note that this requires a POSIX system, as it relies on 'loop.add_reader'.
+"""
+
+import asyncio
+import logging
+import os
+from typing import TYPE_CHECKING, Callable
+
+from enocean.protocol.constants import PACKET
+import serial
+
+from .capture import RX, TX, EnOceanCaptureRecorder
+from .response_correlator import RESPONSE_TIMEOUT, EnOceanResponseCorrelator
+from .types import COMMON_COMMAND, VersionInfo
+
+if TYPE_CHECKING:
+    from enocean.protocol.packet import Packet
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class EnOceanSerialTransport(asyncio.Transport):
+    """Minimal asyncio transport for a (non-blocking) serial port or pseudo terminal."""
+
+    max_read_size: int = 65536
+    """Maximum number of bytes read from the port at once (i.e. all that is buffered)."""
+
+    def __init__(
+        self,
+        loop: asyncio.AbstractEventLoop,
+        protocol: asyncio.Protocol,
+        serial_instance: serial.Serial,
+    ) -> None:
+        """Construct the transport and schedule the protocol's connection_made callback."""
+        super().__init__(extra={"serial": serial_instance})
+        self._loop = loop
+        self._protocol = protocol
+        self._serial = serial_instance
+        self._fd = serial_instance.fileno()
+        self._write_buffer = bytearray()
+        self._closing = False
+
+        self._loop.call_soon(self._protocol.connection_made, self)
+        self._loop.call_soon(self._loop.add_reader, self._fd, self._read_ready)
+
+    def _read_ready(self) -> None:
+        try:
+            data = os.read(self._fd, self.max_read_size)
+        except (BlockingIOError, InterruptedError):
+            return
+        except OSError as e:
+            self._fatal_error(e)
+            return
+
+        if not data:
+            # end of file, e.g. the module has been unplugged
+            self.close()
+            return
+
+        self._protocol.data_received(data)
+
+    def _write_ready(self) -> None:
+        try:
+            n = os.write(self._fd, self._write_buffer)
+        except (BlockingIOError, InterruptedError):
+            return
+        except OSError as e:
+            self._fatal_error(e)
+            return
+
+        del self._write_buffer[:n]
+        if not self._write_buffer:
+            self._loop.remove_writer(self._fd)
+            if self._closing:
+                self._close()
+
+    def write(self, data: bytes | bytearray) -> None:
+        """Write data to the port without blocking, buffering what cannot be written immediately."""
+        if self._closing or not data:
+            return
+
+        if not self._write_buffer:
+            try:
+                n = os.write(self._fd, data)
+            except (BlockingIOError, InterruptedError):
+                n = 0
+            except OSError as e:
+                self._fatal_error(e)
+                return
+
+            data = data[n:]
+            if not data:
+                return
+            self._loop.add_writer(self._fd, self._write_ready)
+
+        self._write_buffer.extend(data)
+
+    def can_write_eof(self) -> bool:
+        return False
+
+    def is_closing(self) -> bool:
+        return self._closing
+
+    def close(self) -> None:
+        """Close the transport after all buffered data has been written."""
+        if self._closing:
+            return
+        self._closing = True
+        self._loop.remove_reader(self._fd)
+        if not self._write_buffer:
+            self._loop.call_soon(self._close)
+
+    def abort(self) -> None:
+        """Close the transport immediately, discarding buffered data."""
+        self._abort(None)
+
+    def _abort(self, exc: Exception | None) -> None:
+        self._closing = True
+        self._write_buffer.clear()
+        self._loop.remove_reader(self._fd)
+        self._loop.remove_writer(self._fd)
+        self._loop.call_soon(self._close, exc)
+
+    def _fatal_error(self, exc: Exception) -> None:
+        _LOGGER.error(
+            f"Serial port exception ({exc}), device disconnected or multiple access on port?"
+        )
+        self._abort(exc)
+
+    def _close(self, exc: Exception | None = None) -> None:
+        if self._serial.is_open:
+            self._serial.close()
+            self._protocol.connection_lost(exc)
+
+
+class EnOceanSerialProtocol(asyncio.Protocol):
+    """asyncio protocol framing ESP3 packets from the received byte stream."""
+
+    def __init__(self, packet_received: Callable[["Packet"], None]) -> None:
+        """Construct the protocol with a callback for each successfully framed packet."""
+        # imports the enocean library's packet classes (incl. the EEP profiles) on first use
+        from .esp3_framer import EnOceanESP3Framer
+
+        self._packet_received = packet_received
+        self._framer = EnOceanESP3Framer()
+        self.transport: asyncio.Transport | None = None
+        self.recorder: EnOceanCaptureRecorder | None = None
+
+    def connection_made(self, transport: asyncio.Transport) -> None:
+        self.transport = transport
+
+    def data_received(self, data: bytes) -> None:
+        if self.recorder:
+            self.recorder.record(RX, data)
+        for packet in self._framer.feed(data):
+            self._packet_received(packet)
+
+    def connection_lost(self, exc: Exception | None) -> None:
+        self.transport = None
+        if exc:
+            _LOGGER.error(f"Connection to EnOcean module lost: {exc}")
+
+
+class EnOceanAsyncCommunicator:
+    """Communicate with an EnOcean module on the event loop.
+
+    This offers the same interface as 'EnOceanSerialCommunicator' as far as it is used by the
+    gateway, except for 'start', which is a coroutine.
+    """
+
+    def __init__(self, port: str | None = "/dev/ttyAMA0") -> None:
+        """Open the serial port; it is attached to the event loop in 'start'.
+
+        Subclasses which provide their own transport (see '_create_transport') pass no port.
+        """
+        self._serial = serial.Serial(port, 57600, timeout=0) if port else None
+        self._transport: asyncio.Transport | None = None
+        self._protocol: EnOceanSerialProtocol | None = None
+        self._recorder: EnOceanCaptureRecorder | None = None
+        self._callback: Callable[[Packet], None] | None = None
+        self._correlator: EnOceanResponseCorrelator | None = None
+        self._base_id: list[int] | None = None
+        self._version_info: VersionInfo | None = None
+        self.teach_in = False
+
+    async def start(self) -> None:
+        """Attach the serial port to the running event loop."""
+        loop = asyncio.get_running_loop()
+        self._correlator = EnOceanResponseCorrelator(loop, self._transmit)
+        self._protocol = EnOceanSerialProtocol(self._packet_received)
+        self._protocol.recorder = self._recorder
+        self._transport = self._create_transport(loop, self._protocol)
+
+    def _create_transport(
+        self, loop: asyncio.AbstractEventLoop, protocol: EnOceanSerialProtocol
+    ) -> asyncio.Transport:
+        """Create the transport feeding the protocol."""
+        return EnOceanSerialTransport(loop, protocol, self._serial)
+
+    def stop(self) -> None:
+        """Detach from the event loop and close the serial port."""
+        if self._transport:
+            self._transport.close()
+        if self._correlator:
+            self._correlator.cancel_all()
+
+    def is_alive(self) -> bool:
+        """Return True if the communicator is started and not closed."""
+        return self._transport is not None and not self._transport.is_closing()
+
+    @property
+    def callback(self) -> Callable[["Packet"], None] | None:
+        """Return the callback for received packets."""
+        return self._callback
+
+    @callback.setter
+    def callback(self, callback: Callable[["Packet"], None] | None) -> None:
+        """Set the callback for received packets."""
+        self._callback = callback
+
+    @property
+    def recorder(self) -> EnOceanCaptureRecorder | None:
+        """Return the recorder for the data exchanged with the module."""
+        return self._recorder
+
+    @recorder.setter
+    def recorder(self, recorder: EnOceanCaptureRecorder | None) -> None:
+        """Set a recorder for the data exchanged with the module (None to stop recording)."""
+        self._recorder = recorder
+        if self._protocol:
+            self._protocol.recorder = recorder
+
+    def send(self, packet: "Packet") -> bool:
+        """Send a packet to the module (without waiting for its response)."""
+        if self._correlator:
+            return self._correlator.send(packet)
+        return self._transmit(packet)
+
+    async def request(
+        self, packet: "Packet", timeout: float = RESPONSE_TIMEOUT
+    ) -> "Packet | None":
+        """Send a packet and wait for the module's response; return None on timeout."""
+        if not self._correlator:
+            _LOGGER.error("Cannot send packet, EnOcean communicator is not started.")
+            return None
+        return await self._correlator.request(packet, timeout)
+
+    def _transmit(self, packet: "Packet") -> bool:
+        """Write a packet to the transport."""
+        if not self._transport or self._transport.is_closing():
+            _LOGGER.error("Cannot send packet, EnOcean communicator is not started.")
+            return False
+        data = bytes(packet.build())
+        if self._recorder:
+            self._recorder.record(TX, data)
+        self._transport.write(data)
+        return True
+
+    def _packet_received(self, packet: "Packet") -> None:
+        if packet.packet_type == PACKET.RESPONSE:
+            if self._correlator:
+                self._correlator.handle_response(packet)
+            return
+
+        if self._callback:
+            self._callback(packet)
+
+    async def fetch_base_id(self) -> list[int] | None:
+        """Fetch the base id from the module, if required. Otherwise, return the currently set base id."""
+        if self._base_id is None:
+            self._base_id = await self._correlator.common_command(
+                COMMON_COMMAND.CO_RD_IDBASE, 4
+            )
+            if self._base_id is None:
+                _LOGGER.error(
+                    f"Could not obtain base id from module within {RESPONSE_TIMEOUT} second(s)."
+                )
+
+        return self._base_id
+
+    async def fetch_version_info(self) -> VersionInfo | None:
+        """Fetch version info from the module, if required. Otherwise, return the currently set version info."""
+        if self._version_info is None:
+            response_data = await self._correlator.common_command(
+                COMMON_COMMAND.CO_RD_VERSION, 32
+            )
+            if response_data is None:
+                _LOGGER.warning(
+                    f"Could not obtain version info from module within {RESPONSE_TIMEOUT} second(s)."
+                )
+            else:
+                self._version_info = VersionInfo.from_response_data(response_data)
+
+        return self._version_info
@@ -0,0 +1,118 @@
+"""Batched delivery of entity callbacks to the event loop."""
+
+import asyncio
+from collections import deque
+import functools
+import logging
+import threading
+from typing import Callable
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class EnOceanCallbackBatcher:
+    """Collects entity state updates and delivers them to the event loop in batches.
+
+    Updates are queued by the callbacks returned from 'wrap' (on the communicator's thread
+    or on the event loop) and delivered on the event loop at most 'window' seconds after
+    the first update of a batch, or as soon as 'max_batch_size' updates are pending. This
+    needs a single loop hop per batch instead of one loop wakeup per update.
+
+    Until an event loop is set, updates are delivered immediately.
+    """
+
+    def __init__(self, window: float = 0.02, max_batch_size: int = 64) -> None:
+        """Construct the batcher with the maximum delay and number of updates per batch."""
+        if window <= 0:
+            raise ValueError("Delivery window must be positive.")
+        if max_batch_size < 1:
+            raise ValueError("Maximum batch size must be at least 1.")
+        self.__window = window
+        self.__max_batch_size = max_batch_size
+        self.__loop: asyncio.AbstractEventLoop | None = None
+        self.__lock = threading.Lock()
+        self.__pending: deque[tuple[Callable, tuple]] = deque()
+        self.__scheduled = False
+        self.__full = False
+        self.__timer: asyncio.TimerHandle | None = None
+
+        self.batches: int = 0
+        """Number of delivered batches."""
+
+        self.updates: int = 0
+        """Number of delivered updates."""
+
+    @property
+    def window(self) -> float:
+        """Return the maximum delay (in seconds) of an update."""
+        return self.__window
+
+    @property
+    def max_batch_size(self) -> int:
+        """Return the number of pending updates at which a batch is delivered immediately."""
+        return self.__max_batch_size
+
+    @property
+    def loop(self) -> asyncio.AbstractEventLoop | None:
+        """Return the event loop on which the updates are delivered."""
+        return self.__loop
+
+    @loop.setter
+    def loop(self, loop: asyncio.AbstractEventLoop | None) -> None:
+        """Set the event loop on which the updates are delivered."""
+        self.__loop = loop
+
+    @property
+    def pending(self) -> int:
+        """Return the number of updates waiting for delivery."""
+        return len(self.__pending)
+
+    def wrap(self, callback: Callable) -> Callable:
+        """Return a callback queueing its updates for batched delivery to the given callback."""
+        return functools.partial(self.deliver, callback)
+
+    def deliver(self, callback: Callable, *args) -> None:
+        """Queue a call of the callback with the given arguments."""
+        loop = self.__loop
+        if loop is None or loop.is_closed():
+            callback(*args)
+            return
+
+        with self.__lock:
+            self.__pending.append((callback, args))
+            if not self.__scheduled:
+                self.__scheduled = True
+                schedule = self.__start_timer
+            elif not self.__full and len(self.__pending) >= self.__max_batch_size:
+                self.__full = True
+                schedule = self.flush
+            else:
+                return
+        loop.call_soon_threadsafe(schedule)
+
+    def __start_timer(self) -> None:
+        """Deliver the pending updates after the window (called on the event loop)."""
+        if self.__scheduled and self.__timer is None:
+            self.__timer = self.__loop.call_later(self.__window, self.flush)
+
+    def flush(self) -> None:
+        """Deliver all pending updates now (to be called on the event loop)."""
+        with self.__lock:
+            batch = self.__pending
+            self.__pending = deque()
+            self.__scheduled = False
+            self.__full = False
+            timer = self.__timer
+            self.__timer = None
+        if timer is not None:
+            timer.cancel()
+        if not batch:
+            return
+
+        self.batches += 1
+        self.updates += len(batch)
+        for callback, args in batch:
+            try:
+                callback(*args)
+            except Exception:
+                _LOGGER.exception("Error in EnOcean entity callback")
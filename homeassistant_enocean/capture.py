@@ -0,0 +1,106 @@
+"""Recording of the ESP3 byte stream exchanged with an EnOcean module.
+
+A capture is a text file with one record per line,
+
+    <seconds since start of recording> <direction> <hex encoded data>
+
+where direction is 'rx' for data received from the module and 'tx' for data sent to it.
+Empty lines and lines starting with '#' are ignored. Captures can be replayed into a gateway
+using the 'EnOceanReplayCommunicator' (see replay.py).
+"""
+
+import threading
+import time
+from typing import NamedTuple, TextIO
+
+RX = "rx"
+"""Direction of data received from the module."""
+
+TX = "tx"
+"""Direction of data sent to the module."""
+
+CAPTURE_HEADER = "# homeassistant_enocean ESP3 capture v1"
+
+
+class CaptureRecord(NamedTuple):
+    """A chunk of the ESP3 byte stream."""
+
+    timestamp: float
+    """Time (in seconds) since the start of the recording."""
+
+    direction: str
+    """Either RX or TX."""
+
+    data: bytes
+    """The raw bytes, as read from or written to the serial port."""
+
+    def to_line(self) -> str:
+        """Return the record as a line of a capture file (without line break)."""
+        return f"{self.timestamp:.6f} {self.direction} {self.data.hex()}"
+
+    @classmethod
+    def from_line(cls, line: str) -> "CaptureRecord":
+        """Parse a line of a capture file."""
+        timestamp, direction, data = line.split()
+        if direction not in (RX, TX):
+            raise ValueError(f"Invalid direction '{direction}' in capture record.")
+        return cls(float(timestamp), direction, bytes.fromhex(data))
+
+
+def read_capture(path: str) -> list[CaptureRecord]:
+    """Read all records of a capture file."""
+    with open(path, encoding="ascii") as file:
+        return [
+            CaptureRecord.from_line(line)
+            for line in file
+            if line.strip() and not line.startswith("#")
+        ]
+
+
+def write_capture(path: str, records: list[CaptureRecord]) -> None:
+    """Write records to a capture file."""
+    with open(path, "w", encoding="ascii") as file:
+        file.write(CAPTURE_HEADER + "\n")
+        for record in records:
+            file.write(record.to_line() + "\n")
+
+
+class EnOceanCaptureRecorder:
+    """Record the data exchanged with a module to a capture file.
+
+    Set an instance as a communicator's 'recorder' to start recording and close it when done.
+    The recorder may be used from the communicator's reader thread and the event loop.
+    """
+
+    def __init__(self, file: str | TextIO) -> None:
+        """Construct a recorder writing to the given path or text file."""
+        if isinstance(file, str):
+            file = open(file, "w", encoding="ascii")
+        self.__file: TextIO = file
+        self.__lock = threading.Lock()
+        self.__start: float | None = None
+        self.__file.write(CAPTURE_HEADER + "\n")
+
+    def record(self, direction: str, data: bytes) -> None:
+        """Append data in the given direction to the capture."""
+        now = time.monotonic()
+        with self.__lock:
+            if self.__file.closed:
+                return
+            if self.__start is None:
+                self.__start = now
+            self.__file.write(
+                CaptureRecord(now - self.__start, direction, bytes(data)).to_line()
+                + "\n"
+            )
+
+    def close(self) -> None:
+        """Flush and close the capture file."""
+        with self.__lock:
+            self.__file.close()
+
+    def __enter__(self) -> "EnOceanCaptureRecorder":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
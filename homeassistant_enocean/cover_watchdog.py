@@ -0,0 +1,201 @@
+"""Polling of the position of moving covers (EEP D2-05-00) on a shared timer wheel."""
+
+import asyncio
+import threading
+from typing import Any, Protocol
+
+WATCHDOG_TIMEOUT = 1
+"""Time (in seconds) after a command or position report until the position is queried."""
+
+WATCHDOG_INTERVAL = 0.2
+"""Resolution (in seconds) of the watchdog's timer wheel."""
+
+WATCHDOG_MAX_QUERIES = 10
+"""Maximum number of position queries after a command."""
+
+WATCHDOG_MAX_DELAY = 8
+"""Maximum time (in seconds) between two queries of a cover which does not answer."""
+
+
+class EnOceanWatchedCover(Protocol):
+    """A cover whose position can be queried."""
+
+    def query_cover_position(self, entity_uid: Any) -> None:
+        """Query the position of the cover."""
+
+
+class _WatchedCover:
+    """State of a cover watched by the watchdog."""
+
+    __slots__ = ("cover", "target", "last_position", "queries", "delay", "due_tick")
+
+    def __init__(self, cover: EnOceanWatchedCover, target: int | None) -> None:
+        self.cover = cover
+        self.target = target
+        self.last_position: int | None = None
+        self.queries = 0
+        self.delay: float = 0
+        self.due_tick = 0
+
+
+class EnOceanCoverWatchdog:
+    """Queries the position of covers while they are moving, until they report a final position.
+
+    After a command, a cover's position is queried after 'timeout' seconds. If the cover
+    reports a position which differs from the previous report (i.e. it is still moving),
+    it is queried again after 'timeout' seconds; if it does not answer, the time between
+    queries doubles up to 'max_delay' seconds. A cover is no longer watched once it reports
+    its target position or the same position twice, or after 'max_queries' queries.
+
+    All covers share a single timer wheel with a resolution of 'interval' seconds, which
+    runs on the event loop only while covers are watched. At most 'queries_per_tick'
+    queries are sent per tick; further due queries are deferred to the next tick, so that
+    many covers moving at once do not flood the radio channel.
+    """
+
+    def __init__(
+        self,
+        timeout: float = WATCHDOG_TIMEOUT,
+        interval: float = WATCHDOG_INTERVAL,
+        max_queries: int = WATCHDOG_MAX_QUERIES,
+        max_delay: float = WATCHDOG_MAX_DELAY,
+        queries_per_tick: int = 1,
+        slots: int = 64,
+    ) -> None:
+        """Construct the watchdog with the given schedule and timer wheel parameters."""
+        if interval <= 0:
+            raise ValueError("Interval must be positive.")
+        if timeout < interval or max_delay < timeout:
+            raise ValueError("Timeouts must satisfy interval <= timeout <= max_delay.")
+        if max_queries < 1 or queries_per_tick < 1 or slots < 1:
+            raise ValueError("Numbers of queries and slots must be at least 1.")
+        self.__timeout = timeout
+        self.__interval = interval
+        self.__max_queries = max_queries
+        self.__max_delay = max_delay
+        self.__queries_per_tick = queries_per_tick
+
+        self.__wheel: list[list[_WatchedCover]] = [[] for _ in range(slots)]
+        """Watched covers per slot; entries whose due tick changed are stale and skipped."""
+        self.__watched: dict[EnOceanWatchedCover, _WatchedCover] = {}
+        self.__tick = 0
+        self.__next_tick_at = 0.0
+        self.__timer: asyncio.TimerHandle | None = None
+
+        self.__loop: asyncio.AbstractEventLoop | None = None
+        self.__loop_thread: int | None = None
+
+        self.queries: int = 0
+        """Number of position queries sent."""
+
+    @property
+    def watched(self) -> int:
+        """Return the number of covers currently watched."""
+        return len(self.__watched)
+
+    def is_watched(self, cover: EnOceanWatchedCover) -> bool:
+        """Check whether the cover is currently watched."""
+        return cover in self.__watched
+
+    def start(self) -> None:
+        """Start watching covers on the running event loop."""
+        self.__loop = asyncio.get_running_loop()
+        self.__loop_thread = threading.get_ident()
+
+    def stop(self) -> None:
+        """Stop watching all covers."""
+        if self.__timer:
+            self.__timer.cancel()
+            self.__timer = None
+        self.__watched.clear()
+        for slot in self.__wheel:
+            slot.clear()
+        self.__loop = None
+
+    def watch(self, cover: EnOceanWatchedCover, target: int | None = None) -> None:
+        """Start (or restart) watching a cover after a command, optionally with its target position.
+
+        May be called from any thread; it is ignored unless the watchdog is started.
+        """
+        self.__call(self.__watch, cover, target)
+
+    def report(self, cover: EnOceanWatchedCover, position: int) -> None:
+        """Handle a position reported by a cover (may be called from any thread)."""
+        self.__call(self.__report, cover, position)
+
+    def __call(self, function, *args) -> None:
+        """Call the function on the event loop."""
+        loop = self.__loop
+        if loop is None or loop.is_closed():
+            return
+        if threading.get_ident() == self.__loop_thread:
+            function(*args)
+        else:
+            loop.call_soon_threadsafe(function, *args)
+
+    def __watch(self, cover: EnOceanWatchedCover, target: int | None) -> None:
+        watched = _WatchedCover(cover, target)
+        self.__watched[cover] = watched
+        self.__schedule(watched, self.__timeout)
+
+    def __report(self, cover: EnOceanWatchedCover, position: int) -> None:
+        watched = self.__watched.get(cover)
+        if watched is None:
+            return
+        if position == watched.target or position == watched.last_position:
+            del self.__watched[cover]
+            return
+        watched.last_position = position
+        self.__schedule(watched, self.__timeout)
+
+    def __schedule(self, watched: _WatchedCover, delay: float) -> None:
+        """Schedule the next query of a watched cover in (about) delay seconds."""
+        watched.delay = delay
+        if self.__timer is None:
+            # the wheel was idle, its next tick is one interval from now
+            self.__next_tick_at = self.__loop.time() + self.__interval
+            self.__timer = self.__loop.call_at(self.__next_tick_at, self.__advance)
+        ticks = max(1, round(delay / self.__interval))
+        self.__place(watched, self.__tick + ticks)
+
+    def __place(self, watched: _WatchedCover, tick: int) -> None:
+        watched.due_tick = tick
+        self.__wheel[tick % len(self.__wheel)].append(watched)
+
+    def __advance(self) -> None:
+        """Advance the wheel by one tick and query the covers which are due."""
+        self.__tick += 1
+        tick = self.__tick
+        slot = self.__wheel[tick % len(self.__wheel)]
+        self.__wheel[tick % len(self.__wheel)] = []
+
+        budget = self.__queries_per_tick
+        for watched in slot:
+            if self.__watched.get(watched.cover) is not watched:
+                continue
+            if watched.due_tick != tick:
+                if watched.due_tick > tick:
+                    # due in a later round of the wheel
+                    self.__wheel[tick % len(self.__wheel)].append(watched)
+                continue
+            if budget == 0:
+                self.__place(watched, tick + 1)
+                continue
+            budget -= 1
+            self.__query(watched)
+
+        if self.__watched:
+            self.__next_tick_at += self.__interval
+            self.__timer = self.__loop.call_at(self.__next_tick_at, self.__advance)
+        else:
+            self.__timer = None
+
+    def __query(self, watched: _WatchedCover) -> None:
+        """Query the position of a watched cover and schedule the next query."""
+        watched.queries += 1
+        self.queries += 1
+        if watched.queries >= self.__max_queries:
+            del self.__watched[watched.cover]
+        else:
+            self.__schedule(watched, min(watched.delay * 2, self.__max_delay))
+        watched.cover.query_cover_position(None)
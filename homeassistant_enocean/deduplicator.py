@@ -0,0 +1,86 @@
+"""Suppression of telegrams received more than once via repeaters."""
+
+import time
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from enocean.protocol.packet import RadioPacket
+
+REPEATER_COUNT_MASK = 0x0F
+"""Bits of a radio telegram's status byte counting the repeater hops."""
+
+
+class EnOceanTelegramDeduplicator:
+    """Detects copies of a radio telegram received via (level 1/2) repeaters.
+
+    Telegrams are identified by sender, data and status (without the repeater count). A
+    telegram is a copy if the same telegram was first received less than 'window' seconds
+    before. The last 'capacity' telegrams are kept in a fixed-size ring, so memory and
+    time per telegram are constant.
+
+    Repeated copies arrive within some tens of milliseconds, hence the short default window.
+    A telegram which is really sent again within the window (e.g. the same rocker pressed
+    twice quickly) cannot be told apart from a copy and is lost.
+    """
+
+    def __init__(self, window: float = 0.1, capacity: int = 64) -> None:
+        """Construct the deduplicator with the time window (in seconds) and number of remembered telegrams."""
+        if window <= 0:
+            raise ValueError("Deduplication window must be positive.")
+        if capacity < 1:
+            raise ValueError("Capacity must be at least 1.")
+        self.__window = window
+        self.__ring: list[tuple | None] = [None] * capacity
+        self.__index = 0
+        self.__entries: dict[tuple, list] = {}
+        """[time of the first copy, best RSSI] per telegram key in the ring."""
+
+        self.duplicates: int = 0
+        """Number of suppressed copies."""
+
+    @property
+    def window(self) -> float:
+        """Return the time window (in seconds) in which copies are suppressed."""
+        return self.__window
+
+    @property
+    def capacity(self) -> int:
+        """Return the number of remembered telegrams."""
+        return len(self.__ring)
+
+    def check(self, packet: "RadioPacket") -> int | None:
+        """Remember the telegram and check whether it is a copy of a recently received one.
+
+        Returns None for a new telegram, which is to be dispatched. For a copy, the best
+        RSSI (in dBm) of all copies of the telegram received so far is returned.
+        """
+        data = packet.data
+        key = (
+            packet.sender_int,
+            data[-1] & ~REPEATER_COUNT_MASK,
+            bytes(data[:-1]),
+        )
+        now = time.monotonic()
+        rssi = packet.dBm
+
+        entry = self.__entries.get(key)
+        if entry is not None and now - entry[0] < self.__window:
+            self.duplicates += 1
+            if rssi > entry[1]:
+                entry[1] = rssi
+            return entry[1]
+
+        if entry is not None:
+            # expired, remember as a new telegram (its old ring slot is overwritten later)
+            entry[0] = now
+            entry[1] = rssi
+            return None
+
+        ring = self.__ring
+        index = self.__index
+        if (evicted := ring[index]) is not None:
+            del self.__entries[evicted]
+        ring[index] = key
+        self.__entries[key] = [now, rssi]
+        self.__index = (index + 1) % len(ring)
+        return None
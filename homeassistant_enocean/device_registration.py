@@ -0,0 +1,49 @@
+"""Types for registering devices with the gateway in bulk."""
+
+from typing import NamedTuple
+
+from .address import EnOceanAddress, EnOceanDeviceAddress
+from .device_type import EnOceanDeviceType
+
+
+class EnOceanDeviceConfig(NamedTuple):
+    """Configuration of a device to be added to the gateway."""
+
+    enocean_id: EnOceanDeviceAddress
+    device_type: EnOceanDeviceType
+    device_name: str | None = None
+    sender_id: EnOceanAddress | None = None
+
+
+class EnOceanDeviceRegistrationFailure(NamedTuple):
+    """A device which could not be added to the gateway (with the exception raised by its handler, if any)."""
+
+    config: EnOceanDeviceConfig
+    reason: str
+    error: Exception | None = None
+
+
+class EnOceanDeviceRegistrationResult:
+    """Result of adding devices to the gateway."""
+
+    def __init__(self) -> None:
+        """Construct an empty result."""
+        self.added: list[EnOceanDeviceAddress] = []
+        """Addresses of the devices which were added."""
+
+        self.skipped: list[EnOceanDeviceAddress] = []
+        """Addresses of the devices which were already registered (or given more than once)."""
+
+        self.failed: list[EnOceanDeviceRegistrationFailure] = []
+        """Devices which could not be added, with the reason."""
+
+    @property
+    def success(self) -> bool:
+        """Return True if no device failed."""
+        return not self.failed
+
+    def __str__(self) -> str:
+        return (
+            f"EnOceanDeviceRegistrationResult(added={len(self.added)}, "
+            f"skipped={len(self.skipped)}, failed={len(self.failed)})"
+        )
@@ -1,4 +1,7 @@
+from ..eep_decoder import EEPDecoder, get_eep_decoder
+from ..entity_field import EnOceanEntityField, value_field
 from ..entity_properties import HomeAssistantEntityProperties
+from ..types import EnOceanEntityUID
 from .device import EnOceanDevice
 
 
@@ -18,14 +21,10 @@ class EnOceanA502XXDevice(EnOceanDevice):
             ),
         ]
 
-    def handle_matching_packet(self, packet) -> None:
-        """Handle an incoming EnOcean packet."""
-        try:
-            packet.parse_eep(rorg_func=0x02, rorg_type=self.device_type.eep.type)
-            temperature = packet.parsed["TMP"]["value"]
+    def create_eep_decoder(self) -> EEPDecoder:
+        """Create the decoder for this device's telegrams."""
+        return get_eep_decoder(0xA5, 0x02, self.device_type.eep.type)
 
-            temperature_callback = self._sensor_callbacks.get(None)
-            if temperature_callback:
-                temperature_callback(temperature)
-        except Exception:
-            return
+    def entity_fields(self) -> dict[tuple[str, EnOceanEntityUID], EnOceanEntityField]:
+        """Return how the entities' states are decoded."""
+        return {("sensor", None): value_field("TMP")}
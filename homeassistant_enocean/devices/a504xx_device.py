@@ -1,4 +1,7 @@
+from ..eep_decoder import EEPDecoder, get_eep_decoder
+from ..entity_field import EnOceanEntityField, value_field
 from ..entity_properties import HomeAssistantEntityProperties
+from ..types import EnOceanEntityUID
 from .device import EnOceanDevice
 
 
@@ -20,19 +23,13 @@ class EnOceanA504XXDevice(EnOceanDevice):
             ),
         ]
 
-    def handle_matching_packet(self, packet) -> None:
-        """Handle an incoming EnOcean packet."""
-        try:
-            packet.parse_eep(rorg_func=0x04, rorg_type=self.device_type.eep.type)
-            temperature = packet.parsed["TMP"]["value"]
-            humidity = packet.parsed["HUM"]["value"]
+    def create_eep_decoder(self) -> EEPDecoder:
+        """Create the decoder for this device's telegrams."""
+        return get_eep_decoder(0xA5, 0x04, self.device_type.eep.type)
 
-            temperature_callback = self._sensor_callbacks.get("temperature")
-            if temperature_callback:
-                temperature_callback(temperature)
-
-            humidity_callback = self._sensor_callbacks.get("humidity")
-            if humidity_callback:
-                humidity_callback(humidity)
-        except Exception:
-            return
+    def entity_fields(self) -> dict[tuple[str, EnOceanEntityUID], EnOceanEntityField]:
+        """Return how the entities' states are decoded."""
+        return {
+            ("sensor", "temperature"): value_field("TMP"),
+            ("sensor", "humidity"): value_field("HUM"),
+        }
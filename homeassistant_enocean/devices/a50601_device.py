@@ -1,7 +1,29 @@
+from ..eep_decoder import EEPDecoder, EEPValue, get_eep_decoder
+from ..entity_field import EnOceanEntityField, value_field
 from ..entity_properties import HomeAssistantEntityProperties
+from ..types import EnOceanEntityUID
 from .device import EnOceanDevice
 
 
+def _illumination(values: dict[str, EEPValue]) -> float:
+    """Return the illumination from the range (RS) selected by the sensor."""
+    if values["RS"].raw_value == 0:
+        return values["ILL1"].value
+    return values["ILL2"].value
+
+
+def _eltako_illumination(values: dict[str, EEPValue]) -> float:
+    """Return the illumination of the Eltako variant, which uses the SVC data bits for 0-100 lx."""
+    ill2 = values["ILL2"].value
+    if ill2 > 300:
+        return round(ill2)
+    return values["SVC"].raw_value
+
+
+_ILLUMINATION = EnOceanEntityField(("RS", "ILL1", "ILL2"), _illumination)
+_ELTAKO_ILLUMINATION = EnOceanEntityField(("ILL2", "SVC"), _eltako_illumination)
+
+
 class EnOceanA50601Device(EnOceanDevice):
     """Handler for EnOcean Equipment Profile A5-06-01 Light sensor (incl. the modified Eltako variant with MAN_ID = 0x0D)."""
 
@@ -26,37 +48,19 @@ class EnOceanA50601Device(EnOceanDevice):
                 ),
             )
 
-    def handle_matching_packet(self, packet) -> None:
-        """Handle an incoming EnOcean packet."""
-        try:
-            packet.parse_eep(rorg_func=0x06, rorg_type=0x01)
-            illumination: float = 0
-
-            if self._is_eltako_variant():
-                ill2 = packet.parsed["ILL2"]["value"]
-                if ill2 > 300:
-                    illumination = round(ill2)
-                else:
-                    illumination = packet.parsed["SVC"]["raw_value"]
-
-            else:
-                svc = packet.parsed["SVC"]["value"]
-                supply_voltage_callback = self._sensor_callbacks.get("supply_voltage")
-                if supply_voltage_callback:
-                    supply_voltage_callback(svc)
-
-                rs = packet.parsed["RS"]["raw_value"]
-                if rs == 0:
-                    illumination = packet.parsed["ILL1"]["value"]
-                else:
-                    illumination = packet.parsed["ILL2"]["value"]
+    def create_eep_decoder(self) -> EEPDecoder:
+        """Create the decoder for this device's telegrams."""
+        return get_eep_decoder(0xA5, 0x06, 0x01)
 
-            illumination_callback = self._sensor_callbacks.get(None)
-            if illumination_callback:
-                illumination_callback(illumination)
+    def entity_fields(self) -> dict[tuple[str, EnOceanEntityUID], EnOceanEntityField]:
+        """Return how the entities' states are decoded."""
+        if self._is_eltako_variant():
+            return {("sensor", None): _ELTAKO_ILLUMINATION}
 
-        except Exception:
-            return
+        return {
+            ("sensor", "supply_voltage"): value_field("SVC"),
+            ("sensor", None): _ILLUMINATION,
+        }
 
     def _is_eltako_variant(self) -> bool:
         return (
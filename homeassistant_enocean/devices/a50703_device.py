@@ -1,6 +1,14 @@
+from ..eep_decoder import EEPDecoder, get_eep_decoder
+from ..entity_field import EnOceanEntityField, raw_value_field
 from ..entity_properties import HomeAssistantEntityProperties
+from ..types import EnOceanEntityUID
 from .device import EnOceanDevice
 
+# convert to volts from range 0..250 representing 0..5V
+_SUPPLY_VOLTAGE = EnOceanEntityField(
+    ("SVC",), lambda values: 5.0 * (values["SVC"].raw_value / 250.0)
+)
+
 
 class EnOceanA50703Device(EnOceanDevice):
     """Handler for EnOcean Equipment Profile A5-07-03 (Occupancy with Supply voltage monitor and 10-bit illumination measurement)"""
@@ -27,23 +35,14 @@ class EnOceanA50703Device(EnOceanDevice):
             ),
         ]
 
-    def handle_matching_packet(self, packet) -> None:
-        """Handle an incoming EnOcean packet."""
-        packet.parse_eep(0x07, 0x03)
-        motion = packet.parsed["PIR"]["raw_value"]
-        illumination = packet.parsed["ILL"]["raw_value"]
-        supply_voltage = 5.0 * (
-            packet.parsed["SVC"]["raw_value"] / 250.0
-        )  # convert to volts from range 0..250 representing 0..5V
-
-        motion_callback = self._binary_sensor_callbacks.get("motion_detected")
-        if motion_callback:
-            motion_callback(motion)
-
-        illumination_callback = self._sensor_callbacks.get("illumination")
-        if illumination_callback:
-            illumination_callback(illumination)
-
-        supply_voltage_callback = self._sensor_callbacks.get("supply_voltage")
-        if supply_voltage_callback:
-            supply_voltage_callback(supply_voltage)
+    def create_eep_decoder(self) -> EEPDecoder:
+        """Create the decoder for this device's telegrams."""
+        return get_eep_decoder(0xA5, 0x07, 0x03)
+
+    def entity_fields(self) -> dict[tuple[str, EnOceanEntityUID], EnOceanEntityField]:
+        """Return how the entities' states are decoded."""
+        return {
+            ("binary_sensor", "motion_detected"): raw_value_field("PIR"),
+            ("sensor", "illumination"): raw_value_field("ILL"),
+            ("sensor", "supply_voltage"): _SUPPLY_VOLTAGE,
+        }
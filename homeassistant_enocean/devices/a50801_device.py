@@ -1,4 +1,7 @@
+from ..eep_decoder import EEPDecoder, get_eep_decoder
+from ..entity_field import EnOceanEntityField, raw_value_field, value_field
 from ..entity_properties import HomeAssistantEntityProperties
+from ..types import EnOceanEntityUID
 from .device import EnOceanDevice
 
 
@@ -41,46 +44,22 @@ class EnOceanA50801Device(EnOceanDevice):
                 ),
             )
 
-    def handle_matching_packet(self, packet) -> None:
-        """Handle an incoming EnOcean packet."""
-        try:
-            packet.parse_eep(rorg_func=0x08, rorg_type=0x01)
-            svc = packet.parsed["SVC"]["value"]
-            ill = packet.parsed["ILL"]["value"]
-            pirs = packet.parsed["PIRS"]["raw_value"]
-
-            supply_voltage_callback = self._sensor_callbacks.get("supply_voltage")
-            if supply_voltage_callback:
-                supply_voltage_callback(svc)
-
-            illumination_callback = self._sensor_callbacks.get("illumination")
-            if illumination_callback:
-                illumination_callback(ill)
-
-            occupancy_callback = self._binary_sensor_callbacks.get(None)
-            if occupancy_callback:
-                occupancy_callback(pirs)
-
-            if self._is_eltako_variant():
-                return
-
-            # for non-Eltako variants,  also handle temperature and occupancy button
-            tmp = packet.parsed["TMP"]["value"]
-            occ = packet.parsed["OCC"]["raw_value"]
-
-            occupancy_button_callback = self._binary_sensor_callbacks.get(
-                "occupancy_button"
-            )
-            if occupancy_button_callback:
-                occupancy_button_callback(occ)
-
-            temperature_callback = self._sensor_callbacks.get("temperature")
-            if temperature_callback:
-                temperature_callback(tmp)
-
-        except Exception as e:
-            print(f"Error handling packet in EnOceanA50801Device: {e}")
-            return
+    def create_eep_decoder(self) -> EEPDecoder:
+        """Create the decoder for this device's telegrams."""
+        return get_eep_decoder(0xA5, 0x08, 0x01)
+
+    def entity_fields(self) -> dict[tuple[str, EnOceanEntityUID], EnOceanEntityField]:
+        """Return how the entities' states are decoded."""
+        fields = {
+            ("sensor", "supply_voltage"): value_field("SVC"),
+            ("sensor", "illumination"): value_field("ILL"),
+            ("binary_sensor", None): raw_value_field("PIRS"),
+        }
+        if not self._is_eltako_variant():
+            # for non-Eltako variants, also handle temperature and occupancy button
+            fields[("binary_sensor", "occupancy_button")] = raw_value_field("OCC")
+            fields[("sensor", "temperature")] = value_field("TMP")
+        return fields
 
     def _is_eltako_variant(self) -> bool:
         return (
@@ -1,10 +1,17 @@
 import math
 
-from enocean.protocol.packet import RadioPacket
-
-from homeassistant_enocean.types import EnOceanEntityUID
-
+from homeassistant_enocean.types import (
+    EnOceanEntityUID,
+    EnOceanSendRadioPacket,
+    HomeAssistantTaskCreator,
+)
+
+from ..address import EnOceanAddress, EnOceanDeviceAddress
+from ..device_type import EnOceanDeviceType
+from ..eep_decoder import EEPDecoder, get_eep_decoder
 from ..entity_properties import HomeAssistantEntityProperties
+from ..group_command import EnOceanGroupAction
+from ..telegram_template import EnOceanTelegramTemplate, get_telegram_template
 from .device import EnOceanDevice
 
 RORG_4BS = 0xA5
@@ -15,19 +22,68 @@ EDIMR_ABSOLUTE = 0
 EDIMR_RELATIVE = 1
 
 
+def _dimmer_on_template() -> EnOceanTelegramTemplate:
+    """Return the template of a (relative) dimming telegram switching the light on."""
+    return get_telegram_template(
+        RORG_4BS,
+        FUNC,
+        0x08,
+        CMD_DIMMING,  # command 2 (set dimmer)
+        variable=("EDIM", "RMP"),
+        fixed=(("COM", CMD_DIMMING), ("EDIMR", 1), ("STR", 0), ("SW", 1)),
+    )
+
+
+def _dimmer_off_template() -> EnOceanTelegramTemplate:
+    """Return the template of a dimming telegram switching the light off."""
+    return get_telegram_template(
+        RORG_4BS,
+        FUNC,
+        0x08,
+        CMD_DIMMING,  # command 2 (set dimmer)
+        variable=("RMP",),
+        fixed=(
+            ("COM", CMD_DIMMING),
+            ("EDIM", 0),
+            ("EDIMR", 0),
+            ("STR", 0),
+            ("SW", 0),
+        ),
+    )
+
+
 class EnOceanA53808Device(EnOceanDevice):
     """Handler for EnOcean Equipment Profile A5-38-08 (Gateway).
 
     Note that, as this is 4BS communication, there is no destination address in the telegrams. Therefore, the sender ID must be unique within a setup.
     """
 
-    def initialize_entities(self) -> None:
-        """Initialize the entities handled by this EEP handler."""
+    def __init__(
+        self,
+        enocean_id: EnOceanDeviceAddress,
+        device_type: EnOceanDeviceType,
+        create_task: HomeAssistantTaskCreator | None = None,
+        send_packet: EnOceanSendRadioPacket | None = None,
+        device_name: str | None = None,
+        sender_id: EnOceanAddress | None = None,
+    ) -> None:
+        """Construct the device with the default dimming parameters."""
         self.__min_brightness = 0
         self.__max_brightness = 100
         self.__brightness_range = 100
         self.__ramping_time = 1
 
+        super().__init__(
+            enocean_id=enocean_id,
+            device_type=device_type,
+            create_task=create_task,
+            send_packet=send_packet,
+            device_name=device_name,
+            sender_id=sender_id,
+        )
+
+    def initialize_entities(self) -> None:
+        """Initialize the entities handled by this EEP handler."""
         self._light_entities = [
             HomeAssistantEntityProperties(unique_id=None, device_class="light"),
         ]
@@ -78,6 +134,10 @@ class EnOceanA53808Device(EnOceanDevice):
             ),
         ]
 
+    def create_eep_decoder(self) -> EEPDecoder:
+        """Create the decoder for this device's dimming telegrams."""
+        return get_eep_decoder(RORG_4BS, FUNC, 0x08, command=CMD_DIMMING)
+
     def handle_matching_packet(self, packet) -> None:
         """Handle an incoming EnOcean packet."""
 
@@ -94,10 +154,10 @@ class EnOceanA53808Device(EnOceanDevice):
         sw = 0
 
         try:
-            packet.parse_eep(rorg_func=FUNC, rorg_type=0x08, command=CMD_DIMMING)
-            edim = packet.parsed["EDIM"]["raw_value"]
-            edimr = packet.parsed["EDIMR"]["raw_value"]
-            sw = packet.parsed["SW"]["raw_value"]
+            values = self.decode_packet(packet)
+            edim = values["EDIM"].raw_value
+            edimr = values["EDIMR"].raw_value
+            sw = values["SW"].raw_value
 
         except Exception:
             return
@@ -123,21 +183,10 @@ class EnOceanA53808Device(EnOceanDevice):
 
     def light_turn_off(self, entity_uid: EnOceanEntityUID) -> None:
         """Turn the light source off."""
-        packet = RadioPacket.create(
-            rorg=RORG_4BS,
-            rorg_func=FUNC,
-            rorg_type=0x08,
-            command=CMD_DIMMING,  # command 2 (set dimmer)
-            destination=self.enocean_id.to_bytelist(),
-            sender=self.sender_id.to_bytelist(),
-            COM=CMD_DIMMING,  # command 2 (set dimmer)
-            EDIM=0,
-            RMP=self.__ramping_time,
-            EDIMR=0,
-            STR=0,
-            SW=0,
+        packet = self._bind_telegram_template(_dimmer_off_template()).build(
+            RMP=self.__ramping_time
         )
-        self.send_packet(packet)
+        self.send_packet(packet, coalesce_key="light")
 
         light_callback = self._light_callbacks.get(None)
         if light_callback:
@@ -199,30 +248,35 @@ class EnOceanA53808Device(EnOceanDevice):
             brightness = 255
 
         # 1. set device brightness by sending the respective EnOcean telegram
-        packet = RadioPacket.create(
-            rorg=RORG_4BS,
-            rorg_func=FUNC,
-            rorg_type=0x08,
-            command=CMD_DIMMING,  # command 2 (set dimmer)
-            destination=self.enocean_id.to_bytelist(),
-            sender=self.sender_id.to_bytelist(),
-            COM=CMD_DIMMING,  # command 2 (set dimmer)
+        packet = self._bind_telegram_template(_dimmer_on_template()).build(
             EDIM=100
             * self.convert_absolute_home_assistant_brightness_to_relative_device_brightness(
                 brightness
             ),
             RMP=self.__ramping_time,
-            EDIMR=1,
-            STR=0,
-            SW=1,
         )
-        self.send_packet(packet)
+        self.send_packet(packet, coalesce_key="light")
 
         # 2. call the callback to update the state in Home Assistant (optimistic update)
         light_callback = self._light_callbacks.get(None)
         if light_callback:
             light_callback(brightness > 0, brightness, 0)
 
+    def send_group_command(
+        self,
+        entity_uid: EnOceanEntityUID,
+        action: EnOceanGroupAction,
+        value: int | None = None,
+    ) -> bool:
+        """Turn the light on (with the given brightness) or off."""
+        if action == EnOceanGroupAction.TURN_ON:
+            self.light_turn_on(entity_uid, brightness=value)
+        elif action == EnOceanGroupAction.TURN_OFF:
+            self.light_turn_off(entity_uid)
+        else:
+            return False
+        return True
+
     def set_number_value(self, entity_uid: EnOceanEntityUID, value: float) -> None:
         """Set the value of a number entity."""
 
@@ -2,10 +2,11 @@
 # https://www.enocean-alliance.org/wp-content/uploads/2017/10/NodOn-SIN-2-2-0x-UserGuide-170731-DE-interactive.pdf
 
 
-from enocean.protocol.packet import RadioPacket
-
 from homeassistant_enocean.devices.device import EnOceanDevice
+from homeassistant_enocean.eep_decoder import EEPDecoder, get_eep_decoder
 from homeassistant_enocean.entity_properties import HomeAssistantEntityProperties
+from homeassistant_enocean.group_command import EnOceanGroupAction
+from homeassistant_enocean.telegram_template import get_telegram_template
 from homeassistant_enocean.types import EnOceanEntityUID
 
 
@@ -46,14 +47,18 @@ class EnOceanD201XXDevice(EnOceanDevice):
                 HomeAssistantEntityProperties(unique_id=None),
             ]
 
+    def create_eep_decoder(self) -> EEPDecoder:
+        """Create the decoder for this device's telegrams."""
+        return get_eep_decoder(0xD2, 0x01, self.device_type.eep.type)
+
     def handle_matching_packet(self, packet) -> None:
         """Handle an incoming EnOcean packet."""
-        packet.parse_eep(0x01, self.device_type.eep.type)
-        if packet.parsed["CMD"]["raw_value"] != 4:
+        values = self.decode_packet(packet)
+        if values["CMD"].raw_value != 4:
             return
 
-        channel = packet.parsed["IO"]["raw_value"]
-        output = packet.parsed["OV"]["raw_value"]
+        channel = values["IO"].raw_value
+        output = values["OV"].raw_value
 
         # print(f"EnOcean D2-01-{self.device_type.eep.type:02X} switch channel {channel} output {output}")
 
@@ -83,34 +88,39 @@ class EnOceanD201XXDevice(EnOceanDevice):
 
     def switch_turn_on(self, entity_uid: EnOceanEntityUID) -> None:
         """Turn on the switch."""
-        channel = self._get_channel_from_entity_uid(entity_uid)
-
-        packet = RadioPacket.create(
-            rorg=self.device_type.eep.rorg,
-            rorg_func=self.device_type.eep.func,
-            rorg_type=self.device_type.eep.type,
-            command=0x01,  # actuator set output
-            destination=self.enocean_id.to_bytelist(),
-            sender=self.sender_id.to_bytelist(),
-            DV=0x00,  # switch to new output value
-            IO=channel,
-            OV=100,  # output value on (100%)
-        )
-        self.send_packet(packet)
+        self.__set_output(entity_uid, 100)  # output value on (100%)
 
     def switch_turn_off(self, entity_uid: EnOceanEntityUID) -> None:
         """Turn off the switch."""
-        channel = self._get_channel_from_entity_uid(entity_uid)
+        self.__set_output(entity_uid, 0)  # output value off (0%)
+
+    def send_group_command(
+        self,
+        entity_uid: EnOceanEntityUID,
+        action: EnOceanGroupAction,
+        value: int | None = None,
+    ) -> bool:
+        """Switch the channel on or off."""
+        if action == EnOceanGroupAction.TURN_ON:
+            self.switch_turn_on(entity_uid)
+        elif action == EnOceanGroupAction.TURN_OFF:
+            self.switch_turn_off(entity_uid)
+        else:
+            return False
+        return True
 
-        packet = RadioPacket.create(
-            rorg=self.device_type.eep.rorg,
-            rorg_func=self.device_type.eep.func,
-            rorg_type=self.device_type.eep.type,
-            command=0x01,  # actuator set output
-            destination=self.enocean_id.to_bytelist(),
-            sender=self.sender_id.to_bytelist(),
-            DV=0x00,  # switch to new output value
-            IO=channel,
-            OV=0,  # output value off (0%)
+    def __set_output(self, entity_uid: EnOceanEntityUID, output_value: int) -> None:
+        """Send an 'actuator set output' telegram for the entity's channel."""
+        channel = self._get_channel_from_entity_uid(entity_uid)
+        template = get_telegram_template(
+            self.device_type.eep.rorg,
+            self.device_type.eep.func,
+            self.device_type.eep.type,
+            0x01,  # actuator set output
+            variable=("IO", "OV"),
+            fixed=(("DV", 0x00),),  # switch to new output value
+        )
+        packet = self._bind_telegram_template(template).build(
+            IO=channel, OV=output_value
         )
-        self.send_packet(packet)
+        self.send_packet(packet, coalesce_key=channel)
@@ -1,17 +1,24 @@
 from enum import Enum
 
 from enocean.protocol.constants import RORG
-from enocean.protocol.packet import RadioPacket
 
-from homeassistant_enocean.types import EnOceanEntityUID
+from homeassistant_enocean.types import (
+    EnOceanEntityUID,
+    EnOceanSendRadioPacket,
+    HomeAssistantTaskCreator,
+)
 
-from ..address import EnOceanAddress
+from ..address import EnOceanAddress, EnOceanDeviceAddress
+from ..cover_watchdog import EnOceanCoverWatchdog
+from ..device_type import EnOceanDeviceType
 from ..entity_properties import HomeAssistantEntityProperties
+from ..group_command import EnOceanGroupAction
+from ..telegram_template import get_telegram_template
+from ..transmit_scheduler import EnOceanTransmitPriority
 from .device import EnOceanDevice
 
-WATCHDOG_TIMEOUT = 1
-WATCHDOG_INTERVAL = 0.2
-WATCHDOG_MAX_QUERIES = 10
+POSITION_UNKNOWN = 127
+"""Position reported by an actuator which does not know its position."""
 
 
 class EnOceanCoverCommand(Enum):
@@ -25,6 +32,42 @@ class EnOceanCoverCommand(Enum):
 class EnOceanD20500Device(EnOceanDevice):
     """Handler for EnOcean Equipment Profile D2-05-00"""
 
+    def __init__(
+        self,
+        enocean_id: EnOceanDeviceAddress,
+        device_type: EnOceanDeviceType,
+        create_task: HomeAssistantTaskCreator | None = None,
+        send_packet: EnOceanSendRadioPacket | None = None,
+        device_name: str | None = None,
+        sender_id: EnOceanAddress | None = None,
+    ) -> None:
+        """Construct the device without a watchdog."""
+        self.__cover_watchdog: EnOceanCoverWatchdog | None = None
+
+        super().__init__(
+            enocean_id=enocean_id,
+            device_type=device_type,
+            create_task=create_task,
+            send_packet=send_packet,
+            device_name=device_name,
+            sender_id=sender_id,
+        )
+
+    @property
+    def cover_watchdog(self) -> EnOceanCoverWatchdog | None:
+        """Return the watchdog querying the position while the cover is moving."""
+        return self.__cover_watchdog
+
+    @cover_watchdog.setter
+    def cover_watchdog(self, cover_watchdog: EnOceanCoverWatchdog | None) -> None:
+        """Set the watchdog querying the position while the cover is moving."""
+        self.__cover_watchdog = cover_watchdog
+        self.compile_dispatch()
+
+    def _handles_unsubscribed_packets(self) -> bool:
+        """Return whether the position is reported to a watchdog (even without callbacks)."""
+        return self.__cover_watchdog is not None
+
     def initialize_entities(self) -> None:
         """Initialize the entities handled by this EEP handler."""
         self._cover_entities = [
@@ -44,6 +87,9 @@ class EnOceanD20500Device(EnOceanDevice):
         # 100 means 'open' in Home Assistant and 'closed' in EnOcean
         new_position = 100 - packet.data[1]
 
+        if self.__cover_watchdog and packet.data[1] != POSITION_UNKNOWN:
+            self.__cover_watchdog.report(self, new_position)
+
         # print(f"Received EnOcean cover position: {new_position} for device {enocean_id.to_string()}")
         callback = self._cover_callbacks.get(None)
         if not callback:
@@ -52,66 +98,62 @@ class EnOceanD20500Device(EnOceanDevice):
         callback(new_position)
 
     def __send_cover_command(
-        self,
-        command: EnOceanCoverCommand,
-        destination: EnOceanAddress,
-        sender: EnOceanAddress,
-        position: int = 0,
+        self, command: EnOceanCoverCommand, position: int | None = None
     ) -> None:
         """Send an EnOcean telegram with the respective command."""
-
         if command == EnOceanCoverCommand.SET_POSITION:
-            packet = RadioPacket.create(
-                rorg=RORG.VLD,
-                rorg_func=0x05,
-                rorg_type=0x00,
-                destination=destination.to_bytelist(),
-                sender=sender.to_bytelist(),
-                command=command.value,
-                POS=position,
+            template = get_telegram_template(
+                RORG.VLD, 0x05, 0x00, command.value, variable=("POS",)
             )
-            # print(f"Sending EnOcean cover command {command.name} with position {position} ")
-            self.send_packet(packet)
+            packet = self._bind_telegram_template(template).build(POS=position)
         else:
-            packet = RadioPacket.create(
-                rorg=RORG.VLD,
-                rorg_func=0x05,
-                rorg_type=0x00,
-                destination=destination.to_bytelist(),
-                sender=sender.to_bytelist(),
-                command=command.value,
+            template = get_telegram_template(RORG.VLD, 0x05, 0x00, command.value)
+            packet = self._bind_telegram_template(template).build()
+
+        if command == EnOceanCoverCommand.QUERY_POSITION_AND_ANGLE:
+            self.send_packet(
+                packet, priority=EnOceanTransmitPriority.QUERY, coalesce_key="query"
             )
-            # print(f"Sending EnOcean cover command {command.name}")
-            self.send_packet(packet)
+        else:
+            # a stop supersedes a position which has not been sent yet
+            self.send_packet(packet, coalesce_key="motion")
 
     def set_cover_position(self, entity_uid: EnOceanEntityUID, position: int) -> None:
         """Set the position of a cover device (0 = closed, 100 = open)."""
         enocean_position = 100 - position  # invert position for EnOcean
         self.__send_cover_command(
-            command=EnOceanCoverCommand.SET_POSITION,
-            destination=self.enocean_id,
-            sender=self.sender_id,
-            position=enocean_position,
+            EnOceanCoverCommand.SET_POSITION, position=enocean_position
         )
+        if self.__cover_watchdog:
+            self.__cover_watchdog.watch(self, position)
 
     def query_cover_position(self, entity_uid: EnOceanEntityUID) -> None:
         """Query the position of a cover device."""
-        self.__send_cover_command(
-            command=EnOceanCoverCommand.QUERY_POSITION_AND_ANGLE,
-            destination=self.enocean_id,
-            sender=self.sender_id,
-        )
+        self.__send_cover_command(EnOceanCoverCommand.QUERY_POSITION_AND_ANGLE)
 
     def stop_cover(self, entity_uid: EnOceanEntityUID) -> None:
         """Stop the movement of a cover device."""
-        self.__send_cover_command(
-            command=EnOceanCoverCommand.STOP,
-            destination=self.enocean_id,
-            sender=self.sender_id,
-        )
+        self.__send_cover_command(EnOceanCoverCommand.STOP)
+        if self.__cover_watchdog:
+            self.__cover_watchdog.watch(self)
 
     def press_button(self, entity_uid: EnOceanEntityUID) -> None:
         """Simulate a button press."""
         if entity_uid == "query_state":
             print("Button press received to query cover state (position and angle).")
             self.query_cover_position(entity_uid)
+
+    def send_group_command(
+        self,
+        entity_uid: EnOceanEntityUID,
+        action: EnOceanGroupAction,
+        value: int | None = None,
+    ) -> bool:
+        """Move or stop the cover."""
+        if action == EnOceanGroupAction.SET_POSITION and value is not None:
+            self.set_cover_position(entity_uid, value)
+        elif action == EnOceanGroupAction.STOP:
+            self.stop_cover(entity_uid)
+        else:
+            return False
+        return True
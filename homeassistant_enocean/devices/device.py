@@ -2,13 +2,22 @@
 
 from abc import ABC, abstractmethod
 import datetime
-from typing import Any, Coroutine
+import logging
+import time
+from typing import TYPE_CHECKING, Any, Callable, Coroutine, Hashable, Sequence
 
-from enocean.protocol.packet import RadioPacket, UTETeachInPacket
+from enocean.protocol.constants import RORG
 
 from ..address import EnOceanAddress, EnOceanDeviceAddress
 from ..device_type import EnOceanDeviceType
+from ..diagnostics import EnOceanDeviceDiagnostics
+from ..eep_decoder import EEPDecoder, EEPValue
+from ..entity_field import EnOceanEntityField
+from ..entity_filter import EnOceanEntityFilter, EnOceanEntityFilterConfig
 from ..entity_properties import HomeAssistantEntityProperties
+from ..group_command import EnOceanGroupAction
+from ..telegram_template import EnOceanTelegramTemplate
+from ..transmit_scheduler import EnOceanTransmitPriority
 from ..types import (
     EnOceanBinarySensorCallback,
     EnOceanCoverCallback,
@@ -21,6 +30,11 @@ from ..types import (
     HomeAssistantTaskCreator,
 )
 
+if TYPE_CHECKING:
+    from enocean.protocol.packet import RadioPacket
+
+_LOGGER = logging.getLogger(__name__)
+
 
 class EnOceanDevice(ABC):
     """Representation of an EnOcean device."""
@@ -42,7 +56,12 @@ class EnOceanDevice(ABC):
         self.__sender_id = sender_id
 
         self.__send_packet = send_packet
-        self.__telegrams_received = 0
+        self.__bound_templates: (
+            dict[EnOceanTelegramTemplate, EnOceanTelegramTemplate] | None
+        ) = None
+        """Telegram templates bound to the device's address and sender ID (see '_bind_telegram_template')."""
+        self.__diagnostics = EnOceanDeviceDiagnostics()
+        self.__coalesce_diagnostics = False
 
         # callbacks
         self._binary_sensor_callbacks: dict[
@@ -54,13 +73,47 @@ class EnOceanDevice(ABC):
         self._sensor_callbacks: dict[EnOceanEntityUID, EnOceanSensorCallback] = {}
         self._switch_callbacks: dict[EnOceanEntityUID, EnOceanSwitchCallback] = {}
 
-        # entities
-        self._binary_sensor_entities: list[HomeAssistantEntityProperties] = []
-        self._button_entities: list[HomeAssistantEntityProperties] = []
-        self._cover_entities: list[HomeAssistantEntityProperties] = []
-        self._light_entities: list[HomeAssistantEntityProperties] = []
-        self._number_entities: list[HomeAssistantEntityProperties] = []
-        self.__internal_sensor_entities: list[HomeAssistantEntityProperties] = [
+        self.__entity_filter_configs: (
+            dict[tuple[str, EnOceanEntityUID], EnOceanEntityFilterConfig] | None
+        ) = None
+        self.__dispatch: _Dispatch | None = None
+        """Compiled callbacks (see 'compile_dispatch'), None if there are no subscribers."""
+
+        # entities (shared between all devices of the same type, see 'entity_template_key')
+        self._binary_sensor_entities: Sequence[HomeAssistantEntityProperties] = ()
+        self._button_entities: Sequence[HomeAssistantEntityProperties] = ()
+        self._cover_entities: Sequence[HomeAssistantEntityProperties] = ()
+        self._light_entities: Sequence[HomeAssistantEntityProperties] = ()
+        self._number_entities: Sequence[HomeAssistantEntityProperties] = ()
+        self._select_entities: Sequence[HomeAssistantEntityProperties] = ()
+        self._sensor_entities: Sequence[HomeAssistantEntityProperties] = ()
+        self._switch_entities: Sequence[HomeAssistantEntityProperties] = ()
+        if EnOceanDevice.__diagnostic_sensor_entities is None:
+            EnOceanDevice.reset_diagnostic_sensor_entities()
+        self.__internal_sensor_entities: tuple[HomeAssistantEntityProperties, ...] = (
+            EnOceanDevice.__diagnostic_sensor_entities
+        )
+        self.__all_sensor_entities: tuple[HomeAssistantEntityProperties, ...] | None = (
+            None
+        )
+        self.__load_entities()
+
+        # EEP decoding
+        self.__eep_decoder: EEPDecoder | None = self.create_eep_decoder()
+        self.__compiled_eep_decoding = True
+
+    __diagnostic_sensor_entities: tuple[HomeAssistantEntityProperties, ...] | None = (
+        None
+    )
+
+    @classmethod
+    def reset_diagnostic_sensor_entities(cls) -> None:
+        """Create the internal diagnostic sensor entities, shared by all devices created afterwards.
+
+        This sets the 'last_reset' of the 'telegrams_received' sensor to now; it is called
+        whenever a gateway is constructed.
+        """
+        EnOceanDevice.__diagnostic_sensor_entities = (
             HomeAssistantEntityProperties(
                 unique_id="rssi",
                 native_unit_of_measurement="dBm",
@@ -78,15 +131,52 @@ class EnOceanDevice(ABC):
                 device_class="timestamp",
                 entity_category="diagnostic",
             ),
-        ]
-        self._select_entities: list[HomeAssistantEntityProperties] = []
-        self._sensor_entities: list[HomeAssistantEntityProperties] = []
-        self._switch_entities: list[HomeAssistantEntityProperties] = []
-        self.initialize_entities()
+        )
+
+    def entity_template_key(self) -> Hashable | None:
+        """Return the key under which this device's entities are shared with other devices.
+
+        'initialize_entities' is only called for the first device with a given key; all
+        further devices reuse its entities. Devices whose entities depend on more than the
+        handler class, EEP and manufacturer must extend the key or return None (not shared).
+        """
+        eep = self.__device_type.eep
+        return (
+            type(self),
+            eep.rorg,
+            eep.func,
+            eep.type,
+            eep.manufacturer_id,
+            self.__device_type.manufacturer,
+        )
+
+    def __load_entities(self) -> None:
+        """Set the entities from the shared template, creating it on first use."""
+        key = self.entity_template_key()
+        template = _entity_templates.get(key) if key is not None else None
+        if template is None:
+            self.initialize_entities()
+            template = _EntityTemplate(self)
+            if key is not None:
+                _entity_templates[key] = template
+
+        self._binary_sensor_entities = template.binary_sensor_entities
+        self._button_entities = template.button_entities
+        self._cover_entities = template.cover_entities
+        self._light_entities = template.light_entities
+        self._number_entities = template.number_entities
+        self._select_entities = template.select_entities
+        self._sensor_entities = template.sensor_entities
+        self._switch_entities = template.switch_entities
+        if self.__internal_sensor_entities:
+            self.__all_sensor_entities = template.with_internal_sensor_entities(
+                self.__internal_sensor_entities
+            )
 
     def clear_internal_sensor_entities(self) -> None:
         """Clear internal sensor entities (used for the gateway device)."""
-        self.__internal_sensor_entities.clear()
+        self.__internal_sensor_entities = ()
+        self.__all_sensor_entities = None
 
     @property
     def enocean_id(self) -> EnOceanDeviceAddress:
@@ -107,94 +197,349 @@ class EnOceanDevice(ABC):
     def sender_id(self, value: EnOceanAddress | None) -> None:
         """Set the sender ID."""
         self.__sender_id = value
+        self.__bound_templates = None
+
+    @property
+    def compiled_eep_decoding(self) -> bool:
+        """Return whether telegrams are decoded with the precompiled EEP decoder (instead of the enocean library's 'parse_eep')."""
+        return self.__compiled_eep_decoding
+
+    @compiled_eep_decoding.setter
+    def compiled_eep_decoding(self, value: bool) -> None:
+        """Set whether telegrams are decoded with the precompiled EEP decoder."""
+        self.__compiled_eep_decoding = value
 
     @property
-    def binary_sensor_entities(self) -> list[HomeAssistantEntityProperties]:
+    def binary_sensor_entities(self) -> Sequence[HomeAssistantEntityProperties]:
         """Return the binary sensor entities."""
         return self._binary_sensor_entities
 
     @property
-    def button_entities(self) -> list[HomeAssistantEntityProperties]:
+    def button_entities(self) -> Sequence[HomeAssistantEntityProperties]:
         """Return the button entities."""
         return self._button_entities
 
     @property
-    def cover_entities(self) -> list[HomeAssistantEntityProperties]:
+    def cover_entities(self) -> Sequence[HomeAssistantEntityProperties]:
         """Return the cover entities."""
         return self._cover_entities
 
     @property
-    def event_entities(self) -> list[HomeAssistantEntityProperties]:
+    def event_entities(self) -> Sequence[HomeAssistantEntityProperties]:
         """Return the event entities."""
-        return []
+        return ()
 
     @property
-    def light_entities(self) -> list[HomeAssistantEntityProperties]:
+    def light_entities(self) -> Sequence[HomeAssistantEntityProperties]:
         """Return the light entities."""
         return self._light_entities
 
     @property
-    def number_entities(self) -> list[HomeAssistantEntityProperties]:
+    def number_entities(self) -> Sequence[HomeAssistantEntityProperties]:
         """Return the number entities."""
         return self._number_entities
 
     @property
-    def select_entities(self) -> list[HomeAssistantEntityProperties]:
+    def select_entities(self) -> Sequence[HomeAssistantEntityProperties]:
         """Return the select entities."""
         return self._select_entities
 
     @property
-    def sensor_entities(self) -> list[HomeAssistantEntityProperties]:
-        """Return the sensor entities."""
-        return self._sensor_entities + self.__internal_sensor_entities
+    def sensor_entities(self) -> Sequence[HomeAssistantEntityProperties]:
+        """Return the sensor entities (incl. the internal diagnostic sensors)."""
+        if self.__all_sensor_entities is None:
+            self.__all_sensor_entities = tuple(self._sensor_entities) + tuple(
+                self.__internal_sensor_entities
+            )
+        return self.__all_sensor_entities
 
     @property
-    def switch_entities(self) -> list[HomeAssistantEntityProperties]:
+    def switch_entities(self) -> Sequence[HomeAssistantEntityProperties]:
         """Return the switch entities."""
         return self._switch_entities
 
+    def entity_fields(
+        self,
+    ) -> dict[tuple[str, EnOceanEntityUID], EnOceanEntityField]:
+        """Return how the entities' states are decoded, keyed by (platform, unique id).
+
+        Devices returning fields are handled by their compiled dispatch vector; devices
+        returning an empty dictionary (the default) by 'handle_matching_packet'.
+        """
+        return {}
+
+    def _handles_unsubscribed_packets(self) -> bool:
+        """Return whether 'handle_matching_packet' is called even without registered callbacks.
+
+        Devices which track their state internally (e.g. a watched cover) override this and
+        call 'compile_dispatch' whenever the result changes.
+        """
+        return False
+
+    def register_callback(
+        self, platform: str, entity_uid: EnOceanEntityUID, callback: Callable
+    ) -> None:
+        """Register the callback of an entity and recompile the dispatch vector.
+
+        If a filter is configured for the entity (see 'set_entity_filter'), the callback is
+        wrapped by it.
+        """
+        if self.__entity_filter_configs and (
+            config := self.__entity_filter_configs.get((platform, entity_uid))
+        ):
+            callback = EnOceanEntityFilter(callback, config)
+        getattr(self, _CALLBACK_ATTRIBUTES[platform])[entity_uid] = callback
+        self.compile_dispatch()
+
+    def set_entity_filter(
+        self,
+        platform: str,
+        entity_uid: EnOceanEntityUID,
+        config: EnOceanEntityFilterConfig | None,
+    ) -> None:
+        """Filter the updates of an entity before they are passed to its callback (None to remove the filter).
+
+        This applies to callbacks registered before and after; the counters of a previous
+        filter of the entity are reset.
+        """
+        key = (platform, entity_uid)
+        if config is not None:
+            if self.__entity_filter_configs is None:
+                self.__entity_filter_configs = {}
+            self.__entity_filter_configs[key] = config
+        elif self.__entity_filter_configs:
+            self.__entity_filter_configs.pop(key, None)
+
+        callbacks = getattr(self, _CALLBACK_ATTRIBUTES[platform])
+        if (callback := callbacks.get(entity_uid)) is not None:
+            if isinstance(callback, EnOceanEntityFilter):
+                callback = callback.callback
+            self.register_callback(platform, entity_uid, callback)
+
+    def entity_filters(self) -> dict[tuple[str, EnOceanEntityUID], EnOceanEntityFilter]:
+        """Return the filters of the entities with a registered callback, keyed by (platform, unique id)."""
+        return {
+            (platform, entity_uid): callback
+            for platform, attribute in _CALLBACK_ATTRIBUTES.items()
+            for entity_uid, callback in getattr(self, attribute).items()
+            if isinstance(callback, EnOceanEntityFilter)
+        }
+
+    def compile_dispatch(self) -> None:
+        """Compile the registered callbacks into the dispatch vector used by 'handle_packet'.
+
+        Only entities with a callback are included, and only their EEP fields are decoded.
+        This needs to be called again if the callback dictionaries are changed directly.
+        """
+        callbacks = {
+            platform: getattr(self, attribute)
+            for platform, attribute in _CALLBACK_ATTRIBUTES.items()
+        }
+        if not any(callbacks.values()) and not self._handles_unsubscribed_packets():
+            self.__dispatch = None
+            return
+
+        field_decoder = None
+        field_dispatch = None
+        entity_fields = self.entity_fields()
+        if entity_fields and self.__eep_decoder is not None:
+            dispatch = []
+            shortcuts: set[str] = set()
+            for (platform, entity_uid), field in entity_fields.items():
+                if callback := callbacks[platform].get(entity_uid):
+                    dispatch.append((field.decode, callback))
+                    shortcuts.update(field.shortcuts)
+            field_decoder = self.__eep_decoder.select(shortcuts)
+            field_dispatch = tuple(dispatch)
+
+        if self.__coalesce_diagnostics:
+            diagnostic_callbacks = (None, None, None)
+        else:
+            diagnostic_callbacks = self.__diagnostic_callbacks()
+        self.__dispatch = (*diagnostic_callbacks, field_decoder, field_dispatch)
+
+    def __diagnostic_callbacks(
+        self,
+    ) -> tuple[
+        EnOceanSensorCallback | None,
+        EnOceanSensorCallback | None,
+        EnOceanSensorCallback | None,
+    ]:
+        """Return the rssi, telegrams received and last seen callbacks."""
+        return (
+            self._sensor_callbacks.get("rssi"),
+            self._sensor_callbacks.get("telegrams_received"),
+            self._sensor_callbacks.get("last_seen"),
+        )
+
+    @property
+    def diagnostics(self) -> EnOceanDeviceDiagnostics:
+        """Return the diagnostic values of this device."""
+        return self.__diagnostics
+
+    @property
+    def coalesce_diagnostics(self) -> bool:
+        """Return whether the diagnostic sensors are only updated by 'flush_diagnostics'."""
+        return self.__coalesce_diagnostics
+
+    @coalesce_diagnostics.setter
+    def coalesce_diagnostics(self, value: bool) -> None:
+        """Set whether the diagnostic sensors are only updated by 'flush_diagnostics'."""
+        if value != self.__coalesce_diagnostics:
+            self.__coalesce_diagnostics = value
+            self.compile_dispatch()
+
+    def update_best_rssi(self, rssi: int) -> None:
+        """Report the RSSI of a copy of the last telegram (received via a repeater), if it is better."""
+        diagnostics = self.__diagnostics
+        if diagnostics.rssi is not None and rssi <= diagnostics.rssi:
+            return
+        diagnostics.rssi = rssi
+        if (
+            not self.__coalesce_diagnostics
+            and self.__dispatch is not None
+            and (rssi_callback := self.__dispatch[0])
+        ):
+            rssi_callback(rssi)
+
+    def flush_diagnostics(self) -> bool:
+        """Update the diagnostic sensors if telegrams were received since their last update.
+
+        Returns True if the sensors were updated.
+        """
+        diagnostics = self.__diagnostics
+        if not diagnostics.pending:
+            return False
+        diagnostics.reported_telegrams = diagnostics.telegrams_received
+
+        rssi_callback, telegrams_received_callback, last_seen_callback = (
+            self.__diagnostic_callbacks()
+        )
+        if rssi_callback:
+            rssi_callback(diagnostics.rssi)
+        if telegrams_received_callback:
+            telegrams_received_callback(diagnostics.telegrams_received)
+        if last_seen_callback:
+            last_seen_callback(diagnostics.last_seen_datetime)
+        return True
+
     def create_task(self, target: Coroutine[Any, Any, Any]) -> None:
         """Create a Home Assistant task."""
         self.__ha_create_task(target=target)
 
-    def handle_packet(self, packet: RadioPacket) -> None:
-        """Handle an incoming EnOcean packet; this will ignore UTE packets."""
-        # print(f"EEPHandler.handle_packet: Checking packet from sender {EnOceanAddress.from_number(packet.sender_int)} against device ID {enocean_id.to_string()}")
+    def handle_packet(self, packet: "RadioPacket") -> None:
+        """Handle an incoming EnOcean packet sent by this device; this will ignore UTE packets.
+
+        The gateway dispatches packets by sender address, so the sender is not checked again here.
+        Apart from updating the diagnostics, devices without any registered callback are skipped
+        (unless they handle unsubscribed packets, see '_handles_unsubscribed_packets').
+        """
+        if packet.rorg == RORG.UTE:
+            return
 
-        if isinstance(packet, UTETeachInPacket):
+        diagnostics = self.__diagnostics
+        diagnostics.telegrams_received += 1
+        diagnostics.rssi = packet.dBm
+        diagnostics.last_seen = time.time()
+        if self.__dispatch is None:
             return
+        (
+            rssi_callback,
+            telegrams_received_callback,
+            last_seen_callback,
+            field_decoder,
+            field_dispatch,
+        ) = self.__dispatch
 
-        if packet.sender_int == self.enocean_id.to_number():
-            rssi_callback = self._sensor_callbacks.get("rssi")
-            if rssi_callback:
-                rssi_callback(packet.dBm)
+        if rssi_callback:
+            rssi_callback(diagnostics.rssi)
 
-            self.__telegrams_received += 1
-            telegram_seen_callback = self._sensor_callbacks.get("telegrams_received")
-            if telegram_seen_callback:
-                telegram_seen_callback(self.__telegrams_received)
+        if telegrams_received_callback:
+            telegrams_received_callback(diagnostics.telegrams_received)
 
-            last_seen_callback = self._sensor_callbacks.get("last_seen")
-            if last_seen_callback:
-                last_seen_callback(datetime.datetime.now().astimezone())
+        if last_seen_callback:
+            last_seen_callback(diagnostics.last_seen_datetime)
 
+        if not self.__coalesce_diagnostics:
+            diagnostics.reported_telegrams = diagnostics.telegrams_received
+
+        if field_dispatch is None:
             self.handle_matching_packet(packet)
+            return
+
+        if not field_dispatch:
+            return
+        try:
+            if self.__compiled_eep_decoding:
+                values = field_decoder.decode(packet)
+            else:
+                values = self.__eep_decoder.parse(packet)
+        except Exception:
+            _LOGGER.exception(
+                f"Cannot decode telegram of EnOcean device {self.__enocean_id.to_string()}"
+            )
+            return
 
-    def send_packet(self, packet: RadioPacket) -> None:
-        """Send an EnOcean packet."""
+        # a failing entity must not keep the others from being updated
+        for decode, callback in field_dispatch:
+            try:
+                value = decode(values)
+                if value is not None:
+                    callback(value)
+            except Exception:
+                _LOGGER.exception("Error in EnOcean entity callback")
+
+    def _bind_telegram_template(
+        self, template: EnOceanTelegramTemplate
+    ) -> EnOceanTelegramTemplate:
+        """Return the template bound to this device as destination and its sender ID.
+
+        Bound templates are kept until the sender ID changes.
+        """
+        if self.__bound_templates is None:
+            self.__bound_templates = {}
+        bound = self.__bound_templates.get(template)
+        if bound is None:
+            bound = self.__bound_templates[template] = template.bind(
+                self.__enocean_id.to_bytelist(), self.__sender_id.to_bytelist()
+            )
+        return bound
+
+    def send_packet(
+        self,
+        packet: "RadioPacket",
+        priority: EnOceanTransmitPriority = EnOceanTransmitPriority.COMMAND,
+        coalesce_key: Hashable | None = None,
+    ) -> None:
+        """Send an EnOcean packet.
+
+        If the gateway uses a transmit scheduler, a still queued packet of this device with
+        the same coalesce key is replaced by this one.
+        """
         if self.__send_packet:
-            self.__send_packet(packet)
+            if coalesce_key is not None:
+                coalesce_key = (self.__enocean_id, coalesce_key)
+            self.__send_packet(packet, priority=priority, coalesce_key=coalesce_key)
 
     @abstractmethod
     def initialize_entities(self) -> None:
         """Initialize the entities handled by this EEP handler."""
         pass
 
-    @abstractmethod
-    def handle_matching_packet(self, packet: RadioPacket) -> None:
-        """Handle an incoming EnOcean packet."""
+    def handle_matching_packet(self, packet: "RadioPacket") -> None:
+        """Handle an incoming EnOcean packet (only called for devices without entity fields)."""
         pass
 
+    def create_eep_decoder(self) -> EEPDecoder | None:
+        """Create the decoder for this device's telegrams (if any), called once at device creation."""
+        return None
+
+    def decode_packet(self, packet: "RadioPacket") -> dict[str, EEPValue]:
+        """Decode a packet with this device's EEP decoder."""
+        if self.__compiled_eep_decoding:
+            return self.__eep_decoder.decode(packet)
+        return self.__eep_decoder.parse(packet)
+
     # button-specific methods
     def press_button(self, entity_uid: EnOceanEntityUID) -> None:
         """Simulate a button press."""
@@ -245,3 +590,79 @@ class EnOceanDevice(ABC):
     def switch_turn_off(self, entity_uid: EnOceanEntityUID) -> None:
         """Turn off a switch device."""
         pass
+
+    # group commands
+    def send_group_command(
+        self,
+        entity_uid: EnOceanEntityUID,
+        action: EnOceanGroupAction,
+        value: int | None = None,
+    ) -> bool:
+        """Send a group command to an entity, built from pre-encoded telegram templates.
+
+        Return False if the device does not support the action.
+        """
+        return False
+
+
+_CALLBACK_ATTRIBUTES: dict[str, str] = {
+    "binary_sensor": "_binary_sensor_callbacks",
+    "cover": "_cover_callbacks",
+    "event": "_event_callbacks",
+    "light": "_light_callbacks",
+    "sensor": "_sensor_callbacks",
+    "switch": "_switch_callbacks",
+}
+"""Attribute of the callback dictionary of each platform."""
+
+type _Dispatch = tuple[
+    EnOceanSensorCallback | None,
+    EnOceanSensorCallback | None,
+    EnOceanSensorCallback | None,
+    EEPDecoder | None,
+    tuple[tuple[Callable[[dict[str, EEPValue]], Any], Callable], ...] | None,
+]
+"""Compiled callbacks of a device: the rssi, telegrams received and last seen callbacks,
+followed by the decoder and (field decoder, callback) pairs of the subscribed entity fields
+(None for devices handled by 'handle_matching_packet')."""
+
+
+class _EntityTemplate:
+    """Entities of a device, shared by all devices with the same template key."""
+
+    __slots__ = (
+        "binary_sensor_entities",
+        "button_entities",
+        "cover_entities",
+        "light_entities",
+        "number_entities",
+        "select_entities",
+        "sensor_entities",
+        "switch_entities",
+        "__combined_sensor_entities",
+    )
+
+    def __init__(self, device: EnOceanDevice) -> None:
+        """Freeze the entities set by the device's 'initialize_entities'."""
+        self.binary_sensor_entities = tuple(device._binary_sensor_entities)
+        self.button_entities = tuple(device._button_entities)
+        self.cover_entities = tuple(device._cover_entities)
+        self.light_entities = tuple(device._light_entities)
+        self.number_entities = tuple(device._number_entities)
+        self.select_entities = tuple(device._select_entities)
+        self.sensor_entities = tuple(device._sensor_entities)
+        self.switch_entities = tuple(device._switch_entities)
+        self.__combined_sensor_entities: tuple[tuple, tuple] = ((), ())
+
+    def with_internal_sensor_entities(
+        self, internal_sensor_entities: tuple[HomeAssistantEntityProperties, ...]
+    ) -> tuple[HomeAssistantEntityProperties, ...]:
+        """Return the sensor entities followed by the given internal ones (built once per set of internal entities)."""
+        internal, combined = self.__combined_sensor_entities
+        if internal is not internal_sensor_entities:
+            combined = self.sensor_entities + internal_sensor_entities
+            self.__combined_sensor_entities = (internal_sensor_entities, combined)
+        return combined
+
+
+_entity_templates: dict[Hashable, _EntityTemplate] = {}
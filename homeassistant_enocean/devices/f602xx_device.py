@@ -1,9 +1,12 @@
-from enocean.protocol.packet import RadioPacket
+from typing import TYPE_CHECKING
 
 from homeassistant_enocean.devices.device import EnOceanDevice
 from homeassistant_enocean.entity_properties import HomeAssistantEntityProperties
 from homeassistant_enocean.types import EnOceanBinarySensorCallback
 
+if TYPE_CHECKING:
+    from enocean.protocol.packet import RadioPacket
+
 BUTTON_ACTION_UID_MAP = {
     0x30: "a0",
     0x10: "a1",
@@ -29,7 +32,7 @@ class EnOceanF602XXDevice(EnOceanDevice):
             for name in BUTTON_ACTION_UID_MAP.values()
         ]
 
-    def handle_matching_packet(self, packet: RadioPacket) -> None:
+    def handle_matching_packet(self, packet: "RadioPacket") -> None:
         """Handle an incoming EnOcean packet."""
         action = packet.data[1]
 
@@ -1,9 +1,21 @@
-from enocean.protocol.packet import RadioPacket
-
+from ..eep_decoder import EEPDecoder, get_eep_decoder
+from ..entity_field import EnOceanEntityField
 from ..entity_properties import HomeAssistantEntityProperties
-from ..types import EnOceanSensorCallback
+from ..types import EnOceanEntityUID
 from .device import EnOceanDevice
 
+_WINDOW_HANDLE_ACTIONS = {
+    0x00: "up2vertical",
+    0x01: "vertical2up",
+    0x02: "down2vertical",
+    0x03: "vertical2down",
+}
+"""Mapping of the raw WIN field to the window handle action."""
+
+_WINDOW_HANDLE_ACTION = EnOceanEntityField(
+    ("WIN",), lambda values: _WINDOW_HANDLE_ACTIONS.get(values["WIN"].raw_value)
+)
+
 
 class EnOceanF61000Device(EnOceanDevice):
     """Handler for EnOcean Equipment Profiles F6-10-00 (Window Handle)"""
@@ -23,32 +35,10 @@ class EnOceanF61000Device(EnOceanDevice):
             ),
         ]
 
-    def handle_matching_packet(self, packet: RadioPacket) -> None:
-        """Handle an incoming EnOcean packet."""
-        action = None
-
-        try:
-            packet.parse_eep(rorg_func=0x10, rorg_type=0x00)
-            win = packet.parsed["WIN"]["value"]
-
-            match win:
-                case 0x00:
-                    action = "up2vertical"
-                case 0x01:
-                    action = "vertical2up"
-                case 0x02:
-                    action = "down2vertical"
-                case 0x03:
-                    action = "vertical2down"
-
-        except Exception:
-            return
-
-        if action is None:
-            return
-
-        callback: EnOceanSensorCallback | None = None
-        callback = self._sensor_callbacks.get(None)
+    def create_eep_decoder(self) -> EEPDecoder:
+        """Create the decoder for this device's telegrams."""
+        return get_eep_decoder(0xF6, 0x10, 0x00)
 
-        if callback:
-            callback(action)
+    def entity_fields(self) -> dict[tuple[str, EnOceanEntityUID], EnOceanEntityField]:
+        """Return how the entities' states are decoded."""
+        return {("sensor", None): _WINDOW_HANDLE_ACTION}
@@ -1,15 +1,19 @@
 import asyncio
-from typing import Callable
+from typing import TYPE_CHECKING, Callable
 
-from enocean.protocol.packet import RadioPacket, UTETeachInPacket
+from enocean.protocol.constants import PACKET, RORG
 
 from ..address import EnOceanAddress
 from ..device_type import EnOceanDeviceType
 from ..devices.device import EnOceanDevice
 from ..eep import EEP
 from ..entity_properties import HomeAssistantEntityProperties
+from ..sender_ids import EnOceanSenderIDs
 from ..types import EnOceanEntityUID, HomeAssistantTaskCreator, ValueLabelDict
 
+if TYPE_CHECKING:
+    from enocean.protocol.packet import RadioPacket
+
 
 class EnOceanGatewayDevice(EnOceanDevice):
     LEARNING_TIMEOUT: int = 60
@@ -19,7 +23,7 @@ class EnOceanGatewayDevice(EnOceanDevice):
     def __init__(
         self,
         enocean_id,
-        valid_sender_ids: list[ValueLabelDict] | None = None,
+        valid_sender_ids: EnOceanSenderIDs | None = None,
         base_id: ValueLabelDict | None = None,
         create_task: HomeAssistantTaskCreator | None = None,
     ) -> None:
@@ -42,6 +46,10 @@ class EnOceanGatewayDevice(EnOceanDevice):
             create_task=create_task,
         )
 
+    def entity_template_key(self) -> None:
+        """The gateway device's entities depend on its sender ids, so they are not shared."""
+        return None
+
     def initialize_entities(self) -> None:
         """Initialize the entities handled by this EEP handler."""
         self.clear_internal_sensor_entities()
@@ -53,7 +61,7 @@ class EnOceanGatewayDevice(EnOceanDevice):
 
         valid_sender_ids = []
         if self._valid_sender_ids:
-            valid_sender_ids = [option["label"] for option in self._valid_sender_ids]
+            valid_sender_ids = list(self._valid_sender_ids.labels)
 
         self.__learning_id = (
             EnOceanAddress(self.__base_id["value"]) if self.__base_id else None
@@ -91,14 +99,14 @@ class EnOceanGatewayDevice(EnOceanDevice):
         return
 
     def teach(
-        self, packet: RadioPacket, send: Callable[[RadioPacket], None]
+        self, packet: "RadioPacket", send: Callable[["RadioPacket"], None]
     ) -> EnOceanAddress | None:
         """Inspect an incoming EnOcean packet without processing it."""
         # Gateway device handles learning
         # in learning mode, only respond to UTE Teach-In packets and ignore all other packets
         if self.__learning_mode_active and self.__learning_id:
             # UTE teach-in
-            if isinstance(packet, UTETeachInPacket):
+            if packet.rorg == RORG.UTE:
                 device_address = EnOceanAddress(packet.sender_hex)
                 device_eep = EEP(
                     rorg=packet.rorg_of_eep,
@@ -118,7 +126,7 @@ class EnOceanGatewayDevice(EnOceanDevice):
                 self.stop_learning()
                 return device_address
 
-            if not isinstance(packet, RadioPacket):
+            if packet.packet_type != PACKET.RADIO_ERP1:
                 return
 
             # 4BS teach in
@@ -152,13 +160,11 @@ class EnOceanGatewayDevice(EnOceanDevice):
         """Handle select option actions."""
         if entity_uid == "sender_id":
             if self._valid_sender_ids:
-                for option_dict in self._valid_sender_ids:
-                    if option_dict["label"] == option:
-                        self.__learning_id = EnOceanAddress(option_dict["value"])
-                        print(
-                            f"Gateway learning ID set to {self.__learning_id.to_string()}."
-                        )
-                        break
+                if learning_id := self._valid_sender_ids.address_of(option):
+                    self.__learning_id = learning_id
+                    print(
+                        f"Gateway learning ID set to {self.__learning_id.to_string()}."
+                    )
 
     def stop_learning(self) -> None:
         """Stop learning mode."""
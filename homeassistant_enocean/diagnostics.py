@@ -0,0 +1,40 @@
+"""Diagnostic counters of an EnOcean device."""
+
+import datetime
+
+
+class EnOceanDeviceDiagnostics:
+    """The diagnostic values of a device, updated on every received telegram.
+
+    These back the 'rssi', 'telegrams_received' and 'last_seen' sensors. If diagnostics
+    are coalesced (see 'EnOceanHomeAssistantGateway.diagnostics_interval'), the sensors
+    are only updated when the diagnostics are flushed instead of on every telegram.
+    """
+
+    __slots__ = ("telegrams_received", "rssi", "last_seen", "reported_telegrams")
+
+    def __init__(self) -> None:
+        """Construct the diagnostics of a device which has not been seen yet."""
+        self.telegrams_received: int = 0
+        """Number of telegrams received since the gateway was started."""
+
+        self.rssi: int | None = None
+        """Signal strength of the last received telegram (in dBm)."""
+
+        self.last_seen: float | None = None
+        """Time of the last received telegram (seconds since the epoch)."""
+
+        self.reported_telegrams: int = 0
+        """Value of 'telegrams_received' when the diagnostic sensors were last updated."""
+
+    @property
+    def pending(self) -> bool:
+        """Return True if telegrams were received since the sensors were last updated."""
+        return self.telegrams_received != self.reported_telegrams
+
+    @property
+    def last_seen_datetime(self) -> datetime.datetime | None:
+        """Return the time of the last received telegram as (local) datetime."""
+        if self.last_seen is None:
+            return None
+        return datetime.datetime.fromtimestamp(self.last_seen).astimezone()
@@ -1,14 +1,31 @@
 class EEP:
-    """Representation of an EnOcean Equipment Profile (EEP)."""
+    """Representation of an EnOcean Equipment Profile (EEP).
 
-    def __init__(
-        self, rorg: int, func: int, type_: int, manufacturer_id: int | None = None
-    ) -> None:
-        """Construct an EnOcean Equipment Profile."""
-        self.rorg = rorg
-        self.func = func
-        self.type = type_
-        self.manufacturer_id = manufacturer_id  # see https://www.enocean.com/wp-content/uploads/application-notes/new_AN514_EnOcean_Link_Profiles.pdf
+    EEPs are immutable and interned, i.e. constructing an EEP returns the instance shared by
+    all EEPs with the same RORG, FUNC, TYPE and manufacturer id. The manufacturer id is not
+    considered for equality and hashing.
+    """
+
+    __slots__ = ("rorg", "func", "type", "manufacturer_id", "__key")
+
+    __instances: dict[tuple[int, int, int, int | None], "EEP"] = {}
+
+    def __new__(
+        cls, rorg: int, func: int, type_: int, manufacturer_id: int | None = None
+    ) -> "EEP":
+        """Return the EnOcean Equipment Profile."""
+        eep = EEP.__instances.get((rorg, func, type_, manufacturer_id))
+        if eep is None:
+            eep = object.__new__(cls)
+            set_attribute = object.__setattr__
+            set_attribute(eep, "rorg", rorg)
+            set_attribute(eep, "func", func)
+            set_attribute(eep, "type", type_)
+            # see https://www.enocean.com/wp-content/uploads/application-notes/new_AN514_EnOcean_Link_Profiles.pdf
+            set_attribute(eep, "manufacturer_id", manufacturer_id)
+            set_attribute(eep, "_EEP__key", (rorg << 16) | (func << 8) | type_)
+            EEP.__instances[(rorg, func, type_, manufacturer_id)] = eep
+        return eep
 
     @classmethod
     def supported_eeps(cls) -> list["EEP"]:
@@ -28,10 +45,29 @@ class EEP:
         return cls(rorg, func, type_)
 
     def __hash__(self):
-        return hash((self.rorg, self.func, self.type))
+        return self.__key
 
     def __eq__(self, other):
-        return (self.rorg, self.func, self.type) == (other.rorg, other.func, other.type)
+        if self is other:
+            return True
+        if not isinstance(other, EEP):
+            return NotImplemented
+        return self.__key == other.__key
+
+    def __setattr__(self, name: str, value) -> None:
+        raise AttributeError("EEP is immutable.")
+
+    def __delattr__(self, name: str) -> None:
+        raise AttributeError("EEP is immutable.")
+
+    def __reduce__(self):
+        return (EEP, (self.rorg, self.func, self.type, self.manufacturer_id))
+
+    def __copy__(self) -> "EEP":
+        return self
+
+    def __deepcopy__(self, memo) -> "EEP":
+        return self
 
     def to_string(self) -> str:
         """Return the EEP as a dash-separated string."""
@@ -0,0 +1,197 @@
+"""Precompiled decoders for EnOcean Equipment Profiles (EEP).
+
+The enocean library's 'Packet.parse_eep' navigates the XML profile description and converts
+the telegram into a list of booleans on every call. The decoders in this module are compiled
+once per profile into a flat tuple of fields (bit offset, width and scaling), so that decoding
+a telegram only requires integer bit operations on 'packet.data'. The results are identical
+to those of 'parse_eep' (see scripts/verify_eep_decoders.py).
+
+Decoders are compiled on first use, from the precompiled profiles (see eep_profiles.py) or,
+for other profiles, from the enocean library's profile description.
+"""
+
+import copy
+from typing import TYPE_CHECKING, Any, Iterable, NamedTuple
+
+from .eep_profiles import FIELD_STATUS, FIELD_VALUE, compile_field, get_eep_profiles
+
+if TYPE_CHECKING:
+    from enocean.protocol.packet import Packet
+
+
+class EEPValue(NamedTuple):
+    """A decoded EEP field."""
+
+    raw_value: int
+    """The raw (integer) value of the field."""
+
+    value: Any
+    """The interpreted value: a scaled float for values, a description for enums and a bool for status fields."""
+
+
+class EEPDecoder:
+    """Decoder for one EEP profile (RORG, FUNC, TYPE and optionally direction and command)."""
+
+    def __init__(
+        self,
+        rorg: int,
+        func: int,
+        type_: int,
+        direction: int | None = None,
+        command: int | None = None,
+    ) -> None:
+        """Construct the decoder; it is compiled on first use."""
+        self.__rorg = rorg
+        self.__func = func
+        self.__type = type_
+        self.__direction = direction
+        self.__command = command
+        self.__shortcuts: frozenset[str] | None = None
+        """The fields decoded (None for all), see 'select'."""
+        self.__fields: tuple[tuple, ...] | None = None
+
+    @property
+    def rorg(self) -> int:
+        """Return the RORG of the decoded profile."""
+        return self.__rorg
+
+    @property
+    def fields(self) -> tuple[tuple, ...]:
+        """Return the compiled fields as (kind, shortcut, offset, size, parameters) tuples."""
+        if self.__fields is None:
+            if self.__shortcuts is None:
+                self.__fields = self.__compile()
+            else:
+                self.__fields = tuple(
+                    field
+                    for field in get_eep_decoder(*self.__profile_key()).fields
+                    if field[1] in self.__shortcuts
+                )
+        return self.__fields
+
+    def __profile_key(self) -> tuple:
+        return (self.__rorg, self.__func, self.__type, self.__direction, self.__command)
+
+    def select(self, shortcuts: Iterable[str]) -> "EEPDecoder":
+        """Return a decoder for the given fields only (cached, so it can be shared by devices)."""
+        shortcuts = frozenset(shortcuts)
+        key = self.__profile_key() + (shortcuts,)
+        decoder = _decoders.get(key)
+        if decoder is None:
+            decoder = copy.copy(self)
+            decoder.__shortcuts = shortcuts
+            decoder.__fields = None
+            _decoders[key] = decoder
+        return decoder
+
+    def __compile(self) -> tuple[tuple, ...]:
+        profile = get_eep_profiles().get(self.__rorg, self.__func, self.__type)
+        if profile is not None:
+            data = profile.find_data(self.__direction, self.__command)
+            return data.fields if data is not None else ()
+
+        # not precompiled, see eep_profiles.py
+        from enocean.protocol.packet import Packet
+
+        description = Packet.eep.find_profile(
+            self.__rorg, self.__func, self.__type, self.__direction, self.__command
+        )
+        if description is None:
+            return ()
+
+        fields = (compile_field(source) for source in description.contents)
+        return tuple(field for field in fields if field is not None)
+
+    def decode(self, packet: "Packet") -> dict[str, EEPValue]:
+        """Decode the packet's data using the compiled fields."""
+        if packet.rorg != self.__rorg:
+            # parse_eep selects the profile by the packet's RORG, so do the same
+            return get_eep_decoder(
+                packet.rorg,
+                self.__func,
+                self.__type,
+                self.__direction,
+                self.__command,
+            ).decode(packet)
+
+        data = packet.data
+        number_of_bits = (len(data) - 6) * 8
+        bits = int.from_bytes(bytes(data[1 : len(data) - 5]))
+        status = packet.status
+
+        fields = self.__fields
+        if fields is None:
+            fields = self.fields
+
+        values: dict[str, EEPValue] = {}
+        for kind, shortcut, offset, size, parameters in fields:
+            if kind == FIELD_STATUS:
+                raw_value = _get_raw(status, max(8, status.bit_length()), offset, size)
+                values[shortcut] = EEPValue(raw_value, True if raw_value else False)
+                continue
+
+            if kind == FIELD_VALUE:
+                raw_value = _get_raw(bits, number_of_bits, offset, size)
+                rng_min, rng_max, scl_min, scl_max = parameters
+                values[shortcut] = EEPValue(
+                    raw_value,
+                    (scl_max - scl_min) / (rng_max - rng_min) * (raw_value - rng_min)
+                    + scl_min,
+                )
+                continue
+
+            # enums without a matching item are skipped, as in parse_eep
+            try:
+                raw_value = _get_raw(bits, number_of_bits, offset, size)
+            except ValueError:
+                continue
+            items, range_items = parameters
+            description = items.get(raw_value)
+            if description is None:
+                for start, end, range_description in range_items:
+                    if start <= raw_value <= end:
+                        description = range_description
+                        break
+                else:
+                    continue
+            values[shortcut] = EEPValue(raw_value, description.format(value=raw_value))
+
+        return values
+
+    def parse(self, packet: "Packet") -> dict[str, EEPValue]:
+        """Decode the packet's data using the enocean library's 'parse_eep' (reference implementation)."""
+        packet.parse_eep(self.__func, self.__type, self.__direction, self.__command)
+        return {
+            shortcut: EEPValue(value["raw_value"], value["value"])
+            for shortcut, value in packet.parsed.items()
+        }
+
+
+def _get_raw(bits: int, number_of_bits: int, offset: int, size: int) -> int:
+    """Extract size bits at the given offset (counted from the most significant bit)."""
+    end = offset + size
+    if end > number_of_bits:
+        # parse_eep silently truncates the field at the end of the data
+        size = number_of_bits - offset
+        end = number_of_bits
+        if size <= 0:
+            raise ValueError("Field is out of the packet's data range.")
+    return (bits >> (number_of_bits - end)) & ((1 << size) - 1)
+
+
+_decoders: dict[tuple, EEPDecoder] = {}
+
+
+def get_eep_decoder(
+    rorg: int,
+    func: int,
+    type_: int,
+    direction: int | None = None,
+    command: int | None = None,
+) -> EEPDecoder:
+    """Return the (cached) decoder for the given profile, compiling it on first use."""
+    key = (rorg, func, type_, direction, command)
+    decoder = _decoders.get(key)
+    if decoder is None:
+        decoder = _decoders[key] = EEPDecoder(rorg, func, type_, direction, command)
+    return decoder
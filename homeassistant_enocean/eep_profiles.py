@@ -0,0 +1,272 @@
+"""Precompiled database of the EnOcean Equipment Profiles (EEP) supported by the gateway.
+
+The enocean library parses its XML profile description (EEP.xml) with BeautifulSoup when it
+is imported and navigates the resulting tree for every profile lookup. The profiles of all
+EEPs supported by the gateway are compiled from it into 'eep_profiles.json' (at build time,
+see scripts/compile_eep_profiles.py), which is loaded in a few milliseconds and indexed by
+(RORG, FUNC, TYPE) and by direction or command. The decoders (eep_decoder.py) and telegram
+templates (telegram_template.py) use this database and only fall back to the XML description
+for profiles which are not contained in it.
+
+The database records its format version and the version of the enocean library it was
+compiled from; it is not used if either does not match.
+"""
+
+from functools import cache
+import json
+import logging
+import os
+from typing import Any, Iterable
+
+from .eep import EEP
+
+_LOGGER = logging.getLogger(__name__)
+
+EEP_PROFILES_FORMAT_VERSION = 1
+"""Version of the database format, to be increased on incompatible changes."""
+
+EEP_PROFILES_PATH = os.path.join(os.path.dirname(__file__), "eep_profiles.json")
+
+FIELD_VALUE = 0
+FIELD_ENUM = 1
+FIELD_STATUS = 2
+
+type EEPField = tuple[int, str, int, int, Any]
+"""A data field as (kind, shortcut, offset, size, parameters).
+
+The parameters are (range min, range max, scale min, scale max) for values, (items by raw value,
+range items as (start, end, description) tuples) for enums and None for status fields.
+"""
+
+
+class EnOceanEEPData:
+    """The data description of a profile for one direction or command."""
+
+    __slots__ = ("direction", "command", "bits", "fields")
+
+    def __init__(
+        self,
+        direction: str | None,
+        command: str | None,
+        bits: int | None,
+        fields: tuple[EEPField, ...],
+    ) -> None:
+        self.direction = direction
+        """The direction (as in EEP.xml), if the profile distinguishes directions."""
+        self.command = command
+        """The command (as in EEP.xml), if the profile distinguishes commands."""
+        self.bits = bits
+        """The number of data bytes of VLD telegrams (named 'bits' in EEP.xml)."""
+        self.fields = fields
+        """The fields, in the order of EEP.xml."""
+
+    def find_field(self, shortcut: str) -> EEPField | None:
+        """Return the (first) field with the given shortcut."""
+        for field in self.fields:
+            if field[1] == shortcut:
+                return field
+        return None
+
+
+class EnOceanEEPProfile:
+    """The data descriptions of one profile (RORG, FUNC and TYPE)."""
+
+    __slots__ = ("has_commands", "data", "__by_direction", "__by_command")
+
+    def __init__(self, has_commands: bool, data: tuple[EnOceanEEPData, ...]) -> None:
+        self.has_commands = has_commands
+        """True if the profile defines commands (i.e. data descriptions per command)."""
+        self.data = data
+        """The data descriptions, in the order of EEP.xml."""
+        self.__by_direction: dict[str, EnOceanEEPData] = {}
+        self.__by_command: dict[str, EnOceanEEPData] = {}
+        for entry in reversed(data):
+            if entry.direction is not None:
+                self.__by_direction[entry.direction] = entry
+            if entry.command is not None:
+                self.__by_command[entry.command] = entry
+
+    def find_data(
+        self, direction: int | str | None = None, command: int | None = None
+    ) -> EnOceanEEPData | None:
+        """Return the data description as selected by the enocean library's 'find_profile'."""
+        if command:
+            if not self.has_commands:
+                return self.data[0] if self.data else None
+            return self.__by_command.get(str(command))
+        if direction is None:
+            return self.data[0] if self.data else None
+        return self.__by_direction.get(str(direction))
+
+
+class EnOceanEEPProfiles:
+    """The precompiled profiles, indexed by RORG, FUNC and TYPE."""
+
+    __slots__ = ("__profiles",)
+
+    def __init__(self, profiles: dict[tuple[int, int, int], EnOceanEEPProfile]) -> None:
+        self.__profiles = profiles
+
+    def __len__(self) -> int:
+        return len(self.__profiles)
+
+    def get(self, rorg: int, func: int, type_: int) -> EnOceanEEPProfile | None:
+        """Return the profile (None if it is not contained in the database)."""
+        return self.__profiles.get((rorg, func, type_))
+
+    @classmethod
+    def from_json(cls, document: dict) -> "EnOceanEEPProfiles":
+        """Create the database from its JSON representation."""
+        profiles = {}
+        for eep_string, profile in document["profiles"].items():
+            eep = EEP.from_string(eep_string)
+            profiles[(eep.rorg, eep.func, eep.type)] = EnOceanEEPProfile(
+                profile["has_commands"],
+                tuple(
+                    EnOceanEEPData(
+                        data["direction"],
+                        data["command"],
+                        data["bits"],
+                        tuple(_field_from_json(field) for field in data["fields"]),
+                    )
+                    for data in profile["data"]
+                ),
+            )
+        return cls(profiles)
+
+
+def _field_from_json(field: list) -> EEPField:
+    kind, shortcut, offset, size, parameters = field
+    if kind == FIELD_VALUE:
+        parameters = tuple(parameters)
+    elif kind == FIELD_ENUM:
+        items, range_items = parameters
+        parameters = (
+            {int(value): description for value, description in items},
+            tuple(tuple(range_item) for range_item in range_items),
+        )
+    return (kind, shortcut, offset, size, parameters)
+
+
+def enocean_version() -> str | None:
+    """Return the version of the installed enocean library (None if unknown)."""
+    import enocean
+
+    return getattr(enocean, "__version__", None)
+
+
+@cache
+def get_eep_profiles() -> EnOceanEEPProfiles:
+    """Return the (cached) database; it is empty if the file is missing or outdated."""
+    try:
+        with open(EEP_PROFILES_PATH, encoding="utf-8") as file:
+            document = json.load(file)
+    except (OSError, ValueError) as e:
+        _LOGGER.debug(f"Cannot load EEP profiles ({e}), using EEP.xml.")
+        return EnOceanEEPProfiles({})
+
+    if (
+        document.get("format_version") != EEP_PROFILES_FORMAT_VERSION
+        or document.get("enocean_version") != enocean_version()
+    ):
+        _LOGGER.debug("EEP profiles are outdated, using EEP.xml.")
+        return EnOceanEEPProfiles({})
+
+    return EnOceanEEPProfiles.from_json(document)
+
+
+def compile_field(source) -> EEPField | None:
+    """Compile a field of the enocean library's profile description (None for other tags)."""
+    if source.name == "value":
+        rng = source.find("range")
+        scl = source.find("scale")
+        parameters = (
+            float(rng.find("min").text),
+            float(rng.find("max").text),
+            float(scl.find("min").text),
+            float(scl.find("max").text),
+        )
+        kind = FIELD_VALUE
+    elif source.name == "enum":
+        items = {}
+        for item in source.find_all("item"):
+            value = item.get("value")
+            if value is not None and value == str(_to_int(value)):
+                items.setdefault(int(value), item.get("description"))
+        range_items = tuple(
+            (
+                int(range_item.get("start", -1)),
+                int(range_item.get("end", -1)),
+                range_item.get("description"),
+            )
+            for range_item in source.find_all("rangeitem")
+        )
+        parameters = (items, range_items)
+        kind = FIELD_ENUM
+    elif source.name == "status":
+        parameters = None
+        kind = FIELD_STATUS
+    else:
+        return None
+
+    return (
+        kind,
+        source["shortcut"],
+        int(source["offset"]),
+        int(source["size"]),
+        parameters,
+    )
+
+
+def _to_int(value: str) -> int | None:
+    try:
+        return int(value)
+    except ValueError:
+        return None
+
+
+def compile_eep_profiles(eeps: Iterable[EEP]) -> dict:
+    """Compile the JSON representation of the given profiles from the enocean library's EEP.xml.
+
+    Profiles which are not contained in EEP.xml are omitted.
+    """
+    from enocean.protocol.packet import Packet
+
+    profiles = {}
+    for eep in sorted(eeps, key=lambda eep: (eep.rorg, eep.func, eep.type)):
+        profile = Packet.eep.telegrams.get(eep.rorg, {}).get(eep.func, {}).get(eep.type)
+        if profile is None:
+            continue
+
+        data = []
+        for description in profile.find_all("data", recursive=False):
+            bits = description.get("bits")
+            fields = []
+            for source in description.contents:
+                field = compile_field(source)
+                if field is None:
+                    continue
+                kind, shortcut, offset, size, parameters = field
+                if kind == FIELD_ENUM:
+                    items, range_items = parameters
+                    parameters = (sorted(items.items()), range_items)
+                fields.append((kind, shortcut, offset, size, parameters))
+            data.append(
+                {
+                    "direction": description.get("direction"),
+                    "command": description.get("command"),
+                    "bits": int(bits) if bits is not None else None,
+                    "fields": fields,
+                }
+            )
+
+        profiles[eep.to_string()] = {
+            "has_commands": profile.find("command", recursive=False) is not None,
+            "data": data,
+        }
+
+    return {
+        "format_version": EEP_PROFILES_FORMAT_VERSION,
+        "enocean_version": enocean_version(),
+        "profiles": profiles,
+    }
@@ -0,0 +1,369 @@
+"""Declarative registry of the EnOcean Equipment Profiles (EEP) supported by the gateway.
+
+Each registration maps a family of EEPs (RORG, FUNC and a range of TYPEs, optionally for a
+single manufacturer) to the device handler class in 'devices'. The registry is built once per
+process and resolves an EEP through a two-level integer index: (RORG << 8) | FUNC, then TYPE.
+Handler classes are imported on first use. The supported device types (see
+'EnOceanDeviceType.get_supported_device_types') and the table of supported EEPs in README.md
+(see scripts/generate_readme_table.py) are generated from the registry.
+"""
+
+from functools import cache
+import importlib
+from typing import TYPE_CHECKING, Iterator, Mapping, NamedTuple
+
+from .eep import EEP
+
+if TYPE_CHECKING:
+    from .devices.device import EnOceanDevice
+
+
+class EnOceanEEPRegistration(NamedTuple):
+    """The device handler of a family of EEPs."""
+
+    rorg: int
+    func: int
+    types: range
+    """The TYPEs handled."""
+
+    handler: str
+    """The device handler as '<module in devices>.<class>', imported on first use."""
+
+    models: Mapping[int, str] | str
+    """The model (description) per TYPE, or a format string for all TYPEs (with 'type')."""
+
+    components: Mapping[int, str] | str
+    """The Home Assistant components, per TYPE or for all TYPEs (for README.md)."""
+
+    tested: Mapping[int, str] = {}
+    """The devices tested per TYPE (for README.md)."""
+
+    manufacturer_id: int | None = None
+    """The manufacturer, if the handler is specific to it (taking precedence over others)."""
+
+    def eeps(self) -> Iterator[EEP]:
+        """Return the EEPs handled."""
+        for type_ in self.types:
+            yield EEP(self.rorg, self.func, type_, self.manufacturer_id)
+
+    def model(self, type_: int) -> str:
+        """Return the model (description) of the given TYPE."""
+        if isinstance(self.models, str):
+            return self.models.format(type=type_)
+        return self.models[type_]
+
+    def component(self, type_: int) -> str:
+        """Return the Home Assistant components of the given TYPE."""
+        if isinstance(self.components, str):
+            return self.components
+        return self.components[type_]
+
+    def handler_class(self) -> type["EnOceanDevice"]:
+        """Return the device handler class, importing it on first use."""
+        return _import_handler(self.handler)
+
+
+class EnOceanProduct(NamedTuple):
+    """A device type of a specific manufacturer, handled according to its EEP."""
+
+    unique_id: str
+    eep: EEP
+    manufacturer: str
+    model: str
+
+
+class EnOceanEEPRegistry:
+    """Resolution of EEPs to their registrations."""
+
+    __slots__ = ("__registrations", "__index")
+
+    def __init__(self, registrations: tuple[EnOceanEEPRegistration, ...]) -> None:
+        """Construct the registry and its index; overlapping registrations are rejected."""
+        self.__registrations = registrations
+        self.__index: dict[int, dict[int, EnOceanEEPRegistration]] = {}
+        """Registrations by (RORG << 8) | FUNC and by TYPE (see '_type_key')."""
+        for registration in registrations:
+            types = self.__index.setdefault(
+                (registration.rorg << 8) | registration.func, {}
+            )
+            for type_ in registration.types:
+                key = _type_key(type_, registration.manufacturer_id)
+                if key in types:
+                    raise ValueError(
+                        f"EEP {EEP(registration.rorg, registration.func, type_)} is registered twice."
+                    )
+                types[key] = registration
+
+    def __iter__(self) -> Iterator[EnOceanEEPRegistration]:
+        return iter(self.__registrations)
+
+    def resolve(self, eep: EEP) -> EnOceanEEPRegistration | None:
+        """Return the registration handling the EEP (None if unsupported)."""
+        types = self.__index.get((eep.rorg << 8) | eep.func)
+        if types is None:
+            return None
+        if eep.manufacturer_id is not None:
+            registration = types.get(_type_key(eep.type, eep.manufacturer_id))
+            if registration is not None:
+                return registration
+        return types.get(eep.type)
+
+    def eeps(self) -> list[EEP]:
+        """Return all EEPs handled, in the order of registration."""
+        return [
+            eep for registration in self.__registrations for eep in registration.eeps()
+        ]
+
+
+def _type_key(type_: int, manufacturer_id: int | None) -> int:
+    """Return the index key of a TYPE, above 0xFF for manufacturer-specific registrations."""
+    if manufacturer_id is None:
+        return type_
+    return ((manufacturer_id + 1) << 8) | type_
+
+
+@cache
+def _import_handler(handler: str) -> type["EnOceanDevice"]:
+    module_name, class_name = handler.rsplit(".", 1)
+    module = importlib.import_module(f".devices.{module_name}", __package__)
+    return getattr(module, class_name)
+
+
+@cache
+def get_eep_registry() -> EnOceanEEPRegistry:
+    """Return the registry of the supported EEPs (built on first use)."""
+    return EnOceanEEPRegistry(REGISTRATIONS)
+
+
+_A502XX_MODELS = {
+    0x01: "Temperature Sensor Range -40 °C to 0 °C",
+    0x02: "Temperature Sensor Range -30 °C to +10 °C",
+    0x03: "Temperature Sensor Range -20 °C to +20 °C",
+    0x04: "Temperature Sensor Range -10 °C to +30 °C",
+    0x05: "Temperature Sensor Range 0 °C to +40 °C",
+    0x06: "Temperature Sensor Range +10 °C to +50 °C",
+    0x07: "Temperature Sensor Range +20 °C to +60 °C",
+    0x08: "Temperature Sensor Range +30 °C to +70 °C",
+    0x09: "Temperature Sensor Range +40 °C to +80 °C",
+    0x0A: "Temperature Sensor Range +50 °C to +90 °C",
+    0x0B: "Temperature Sensor Range +60 °C to +100 °C",
+    0x10: "Temperature Sensor Range -60 °C to +20 °C",
+    0x11: "Temperature Sensor Range -50 °C to +30 °C",
+    0x12: "Temperature Sensor Range -40 °C to +40 °C",
+    0x13: "Temperature Sensor Range -30 °C to +50 °C",
+    0x14: "Temperature Sensor Range -20 °C to +60 °C",
+    0x15: "Temperature Sensor Range -10 °C to +70 °C",
+    0x16: "Temperature Sensor Range 0 °C to +80 °C",
+    0x17: "Temperature Sensor Range +10 °C to +90 °C",
+    0x18: "Temperature Sensor Range +20 °C to +100 °C",
+    0x19: "Temperature Sensor Range +30 °C to +110 °C",
+    0x1A: "Temperature Sensor Range +40 °C to +120 °C",
+    0x1B: "Temperature Sensor Range +50 °C to +130 °C",
+    0x20: "10 Bit Temperature Sensor Range -10°C to +41.2°C",
+    0x30: "10 Bit Temperature Sensor Range -40°C to +62.3°C",
+}
+_A502XX = "a502xx_device.EnOceanA502XXDevice"
+_A502XX_COMPONENTS = "one sensor"
+
+_F602XX_COMPONENTS = (
+    "eight binary sensors (`a0`, `a1`, `b0`, `b1`, `ab0`, `ab1`, `a0b1`, `a1b0`)"
+)
+_F602XX_TESTED = "Jung ENO wall switch (2 channels)"
+
+REGISTRATIONS: tuple[EnOceanEEPRegistration, ...] = (
+    # A5-02 Temperature Sensors
+    EnOceanEEPRegistration(
+        0xA5, 0x02, range(0x01, 0x0C), _A502XX, _A502XX_MODELS, _A502XX_COMPONENTS
+    ),
+    EnOceanEEPRegistration(
+        0xA5, 0x02, range(0x10, 0x1C), _A502XX, _A502XX_MODELS, _A502XX_COMPONENTS
+    ),
+    EnOceanEEPRegistration(
+        0xA5, 0x02, range(0x20, 0x21), _A502XX, _A502XX_MODELS, _A502XX_COMPONENTS
+    ),
+    EnOceanEEPRegistration(
+        0xA5, 0x02, range(0x30, 0x31), _A502XX, _A502XX_MODELS, _A502XX_COMPONENTS
+    ),
+    # A5-04 Temperature and Humidity Sensors
+    EnOceanEEPRegistration(
+        0xA5,
+        0x04,
+        range(0x01, 0x05),
+        "a504xx_device.EnOceanA504XXDevice",
+        {
+            0x01: "Temperature and Humidity Sensor, Range 0 °C to +40 °C and 0% to 100%",
+            0x02: "Temperature and Humidity Sensor, Range -20 °C to +60 °C and 0% to 100%",
+            0x03: "Temperature and Humidity Sensor, Range -20°C to +60°C 10bit-measurement and 0% to 100%",
+            0x04: "Temperature and Humidity Sensor, Range -40°C to +120°C 12bit-measurement and 0% to 100%",
+        },
+        "two sensors (`temperature`, `humidity`)",
+    ),
+    # A5-06 Light Sensor
+    EnOceanEEPRegistration(
+        0xA5,
+        0x06,
+        range(0x01, 0x02),
+        "a50601_device.EnOceanA50601Device",
+        "Light Sensor, Range 300lx to 60.000lx",
+        "one sensor (`illuminance`) and (if not Eltako), another sensor (`supply voltage`)",
+        {0x01: "Eltako FAH65S (hence, only `illuminance` sensor is tested)"},
+    ),
+    # A5-07 Occupancy Sensor
+    EnOceanEEPRegistration(
+        0xA5,
+        0x07,
+        range(0x03, 0x04),
+        "a50703_device.EnOceanA50703Device",
+        "Occupancy with Supply voltage monitor and 10-bit illumination measurement",
+        "one binary sensor (`motion_detected`) and two sensors (`illuminance`, `supply_voltage`)",
+        {0x03: "NodOn PIR-2-1-01"},
+    ),
+    # A5-08 Light, Temperature and Occupancy Sensor
+    EnOceanEEPRegistration(
+        0xA5,
+        0x08,
+        range(0x01, 0x02),
+        "a50801_device.EnOceanA50801Device",
+        "Light, temperature and occupancy sensor, range 0lx to 510lx, 0°C to 51°C and occupancy button",
+        "one binary sensor (`occupancy`) and one sensor (`supply_voltage`); for non-Eltako devices an additional binary sensor (`occupancy_button`) and an additional sensor (`temperature`)",
+        {0x01: "Eltako FABH65S"},
+    ),
+    # A5-10 (Room Operating Panels), A5-12-01 (Automated Meter Reading) and A5-20-01 (HVAC
+    # Battery Powered Actuator) are not supported yet.
+    # A5-38-08 Gateway
+    EnOceanEEPRegistration(
+        0xA5,
+        0x38,
+        range(0x08, 0x09),
+        "a53808_device.EnOceanA53808Device",
+        "Gateway",
+        "one light, three diagnostic numbers (`ramping_time`, `min_brightness`, `max_brightness`) and two diagnostic sensors (`device_properties`, `dimming_range`)",
+        {0x08: "Eltako FUD61NPN-230V"},
+    ),
+    # D2-01 Electronic Switches and Dimmers with Energy Measurement and Local Control
+    EnOceanEEPRegistration(
+        0xD2,
+        0x01,
+        range(0x00, 0x15),
+        "d201xx_device.EnOceanD201XXDevice",
+        "Electronic Switches and Dimmers with Energy Measurement and Local Control, Type {type:02X}",
+        {
+            **dict.fromkeys(range(0x00, 0x10), "one switch"),
+            **dict.fromkeys(range(0x10, 0x13), "two switches"),
+            0x13: "four switches",
+            0x14: "eight switches",
+        },
+        {0x0F: "NodOn SIN-2-1-01"},
+    ),
+    # D2-05-00 Blinds Control for Position and Angle
+    EnOceanEEPRegistration(
+        0xD2,
+        0x05,
+        range(0x00, 0x01),
+        "d20500_device.EnOceanD20500Device",
+        "Blinds Control for Position and Angle, Type 00",
+        "one cover",
+        {0x00: "NodOn SIN-2-RS-01"},
+    ),
+    # F6-02 Light and Blind Control
+    EnOceanEEPRegistration(
+        0xF6,
+        0x02,
+        range(0x01, 0x03),
+        "f602xx_device.EnOceanF602XXDevice",
+        {
+            0x01: "Light and Blind Control - Application Style 2",
+            0x02: "Light and Blind Control - Application Style 1",
+        },
+        _F602XX_COMPONENTS,
+        {0x01: _F602XX_TESTED, 0x02: _F602XX_TESTED},
+    ),
+    # F6-10-00 Window Handle
+    EnOceanEEPRegistration(
+        0xF6,
+        0x10,
+        range(0x00, 0x01),
+        "f61000_device.EnOceanF61000Device",
+        "Mechanical Handle - Window Handle",
+        "one sensor (`up2vertical`, `vertical2up`, `down2vertical`, `vertical2down`)",
+    ),
+)
+"""The supported EEPs, in the order of README.md."""
+
+PRODUCTS: tuple[EnOceanProduct, ...] = (
+    EnOceanProduct(
+        "Eltako_FAH65s",
+        EEP(0xA5, 0x06, 0x01, manufacturer_id=0x0D),
+        "Eltako",
+        "FAH65s Wireless outdoor brightness sensor",
+    ),
+    EnOceanProduct(
+        "Eltako_FABH65S",
+        EEP(0xA5, 0x08, 0x01, manufacturer_id=0x0D),
+        "Eltako",
+        "FABH65S Wireless outdoor occupancy and brightness sensor",
+    ),
+    EnOceanProduct(
+        "Eltako_FUD61NPN",
+        EEP(0xA5, 0x38, 0x08),
+        "Eltako",
+        "FUD61NPN-230V Wireless universal dimmer",
+    ),
+    EnOceanProduct(
+        "Eltako_FLD61",
+        EEP(0xA5, 0x38, 0x08),
+        "Eltako",
+        "FLD61 PWM LED dimmer switch for LEDs 12-36V DC, up to 4A",
+    ),
+    EnOceanProduct(
+        "Eltako_FT55",
+        EEP(0xF6, 0x02, 0x01),
+        "Eltako",
+        "FT55 battery-less wall switch",
+    ),
+    EnOceanProduct("Jung_ENO", EEP(0xF6, 0x02, 0x01), "Jung", "ENO wall switch"),
+    EnOceanProduct("Omnio_WS-CH-102", EEP(0xF6, 0x02, 0x01), "Omnio", "WS-CH-102"),
+    EnOceanProduct(
+        "Hoppe_SecuSignal",
+        EEP(0xF6, 0x10, 0x00),
+        "Hoppe",
+        "SecuSignal window handle from Somfy",
+    ),
+    EnOceanProduct(
+        "TRIO2SYS_WallSwitches",
+        EEP(0xF6, 0x02, 0x01),
+        "TRIO2SYS",
+        "TRIO2SYS Wall switches",
+    ),
+    EnOceanProduct(
+        "NodOn_SIN-2-1-01",
+        EEP(0xD2, 0x01, 0x0F),
+        "NodOn",
+        "SIN-2-1-01 Single Channel Relay Switch",
+    ),
+    EnOceanProduct(
+        "NodOn_SIN-2-2-01",
+        EEP(0xD2, 0x01, 0x12),
+        "NodOn",
+        "SIN-2-2-01 Dual Channel Relay Switch",
+    ),
+    EnOceanProduct(
+        "NodOn_SIN-2-RS-01",
+        EEP(0xD2, 0x05, 0x00),
+        "NodOn",
+        "SIN-2-RS-01 Roller Shutter Controller",
+    ),
+    EnOceanProduct(
+        "NodOn_PIR-2-1-01",
+        EEP(0xA5, 0x07, 0x03),
+        "NodOn",
+        "PIR-2-1-01 Motion Sensor",
+    ),
+    EnOceanProduct(
+        "Permundo_PSC234",
+        EEP(0xD2, 0x01, 0x09),
+        "Permundo",
+        "PSC234 (switch and power monitor)",
+    ),
+)
+"""The device types of specific manufacturers."""
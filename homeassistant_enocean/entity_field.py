@@ -0,0 +1,32 @@
+"""Decoding of entity states from the EEP fields of a telegram."""
+
+from functools import cache
+from typing import Any, Callable, NamedTuple
+
+from .eep_decoder import EEPValue
+
+
+class EnOceanEntityField(NamedTuple):
+    """Describes how an entity's state is computed from a telegram's decoded EEP fields.
+
+    Devices return these from 'EnOceanDevice.entity_fields'; when a callback is registered,
+    the device compiles the fields of all subscribed entities into its dispatch vector.
+    """
+
+    shortcuts: tuple[str, ...]
+    """Shortcuts of the EEP fields needed to compute the state."""
+
+    decode: Callable[[dict[str, EEPValue]], Any]
+    """Compute the state from the decoded EEP fields (returning None skips the update)."""
+
+
+@cache
+def value_field(shortcut: str) -> EnOceanEntityField:
+    """Return an entity field reporting the (scaled) value of an EEP field."""
+    return EnOceanEntityField((shortcut,), lambda values: values[shortcut].value)
+
+
+@cache
+def raw_value_field(shortcut: str) -> EnOceanEntityField:
+    """Return an entity field reporting the raw value of an EEP field."""
+    return EnOceanEntityField((shortcut,), lambda values: values[shortcut].raw_value)
@@ -0,0 +1,113 @@
+"""Suppression of unchanged entity state updates."""
+
+import time
+from typing import Any, Callable, NamedTuple
+
+
+class EnOceanEntityFilterConfig(NamedTuple):
+    """Configuration of the filter between a device's decoded values and an entity's callback.
+
+    An update is suppressed if it is considered unchanged compared to the last forwarded
+    value, unless the last forwarded update is at least max_silence seconds old.
+    """
+
+    suppress_duplicates: bool = True
+    """Suppress updates equal to the last forwarded value."""
+
+    absolute_deadband: float | None = None
+    """Suppress numeric updates differing by at most this value from the last forwarded value."""
+
+    relative_deadband: float | None = None
+    """Suppress numeric updates differing by at most this fraction of the last forwarded value."""
+
+    max_silence: float | None = None
+    """Forward an unchanged update anyway if the last forwarded update is at least this many seconds old (heartbeat)."""
+
+
+class EnOceanEntityFilterCounters(NamedTuple):
+    """Number of updates forwarded to and suppressed by an entity filter."""
+
+    forwarded: int
+    suppressed: int
+
+
+class EnOceanEntityFilter:
+    """A callback forwarding only changed updates to the wrapped callback.
+
+    The heartbeat (max_silence) is evaluated when an update is received, i.e. an unchanged
+    update is forwarded if it arrives after the configured time without forwarded updates.
+    """
+
+    __slots__ = (
+        "callback",
+        "config",
+        "forwarded",
+        "suppressed",
+        "__last_value",
+        "__last_forwarded",
+    )
+
+    def __init__(self, callback: Callable, config: EnOceanEntityFilterConfig) -> None:
+        """Wrap the callback with a filter with the given configuration."""
+        self.callback: Callable = callback
+        """The wrapped callback."""
+
+        self.config: EnOceanEntityFilterConfig = config
+        """The filter configuration."""
+
+        self.forwarded: int = 0
+        """Number of updates forwarded to the callback."""
+
+        self.suppressed: int = 0
+        """Number of updates suppressed."""
+
+        self.__last_value: Any = None
+        self.__last_forwarded: float | None = None
+
+    @property
+    def counters(self) -> EnOceanEntityFilterCounters:
+        """Return the number of forwarded and suppressed updates."""
+        return EnOceanEntityFilterCounters(self.forwarded, self.suppressed)
+
+    def __call__(self, *args) -> None:
+        """Forward the update to the callback unless it is suppressed."""
+        value = args[0] if len(args) == 1 else args
+        now = time.monotonic()
+
+        if self.__last_forwarded is not None and self.__is_unchanged(value):
+            max_silence = self.config.max_silence
+            if max_silence is None or now - self.__last_forwarded < max_silence:
+                self.suppressed += 1
+                return
+
+        self.__last_value = value
+        self.__last_forwarded = now
+        self.forwarded += 1
+        self.callback(*args)
+
+    def __is_unchanged(self, value: Any) -> bool:
+        """Check whether the value is unchanged compared to the last forwarded value."""
+        last_value = self.__last_value
+        config = self.config
+        if config.suppress_duplicates and value == last_value:
+            return True
+
+        if not (_is_number(value) and _is_number(last_value)):
+            return False
+        difference = abs(value - last_value)
+        if (
+            config.absolute_deadband is not None
+            and difference <= config.absolute_deadband
+        ):
+            return True
+        if (
+            config.relative_deadband is not None
+            and difference <= config.relative_deadband * abs(last_value)
+        ):
+            return True
+        return False
+
+
+def _is_number(value: Any) -> bool:
+    """Check whether the value is a number (booleans are not)."""
+    return isinstance(value, (int, float)) and not isinstance(value, bool)
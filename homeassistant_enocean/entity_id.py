@@ -1,15 +1,37 @@
+from weakref import WeakValueDictionary
+
 from homeassistant_enocean.address import EnOceanDeviceAddress
 
 
 class EnOceanEntityID:
-    """An EnOcean entity is uniquely identified by its device's EnOcean Unique Radio Identifier (EURID) and a unique ID string for the entity."""
+    """An EnOcean entity is uniquely identified by its device's EnOcean Unique Radio Identifier (EURID) and a unique ID string for the entity.
+
+    Entity IDs are immutable and interned, i.e. constructing an entity ID returns the
+    instance shared by all entity IDs with the same device address and unique ID. The
+    instances are held weakly, so entity IDs of removed devices do not accumulate.
+    """
+
+    __slots__ = ("__device_address", "__unique_id", "__hash", "__weakref__")
 
-    def __init__(
-        self, device_address: EnOceanDeviceAddress, unique_id: str | None = None
-    ) -> None:
-        """Construct an EnOcean entity ID."""
-        self.__device_address = device_address
-        self.__unique_id: str | None = unique_id
+    __instances: "WeakValueDictionary[tuple, EnOceanEntityID]" = WeakValueDictionary()
+
+    def __new__(
+        cls, device_address: EnOceanDeviceAddress, unique_id: str | None = None
+    ) -> "EnOceanEntityID":
+        """Return the EnOcean entity ID."""
+        key = (type(device_address), device_address.to_number(), unique_id)
+        entity_id = EnOceanEntityID.__instances.get(key)
+        if entity_id is None:
+            # the slots are private and only exposed as read-only properties
+            entity_id = object.__new__(cls)
+            set_attribute = object.__setattr__
+            set_attribute(entity_id, "_EnOceanEntityID__device_address", device_address)
+            set_attribute(entity_id, "_EnOceanEntityID__unique_id", unique_id)
+            set_attribute(
+                entity_id, "_EnOceanEntityID__hash", hash((key[1], unique_id))
+            )
+            EnOceanEntityID.__instances[key] = entity_id
+        return entity_id
 
     @property
     def device_address(self) -> EnOceanDeviceAddress:
@@ -32,13 +54,35 @@ class EnOceanEntityID:
         """Return a string representation of the entity."""
         return self.to_string()
 
+    def __repr__(self) -> str:
+        return f"EnOceanEntityID({self.to_string()!r})"
+
     def __hash__(self) -> int:
         """Return the hash of the entity ID."""
-        return hash((self.__device_address.to_number(), self.unique_id))
+        return self.__hash
 
     def __eq__(self, other) -> bool:
         """Check equality with another entity ID."""
-        return (self.__device_address.to_number(), self.unique_id) == (
+        if self is other:
+            return True
+        if not isinstance(other, EnOceanEntityID):
+            return NotImplemented
+        return (self.__device_address.to_number(), self.__unique_id) == (
             other.device_address.to_number(),
             other.unique_id,
         )
+
+    def __setattr__(self, name: str, value) -> None:
+        raise AttributeError("EnOceanEntityID is immutable.")
+
+    def __delattr__(self, name: str) -> None:
+        raise AttributeError("EnOceanEntityID is immutable.")
+
+    def __reduce__(self):
+        return (EnOceanEntityID, (self.__device_address, self.__unique_id))
+
+    def __copy__(self) -> "EnOceanEntityID":
+        return self
+
+    def __deepcopy__(self, memo) -> "EnOceanEntityID":
+        return self
@@ -2,7 +2,30 @@ import datetime
 
 
 class HomeAssistantEntityProperties:
-    """A collection of properties for a Home Assistant entity."""
+    """An immutable collection of properties for a Home Assistant entity.
+
+    Instances are shared between all devices of the same type (see 'EnOceanDevice'), so
+    attributes cannot be changed after construction.
+    """
+
+    __slots__ = (
+        "unique_id",
+        "device_class",
+        "supported_features",
+        "translation_key",
+        "event_types",
+        "platform",
+        "state_class",
+        "native_unit_of_measurement",
+        "last_reset",
+        "entity_category",
+        "options",
+        "current_option",
+        "native_max_value",
+        "native_min_value",
+        "native_step",
+        "native_value",
+    )
 
     def __init__(
         self,
@@ -22,28 +45,36 @@ class HomeAssistantEntityProperties:
         native_step: float | None = None,
         native_value: float | None = None,
     ) -> None:
-        self.unique_id: str | None = unique_id
-        self.device_class: str | None = device_class
-        self.supported_features: int | None = (
-            supported_features  # Bitmask of supported features
-        )
-        self.translation_key: str | None = translation_key
-        self.event_types: list[str] = event_types
-        self.platform: str | None = (
-            None  # e.g., 'binary_sensor', 'cover', 'light', 'switch'
+        set_attribute = object.__setattr__
+        set_attribute(self, "unique_id", unique_id)
+        set_attribute(self, "device_class", device_class)
+        # bitmask of supported features
+        set_attribute(self, "supported_features", supported_features)
+        set_attribute(self, "translation_key", translation_key)
+        set_attribute(self, "event_types", event_types)
+        # e.g., 'binary_sensor', 'cover', 'light', 'switch'
+        set_attribute(self, "platform", None)
+        set_attribute(self, "state_class", sensor_state_class)
+        set_attribute(self, "native_unit_of_measurement", native_unit_of_measurement)
+        set_attribute(self, "last_reset", last_reset)
+        # e.g., 'diagnostic', 'config'
+        set_attribute(self, "entity_category", entity_category)
+        set_attribute(self, "options", options)  # For select entities
+        set_attribute(self, "current_option", current_option)  # For select entities
+        set_attribute(self, "native_max_value", native_max_value)  # For number entities
+        set_attribute(self, "native_min_value", native_min_value)  # For number entities
+        set_attribute(self, "native_step", native_step)  # For number entities
+        set_attribute(self, "native_value", native_value)  # For number entities
+
+    def __setattr__(self, name: str, value) -> None:
+        raise AttributeError(
+            f"HomeAssistantEntityProperties is immutable, cannot set '{name}'."
         )
-        self.state_class: str | None = sensor_state_class
-        self.native_unit_of_measurement: str | None = native_unit_of_measurement
-        self.last_reset: datetime.datetime | None = last_reset
-        self.entity_category: str | None = (
-            entity_category  # e.g., 'diagnostic', 'config'
+
+    def __delattr__(self, name: str) -> None:
+        raise AttributeError(
+            f"HomeAssistantEntityProperties is immutable, cannot delete '{name}'."
         )
-        self.options: list | None = options  # For select entities
-        self.current_option: str | None = current_option  # For select entities
-        self.native_max_value: float | None = native_max_value  # For number entities
-        self.native_min_value: float | None = native_min_value  # For number entities
-        self.native_step: float | None = native_step  # For number entities
-        self.native_value: float | None = native_value  # For number entities
 
     def __str__(self):
         return (
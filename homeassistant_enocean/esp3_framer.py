@@ -0,0 +1,160 @@
+"""Framing of ESP3 packets from the byte stream received from an EnOcean module.
+
+The enocean library's 'Packet.parse_msg' converts the whole receive buffer to a new list for
+every packet and checks the CRC8 checksums on list slices. On a header checksum mismatch,
+it discards as many bytes as the corrupt header claims, which may take up to 64 KiB of
+valid packets with it. The framer keeps the received bytes in a single bytearray, consumed
+by advancing a read offset, finds the sync byte with 'bytearray.find', checks the checksums
+with a 256 entry table on memoryview slices and only copies a packet's data and optional
+data into the lists expected by the 'Packet' classes once both checksums are valid.
+
+On a header checksum mismatch, only the sync byte is discarded and the search continues at
+the next 0x55 (so that a sync byte within corrupt data does not cost more than one step).
+A packet with a data checksum mismatch is discarded as a whole, as its (valid) header
+determines its length. So is a packet with valid checksums which cannot be parsed into a
+'Packet' (e.g. a radio telegram without sender and status).
+"""
+
+import datetime
+
+from enocean.protocol.constants import PACKET, RORG
+from enocean.protocol.packet import (
+    EventPacket,
+    Packet,
+    RadioPacket,
+    ResponsePacket,
+    UTETeachInPacket,
+)
+
+SYNC_BYTE = 0x55
+HEADER_LENGTH = 6
+"""Sync byte, data length (2 bytes), optional length, packet type and header checksum."""
+
+
+def _crc8_table(polynomial: int = 0x07) -> bytes:
+    """Return the CRC8 of every byte value (for the ESP3 polynomial x^8 + x^2 + x + 1)."""
+    table = bytearray(256)
+    for value in range(256):
+        crc = value
+        for _ in range(8):
+            crc = ((crc << 1) ^ polynomial) & 0xFF if crc & 0x80 else (crc << 1) & 0xFF
+        table[value] = crc
+    return bytes(table)
+
+
+CRC8_TABLE = _crc8_table()
+
+
+class EnOceanESP3Framer:
+    """Incrementally frame ESP3 packets from chunks of a byte stream.
+
+    Received chunks are appended to a buffer; consumed bytes are released once they make up
+    at least half of it, so that a packet is never moved more than twice.
+    """
+
+    __slots__ = ("__buffer", "__offset", "crc_errors", "invalid_packets")
+
+    def __init__(self) -> None:
+        """Construct a framer with an empty buffer."""
+        self.__buffer = bytearray()
+        self.__offset = 0
+        """Start of the bytes not yet consumed."""
+        self.crc_errors = 0
+        """The number of header or data checksum mismatches."""
+        self.invalid_packets = 0
+        """The number of packets with valid checksums which could not be parsed (and were skipped)."""
+
+    @property
+    def buffered(self) -> int:
+        """Return the number of bytes buffered, but not yet framed."""
+        return len(self.__buffer) - self.__offset
+
+    def feed(self, data: bytes | bytearray | memoryview) -> list[Packet]:
+        """Append the data to the buffer and return all packets completed by it."""
+        buffer = self.__buffer
+        buffer += data
+        offset = self.__offset
+        length = len(buffer)
+        table = CRC8_TABLE
+        packets = []
+
+        view = memoryview(buffer)
+        try:
+            while True:
+                offset = buffer.find(SYNC_BYTE, offset)
+                if offset < 0:
+                    # no sync byte, i.e. nothing worth keeping
+                    offset = length
+                    break
+                if length - offset < HEADER_LENGTH:
+                    break
+
+                crc = table[buffer[offset + 1]]
+                crc = table[crc ^ buffer[offset + 2]]
+                crc = table[crc ^ buffer[offset + 3]]
+                crc = table[crc ^ buffer[offset + 4]]
+                if crc != buffer[offset + 5]:
+                    self.crc_errors += 1
+                    offset += 1
+                    continue
+
+                data_start = offset + HEADER_LENGTH
+                optional_start = data_start + (
+                    (buffer[offset + 1] << 8) | buffer[offset + 2]
+                )
+                end = optional_start + buffer[offset + 3]
+                if end >= length:
+                    break
+
+                packet_type = buffer[offset + 4]
+                offset = end + 1
+                crc = 0
+                for byte in view[data_start:end]:
+                    crc = table[crc ^ byte]
+                if crc != buffer[end]:
+                    self.crc_errors += 1
+                    continue
+
+                try:
+                    packet = self.__create_packet(
+                        packet_type,
+                        view[data_start:optional_start].tolist(),
+                        view[optional_start:end].tolist(),
+                    )
+                except Exception:
+                    # e.g. a radio telegram too short for the 'RadioPacket' class
+                    self.invalid_packets += 1
+                    continue
+                packet.received = datetime.datetime.now()
+                packets.append(packet)
+        finally:
+            # the buffer cannot be resized while viewed
+            view.release()
+            if offset >= length:
+                buffer.clear()
+                offset = 0
+            elif offset > length // 2:
+                del buffer[:offset]
+                offset = 0
+            self.__offset = offset
+        return packets
+
+    def clear(self) -> None:
+        """Discard all buffered bytes."""
+        self.__buffer.clear()
+        self.__offset = 0
+
+    @staticmethod
+    def __create_packet(
+        packet_type: int, data: list[int], optional: list[int]
+    ) -> Packet:
+        """Return a packet of the class 'Packet.parse_msg' would create."""
+        if packet_type == PACKET.RADIO_ERP1:
+            if data and data[0] == RORG.UTE:
+                return UTETeachInPacket(packet_type, data, optional)
+            return RadioPacket(packet_type, data, optional)
+        if packet_type == PACKET.RESPONSE:
+            return ResponsePacket(packet_type, data, optional)
+        if packet_type == PACKET.EVENT:
+            return EventPacket(packet_type, data, optional)
+        return Packet(packet_type, data, optional)
@@ -1,30 +1,39 @@
 """Representation of an EnOcean gateway."""
 
+import asyncio
+from collections import deque
+import importlib
 import logging
-from typing import Callable
+import threading
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Callable, Hashable, Iterable, Mapping, Sequence
 
-from enocean.protocol.packet import Packet, RadioPacket
+from enocean.protocol.constants import PACKET
 from enocean.utils import to_hex_string
 
 from .address import EnOceanAddress, EnOceanDeviceAddress
-from .device_factories.a502xx_factory import EnOceanA502XXDeviceFactory
-from .device_factories.a504xx_factory import EnOceanA504XXDeviceFactory
-from .device_factories.a50601_factory import EnOceanA50601DeviceFactory
-from .device_factories.a50703_factory import EnOceanA50703DeviceFactory
-from .device_factories.a50801_factory import EnOceanA50801DeviceFactory
-from .device_factories.a53808_factory import EnOceanA53808DeviceFactory
-from .device_factories.d201xx_factory import EnOceanD201XXDeviceFactory
-from .device_factories.d20500_factory import EnOceanD20500DeviceFactory
-from .device_factories.device_factory import EnOceanDeviceFactory
-from .device_factories.f602xx_factory import EnOceanF602XXDeviceFactory
-from .device_factories.f61000_factory import EnOceanF61000DeviceFactory
+from .asynccommunicator import EnOceanAsyncCommunicator
+from .callback_batcher import EnOceanCallbackBatcher
+from .capture import EnOceanCaptureRecorder
+from .cover_watchdog import EnOceanCoverWatchdog
+from .deduplicator import EnOceanTelegramDeduplicator
+from .device_registration import (
+    EnOceanDeviceConfig,
+    EnOceanDeviceRegistrationFailure,
+    EnOceanDeviceRegistrationResult,
+)
 from .device_type import EnOceanDeviceType
 from .devices.device import EnOceanDevice
 from .devices.gateway_device import EnOceanGatewayDevice
-from .eep import EEP
+from .eep_registry import EnOceanEEPRegistration, get_eep_registry
+from .entity_filter import EnOceanEntityFilterConfig, EnOceanEntityFilterCounters
 from .entity_id import EnOceanEntityID
 from .entity_properties import HomeAssistantEntityProperties
-from .serialcommunicator import EnOceanSerialCommunicator
+from .group_command import EnOceanGroupCommand
+from .link_table import EnOceanLinkTable
+from .response_correlator import RESPONSE_TIMEOUT
+from .sender_ids import EnOceanSenderIDs
+from .transmit_scheduler import EnOceanTransmitPriority, EnOceanTransmitScheduler
 from .types import (
     EnOceanBinarySensorCallback,
     EnOceanCoverCallback,
@@ -36,100 +45,136 @@ from .types import (
     ValueLabelDict,
 )
 
+if TYPE_CHECKING:
+    from enocean.protocol.packet import Packet
+
+    from .serialcommunicator import EnOceanSerialCommunicator
+
 _LOGGER = logging.getLogger(__name__)
 
+type EnOceanCommunicator = EnOceanSerialCommunicator | EnOceanAsyncCommunicator
+"""A communicator with an EnOcean module, either threaded or on the event loop."""
+
 
 class EnOceanHomeAssistantGateway:
     """Representation of an EnOcean gateway for Home Assistant."""
 
-    def __init__(self, serial_path: str, create_task: HomeAssistantTaskCreator) -> None:
-        """Initialize the EnOcean gateway."""
-        self.__communicator: EnOceanSerialCommunicator | None = None
+    def __init__(
+        self,
+        serial_path: str,
+        create_task: HomeAssistantTaskCreator,
+        use_asyncio: bool = False,
+        communicator: EnOceanCommunicator | None = None,
+        diagnostics_interval: float | None = None,
+        callback_batcher: EnOceanCallbackBatcher | None = None,
+        deduplicator: EnOceanTelegramDeduplicator | None = None,
+        transmit_scheduler: EnOceanTransmitScheduler | None = None,
+        cover_watchdog: EnOceanCoverWatchdog | None = None,
+        additional_communicators: Sequence[EnOceanCommunicator] = (),
+        link_table: EnOceanLinkTable | None = None,
+    ) -> None:
+        """Initialize the EnOcean gateway.
+
+        If use_asyncio is set, the serial port is read by an asyncio transport on the event
+        loop (from which start must then be awaited) instead of a separate reader thread.
+        If a communicator is given (e.g. an 'EnOceanReplayCommunicator'), it is used instead
+        of opening serial_path. If a diagnostics_interval is given, the devices' diagnostic
+        sensors are updated at most once per interval (see 'diagnostics_interval'). If a
+        callback_batcher is given, the registered entity callbacks are called in batches on
+        the event loop from which start is awaited, instead of on every received telegram.
+        If a deduplicator is given, copies of a telegram received via repeaters are only used
+        to update the sender's RSSI with the best of all copies, but not dispatched. If a
+        transmit_scheduler is given, outgoing telegrams are queued and paced by it instead
+        of being written to the module immediately. The positions of moving covers are
+        polled by cover_watchdog (by default, an 'EnOceanCoverWatchdog' with default settings).
+
+        Telegrams are additionally received from the additional_communicators (e.g. modules
+        on other floors); copies received by several modules are suppressed (by a default
+        deduplicator, if none is given, which also drops identical telegrams repeated within
+        its window). The link_table (by default, an 'EnOceanLinkTable')
+        records each registered device's RSSI per module, and telegrams to a device are sent
+        via the module with the best recent link among those which may use the device's
+        sender id.
+        """
+        self.__communicator: EnOceanCommunicator | None = None
         try:
-            self.__communicator: EnOceanSerialCommunicator = EnOceanSerialCommunicator(
-                port=serial_path
-            )
+            if communicator is not None:
+                self.__communicator = communicator
+            elif use_asyncio:
+                self.__communicator = EnOceanAsyncCommunicator(port=serial_path)
+            else:
+                # imports the enocean library's communicators and protocol stack
+                from .serialcommunicator import EnOceanSerialCommunicator
+
+                self.__communicator = EnOceanSerialCommunicator(port=serial_path)
             self.__communicator.teach_in = False
         except Exception as e:
-            _LOGGER.error(f"Failed to initialize EnOceanSerialCommunicator: {e}")
+            _LOGGER.error(f"Failed to initialize EnOcean communicator: {e}")
             raise e
 
+        # diagnostic entities of devices added from now on count from this point in time
+        EnOceanDevice.reset_diagnostic_sensor_entities()
+
         self.__base_id: EnOceanAddress = EnOceanAddress(0)
         self.__chip_id: EnOceanAddress = EnOceanAddress(0)
         self.__chip_version: int = 0
         self.__sw_version: str = "n/a"
-        self.__devices: dict[EnOceanDeviceAddress, EnOceanDevice] = {}
+        self.__sender_ids: EnOceanSenderIDs | None = None
+        """Valid sender ids, computed once the chip and base id are known."""
+        self.__devices: dict[int, EnOceanDevice] = {}
+        """Registered devices, keyed by their numeric EnOcean address (as in 'RadioPacket.sender_int')."""
         self.__gateway_device: EnOceanGatewayDevice | None = None
-        self.__create_task: HomeAssistantTaskCreator = create_task
 
-        self.__device_factories: dict[EEP, EnOceanDeviceFactory] = {
-            # A5-02 family
-            EEP(0xA5, 0x02, 0x01): EnOceanA502XXDeviceFactory(),
-            EEP(0xA5, 0x02, 0x02): EnOceanA502XXDeviceFactory(),
-            EEP(0xA5, 0x02, 0x03): EnOceanA502XXDeviceFactory(),
-            EEP(0xA5, 0x02, 0x04): EnOceanA502XXDeviceFactory(),
-            EEP(0xA5, 0x02, 0x05): EnOceanA502XXDeviceFactory(),
-            EEP(0xA5, 0x02, 0x06): EnOceanA502XXDeviceFactory(),
-            EEP(0xA5, 0x02, 0x07): EnOceanA502XXDeviceFactory(),
-            EEP(0xA5, 0x02, 0x08): EnOceanA502XXDeviceFactory(),
-            EEP(0xA5, 0x02, 0x09): EnOceanA502XXDeviceFactory(),
-            EEP(0xA5, 0x02, 0x0A): EnOceanA502XXDeviceFactory(),
-            EEP(0xA5, 0x02, 0x0B): EnOceanA502XXDeviceFactory(),
-            EEP(0xA5, 0x02, 0x10): EnOceanA502XXDeviceFactory(),
-            EEP(0xA5, 0x02, 0x11): EnOceanA502XXDeviceFactory(),
-            EEP(0xA5, 0x02, 0x12): EnOceanA502XXDeviceFactory(),
-            EEP(0xA5, 0x02, 0x13): EnOceanA502XXDeviceFactory(),
-            EEP(0xA5, 0x02, 0x14): EnOceanA502XXDeviceFactory(),
-            EEP(0xA5, 0x02, 0x15): EnOceanA502XXDeviceFactory(),
-            EEP(0xA5, 0x02, 0x16): EnOceanA502XXDeviceFactory(),
-            EEP(0xA5, 0x02, 0x17): EnOceanA502XXDeviceFactory(),
-            EEP(0xA5, 0x02, 0x18): EnOceanA502XXDeviceFactory(),
-            EEP(0xA5, 0x02, 0x19): EnOceanA502XXDeviceFactory(),
-            EEP(0xA5, 0x02, 0x1A): EnOceanA502XXDeviceFactory(),
-            EEP(0xA5, 0x02, 0x1B): EnOceanA502XXDeviceFactory(),
-            EEP(0xA5, 0x02, 0x20): EnOceanA502XXDeviceFactory(),
-            EEP(0xA5, 0x02, 0x30): EnOceanA502XXDeviceFactory(),
-            # A5-04 family
-            EEP(0xA5, 0x04, 0x01): EnOceanA504XXDeviceFactory(),
-            EEP(0xA5, 0x04, 0x02): EnOceanA504XXDeviceFactory(),
-            EEP(0xA5, 0x04, 0x03): EnOceanA504XXDeviceFactory(),
-            EEP(0xA5, 0x04, 0x04): EnOceanA504XXDeviceFactory(),
-            # A5-06-01
-            EEP(0xA5, 0x06, 0x01): EnOceanA50601DeviceFactory(),
-            # A5-07-03
-            EEP(0xA5, 0x07, 0x03): EnOceanA50703DeviceFactory(),
-            # A5-08-01
-            EEP(0xA5, 0x08, 0x01): EnOceanA50801DeviceFactory(),
-            # A5-38-08
-            EEP(0xA5, 0x38, 0x08): EnOceanA53808DeviceFactory(),
-            # F6-02 family
-            EEP(0xF6, 0x02, 0x01): EnOceanF602XXDeviceFactory(),
-            EEP(0xF6, 0x02, 0x02): EnOceanF602XXDeviceFactory(),
-            # F6-10-00
-            EEP(0xF6, 0x10, 0x00): EnOceanF61000DeviceFactory(),
-            # D2-01 family
-            EEP(0xD2, 0x01, 0x01): EnOceanD201XXDeviceFactory(),
-            EEP(0xD2, 0x01, 0x02): EnOceanD201XXDeviceFactory(),
-            EEP(0xD2, 0x01, 0x03): EnOceanD201XXDeviceFactory(),
-            EEP(0xD2, 0x01, 0x04): EnOceanD201XXDeviceFactory(),
-            EEP(0xD2, 0x01, 0x05): EnOceanD201XXDeviceFactory(),
-            EEP(0xD2, 0x01, 0x06): EnOceanD201XXDeviceFactory(),
-            EEP(0xD2, 0x01, 0x07): EnOceanD201XXDeviceFactory(),
-            EEP(0xD2, 0x01, 0x08): EnOceanD201XXDeviceFactory(),
-            EEP(0xD2, 0x01, 0x09): EnOceanD201XXDeviceFactory(),
-            EEP(0xD2, 0x01, 0x0A): EnOceanD201XXDeviceFactory(),
-            EEP(0xD2, 0x01, 0x0B): EnOceanD201XXDeviceFactory(),
-            EEP(0xD2, 0x01, 0x0C): EnOceanD201XXDeviceFactory(),
-            EEP(0xD2, 0x01, 0x0D): EnOceanD201XXDeviceFactory(),
-            EEP(0xD2, 0x01, 0x0E): EnOceanD201XXDeviceFactory(),
-            EEP(0xD2, 0x01, 0x0F): EnOceanD201XXDeviceFactory(),
-            EEP(0xD2, 0x01, 0x10): EnOceanD201XXDeviceFactory(),
-            EEP(0xD2, 0x01, 0x11): EnOceanD201XXDeviceFactory(),
-            EEP(0xD2, 0x01, 0x12): EnOceanD201XXDeviceFactory(),
-            EEP(0xD2, 0x01, 0x13): EnOceanD201XXDeviceFactory(),
-            EEP(0xD2, 0x01, 0x14): EnOceanD201XXDeviceFactory(),
-            EEP(0xD2, 0x05, 0x00): EnOceanD20500DeviceFactory(),
+        # entity listings per platform, maintained when devices are added
+        self.__entity_index: dict[
+            str, dict[EnOceanEntityID, HomeAssistantEntityProperties]
+        ] = {
+            platform: {}
+            for platform in (
+                "binary_sensor",
+                "button",
+                "cover",
+                "light",
+                "number",
+                "select",
+                "sensor",
+                "switch",
+            )
         }
+        self.__entities_version: int = 0
+        self.__entity_snapshots: dict[
+            str, tuple[int, Mapping[EnOceanEntityID, HomeAssistantEntityProperties]]
+        ] = {}
+        self.__create_task: HomeAssistantTaskCreator = create_task
+        self.__diagnostics_interval: float | None = diagnostics_interval
+        self.__flushing_diagnostics = False
+        self.__started = False
+        self.__callback_batcher: EnOceanCallbackBatcher | None = callback_batcher
+        self.__deduplicator: EnOceanTelegramDeduplicator | None = deduplicator
+        self.__transmit_scheduler: EnOceanTransmitScheduler | None = transmit_scheduler
+        self.__cover_watchdog: EnOceanCoverWatchdog = (
+            cover_watchdog or EnOceanCoverWatchdog()
+        )
+
+        # modules: the primary communicator (index 0), followed by the additional ones
+        self.__communicators: tuple[EnOceanCommunicator, ...] = (
+            self.__communicator,
+            *additional_communicators,
+        )
+        self.__module_sender_ids: list[EnOceanSenderIDs | None] = [None] * len(
+            self.__communicators
+        )
+        """Valid sender ids per module, known once the gateway is started."""
+        if additional_communicators:
+            for additional_communicator in additional_communicators:
+                additional_communicator.teach_in = False
+            if self.__deduplicator is None:
+                self.__deduplicator = EnOceanTelegramDeduplicator()
+            if link_table is None:
+                link_table = EnOceanLinkTable()
+        self.__link_table: EnOceanLinkTable | None = link_table
+        self.__receive_lock = threading.Lock()
+        """Serializes the handling of packets received by several modules' reader threads."""
 
         self.legacy_handle_packet_callback: Callable[[Packet], None] | None = None
         """Callback for legacy packet handling in Home Assistant. 
@@ -139,18 +184,64 @@ class EnOceanHomeAssistantGateway:
 
     async def start(self) -> None:
         """Start the EnOcean gateway."""
+        loop = asyncio.get_running_loop()
+        if self.__callback_batcher:
+            self.__callback_batcher.loop = loop
         try:
             if not self.__communicator:
                 raise RuntimeError("EnOcean SerialCommunicator is not initialized.")
-            self.__communicator.start()
-            self.__chip_id = EnOceanAddress(to_hex_string(self.__communicator.chip_id))
-            self.__base_id = EnOceanAddress(to_hex_string(self.__communicator.base_id))
-            self.__chip_version = self.__communicator.version_info.chip_version
+            # the enocean library's protocol stack loads its EEP profiles when imported, so
+            # import it (if not yet done) without blocking the event loop
+            await loop.run_in_executor(
+                None, importlib.import_module, "enocean.protocol.packet"
+            )
+            for communicator in self.__communicators:
+                if isinstance(communicator, EnOceanAsyncCommunicator):
+                    await communicator.start()
+                else:
+                    communicator.start()
+            if self.__transmit_scheduler:
+                self.__transmit_scheduler.start(self.send_and_confirm)
+            self.__cover_watchdog.start()
+
+            # both requests are answered within a single round-trip (per module)
+            responses = await asyncio.gather(
+                *(
+                    request
+                    for communicator in self.__communicators
+                    for request in (
+                        communicator.fetch_version_info(),
+                        communicator.fetch_base_id(),
+                    )
+                )
+            )
+            version_info, base_id = responses[0], responses[1]
+            if version_info is None or base_id is None:
+                raise RuntimeError(
+                    "EnOcean module did not answer CO_RD_VERSION/CO_RD_IDBASE"
+                )
+
+            self.__chip_id = EnOceanAddress(to_hex_string(version_info.chip_id))
+            self.__base_id = EnOceanAddress(to_hex_string(base_id))
+            self.__chip_version = version_info.chip_version
+            self.__sender_ids = EnOceanSenderIDs(self.__chip_id, self.__base_id)
+            self.__module_sender_ids[0] = self.__sender_ids
+            for module in range(1, len(self.__communicators)):
+                module_version_info, module_base_id = responses[
+                    2 * module : 2 * module + 2
+                ]
+                if module_version_info is None or module_base_id is None:
+                    _LOGGER.error(f"Could not identify EnOcean module {module}.")
+                    continue
+                self.__module_sender_ids[module] = EnOceanSenderIDs(
+                    EnOceanAddress(to_hex_string(module_version_info.chip_id)),
+                    EnOceanAddress(to_hex_string(module_base_id)),
+                )
 
             self.__sw_version = (
-                self.__communicator.version_info.app_version.versionString()
+                version_info.app_version.versionString()
                 + " (App), "
-                + self.__communicator.version_info.api_version.versionString()
+                + version_info.api_version.versionString()
                 + " (API)"
             )
         except Exception as e:
@@ -160,26 +251,38 @@ class EnOceanHomeAssistantGateway:
         # add the gateway device
         self.__gateway_device = EnOceanGatewayDevice(
             enocean_id=self.__chip_id,
-            valid_sender_ids=self.valid_sender_ids,
-            base_id=self.valid_sender_ids[1],
+            valid_sender_ids=self.__sender_ids,
+            base_id=self.__sender_ids.base_id_option,
             create_task=self.__create_task,
         )
-        self.__devices[self.__chip_id] = self.__gateway_device
+        self.__devices[self.__chip_id.to_number()] = self.__gateway_device
+        self.__index_device_entities([self.__gateway_device])
 
         # callback needs to be set after initialization
         # in order for chip_id and base_id to be available
-        self.__communicator.callback = self.__handle_packet
+        if len(self.__communicators) == 1:
+            self.__communicator.callback = self.__handle_packet
+        else:
+            for module, communicator in enumerate(self.__communicators):
+                communicator.callback = self.__create_module_callback(module)
 
         for device in self.__devices.values():
             # set device's sender id to base id if not set
             if not device.sender_id:
                 device.sender_id = self.__base_id
 
+        self.__started = True
+        self.__start_flushing_diagnostics()
+
     def stop(self) -> None:
         """Stop the EnOcean gateway."""
-        if self.__communicator:
-            if self.__communicator.is_alive():
-                self.__communicator.stop()
+        self.__started = False
+        self.__cover_watchdog.stop()
+        if self.__transmit_scheduler:
+            self.__transmit_scheduler.stop()
+        for communicator in self.__communicators:
+            if communicator and communicator.is_alive():
+                communicator.stop()
 
     def add_device(
         self,
@@ -188,72 +291,197 @@ class EnOceanHomeAssistantGateway:
         device_name: str | None = None,
         sender_id: EnOceanAddress | None = None,
     ) -> None:
-        """Add a device to the gateway."""
-        if enocean_id not in self.__devices:
-            if device_type.eep not in self.__device_factories:
-                print(
-                    f'No EEP handler for EEP {device_type.eep} found, cannot add device "{device_name}" ({enocean_id.to_string()}).'
+        """Add a device to the gateway.
+
+        A device without a handler for its EEP is skipped with a warning; an exception raised
+        by the handler is logged and re-raised.
+        """
+        result = self.add_devices(
+            [EnOceanDeviceConfig(enocean_id, device_type, device_name, sender_id)]
+        )
+        for failure in result.failed:
+            message = f'{failure.reason}, cannot add device "{device_name}" ({enocean_id.to_string()}).'
+            if failure.error is None:
+                _LOGGER.warning(message)
+                continue
+            _LOGGER.error(message)
+            raise failure.error
+
+    def add_devices(
+        self, configs: Iterable[EnOceanDeviceConfig]
+    ) -> EnOceanDeviceRegistrationResult:
+        """Add several devices to the gateway, updating the entity listings only once.
+
+        All EEPs are validated before any device is created. Devices which are already
+        registered are skipped; devices which cannot be created are reported as failed (with
+        the exception raised by their handler, if any).
+        """
+        result = EnOceanDeviceRegistrationResult()
+
+        registry = get_eep_registry()
+        valid_configs: list[tuple[EnOceanDeviceConfig, EnOceanEEPRegistration]] = []
+        for config in configs:
+            eep = config.device_type.eep
+            if registration := registry.resolve(eep):
+                valid_configs.append((config, registration))
+            else:
+                result.failed.append(
+                    EnOceanDeviceRegistrationFailure(
+                        config, f"No EEP handler for EEP {eep} found"
+                    )
                 )
-                return
 
-            factory = self.__device_factories[device_type.eep]
-            device: EnOceanDevice = factory.create_device(
-                enocean_id=enocean_id,
-                device_type=device_type,
-                send_packet=self._send_packet,
-                device_name=device_name,
-                sender_id=sender_id,
-                create_task=self.__create_task,
-            )
-            self.__devices[enocean_id] = device
+        new_devices: list[EnOceanDevice] = []
+        for config, registration in valid_configs:
+            address = config.enocean_id.to_number()
+            if address in self.__devices:
+                result.skipped.append(config.enocean_id)
+                continue
+
+            try:
+                device = registration.handler_class()(
+                    enocean_id=config.enocean_id,
+                    device_type=config.device_type,
+                    send_packet=self._send_packet,
+                    device_name=config.device_name,
+                    sender_id=config.sender_id,
+                    create_task=self.__create_task,
+                )
+            except Exception as e:
+                result.failed.append(
+                    EnOceanDeviceRegistrationFailure(config, str(e), e)
+                )
+                continue
+
+            if self.__diagnostics_interval is not None:
+                device.coalesce_diagnostics = True
+            if hasattr(device, "cover_watchdog"):
+                # covers reporting their position (without importing their handlers)
+                device.cover_watchdog = self.__cover_watchdog
+            self.__devices[address] = device
+            new_devices.append(device)
+            result.added.append(config.enocean_id)
+
+        if new_devices:
+            self.__index_device_entities(new_devices)
+
+        return result
 
     def register_binary_sensor_callback(
         self, entity_id: EnOceanEntityID, callback: EnOceanBinarySensorCallback
     ) -> None:
         """Register a callback for a binary sensor entity."""
-        self.__devices[entity_id.device_address]._binary_sensor_callbacks[
-            entity_id.unique_id
-        ] = callback
+        self.__devices[entity_id.device_address.to_number()].register_callback(
+            "binary_sensor", entity_id.unique_id, self.__deliver(callback)
+        )
 
     def register_cover_callback(
         self, entity_id: EnOceanEntityID, callback: EnOceanCoverCallback
     ) -> None:
         """Register a callback for a cover entity."""
-        self.__devices[entity_id.device_address]._cover_callbacks[
-            entity_id.unique_id
-        ] = callback
+        self.__devices[entity_id.device_address.to_number()].register_callback(
+            "cover", entity_id.unique_id, self.__deliver(callback)
+        )
 
     def register_event_callback(
         self, entity_id: EnOceanEntityID, callback: EnOceanEventCallback
     ) -> None:
         """Register a callback for an event entity."""
-        self.__devices[entity_id.device_address]._event_callbacks[
-            entity_id.unique_id
-        ] = callback
+        self.__devices[entity_id.device_address.to_number()].register_callback(
+            "event", entity_id.unique_id, self.__deliver(callback)
+        )
 
     def register_sensor_callback(
         self, entity_id: EnOceanEntityID, callback: EnOceanSensorCallback
     ) -> None:
         """Register a callback for a sensor entity."""
-        self.__devices[entity_id.device_address]._sensor_callbacks[
-            entity_id.unique_id
-        ] = callback
+        self.__devices[entity_id.device_address.to_number()].register_callback(
+            "sensor", entity_id.unique_id, self.__deliver(callback)
+        )
 
     def register_switch_callback(
         self, entity_id: EnOceanEntityID, callback: EnOceanSwitchCallback
     ) -> None:
         """Register a callback for a switch entity."""
-        self.__devices[entity_id.device_address]._switch_callbacks[
-            entity_id.unique_id
-        ] = callback
+        self.__devices[entity_id.device_address.to_number()].register_callback(
+            "switch", entity_id.unique_id, self.__deliver(callback)
+        )
 
     def register_light_callback(
         self, entity_id: EnOceanEntityID, callback: EnOceanLightCallback
     ) -> None:
         """Register a callback for a light entity."""
-        self.__devices[entity_id.device_address]._light_callbacks[
-            entity_id.unique_id
-        ] = callback
+        self.__devices[entity_id.device_address.to_number()].register_callback(
+            "light", entity_id.unique_id, self.__deliver(callback)
+        )
+
+    def __deliver(self, callback: Callable) -> Callable:
+        """Return the callback to be registered with a device (batched, if configured)."""
+        if self.__callback_batcher:
+            return self.__callback_batcher.wrap(callback)
+        return callback
+
+    @property
+    def transmit_scheduler(self) -> EnOceanTransmitScheduler | None:
+        """Return the scheduler of outgoing telegrams (if any)."""
+        return self.__transmit_scheduler
+
+    @property
+    def communicators(
+        self,
+    ) -> tuple[EnOceanCommunicator, ...]:
+        """Return the communicators of all modules, starting with the primary one."""
+        return self.__communicators
+
+    @property
+    def link_table(self) -> EnOceanLinkTable | None:
+        """Return the table of each device's RSSI per module (if any)."""
+        return self.__link_table
+
+    @property
+    def cover_watchdog(self) -> EnOceanCoverWatchdog:
+        """Return the watchdog polling the position of moving covers."""
+        return self.__cover_watchdog
+
+    @property
+    def deduplicator(self) -> EnOceanTelegramDeduplicator | None:
+        """Return the deduplicator of telegrams received via repeaters (if any)."""
+        return self.__deduplicator
+
+    @property
+    def callback_batcher(self) -> EnOceanCallbackBatcher | None:
+        """Return the batcher delivering the entity callbacks (if any)."""
+        return self.__callback_batcher
+
+    # Entity filters
+    def set_binary_sensor_filter(
+        self, entity_id: EnOceanEntityID, config: EnOceanEntityFilterConfig | None
+    ) -> None:
+        """Suppress unchanged updates of a binary sensor entity (None to forward all updates)."""
+        self.__devices[entity_id.device_address.to_number()].set_entity_filter(
+            "binary_sensor", entity_id.unique_id, config
+        )
+
+    def set_sensor_filter(
+        self, entity_id: EnOceanEntityID, config: EnOceanEntityFilterConfig | None
+    ) -> None:
+        """Suppress unchanged updates of a sensor entity (None to forward all updates)."""
+        self.__devices[entity_id.device_address.to_number()].set_entity_filter(
+            "sensor", entity_id.unique_id, config
+        )
+
+    def get_filter_counters(
+        self,
+    ) -> dict[tuple[str, EnOceanEntityID], EnOceanEntityFilterCounters]:
+        """Return the forwarded and suppressed updates of all filtered entities, keyed by (platform, entity id)."""
+        return {
+            (
+                platform,
+                EnOceanEntityID(device.enocean_id, entity_uid),
+            ): entity_filter.counters
+            for device in self.__devices.values()
+            for (platform, entity_uid), entity_filter in device.entity_filters().items()
+        }
 
     @property
     def base_id(self) -> EnOceanAddress:
@@ -266,38 +494,82 @@ class EnOceanHomeAssistantGateway:
         return self.__chip_id
 
     @property
-    def valid_sender_ids(self) -> list[ValueLabelDict]:
-        """Returns a list of valid sender ids."""
-
-        if not self.__base_id or not self.__chip_id:
-            return []
-
-        valid_senders = [
-            ValueLabelDict(
-                value=self.__chip_id.to_string(),
-                label="Chip ID (" + self.__chip_id.to_string() + ")",
-            ),
-            ValueLabelDict(
-                value=self.__base_id.to_string(),
-                label="Base ID (" + self.__base_id.to_string() + ")",
-            ),
-        ]
-        base_id_int = self.__base_id.to_number()
-        valid_senders.extend(
-            [
-                ValueLabelDict(
-                    value=EnOceanAddress(base_id_int + i).to_string(),
-                    label="Base ID + "
-                    + "{:03d}".format(i)
-                    + " ("
-                    + EnOceanAddress(base_id_int + i).to_string()
-                    + ")",
-                )
-                for i in range(1, 128)
-            ]
-        )
+    def valid_sender_ids(self) -> tuple[ValueLabelDict, ...]:
+        """Returns the valid sender ids (chip id, base id, base id + 1, ..., base id + 127)."""
+        if not self.__sender_ids:
+            return ()
+        return self.__sender_ids.options
+
+    @property
+    def sender_ids(self) -> EnOceanSenderIDs | None:
+        """Returns the table of valid sender ids (None until the gateway is started)."""
+        return self.__sender_ids
 
-        return valid_senders
+    def is_valid_sender_id(self, address: EnOceanAddress) -> bool:
+        """Check whether the gateway may send telegrams using the given address."""
+        return self.__sender_ids is not None and address in self.__sender_ids
+
+    # Diagnostics
+    @property
+    def diagnostics_interval(self) -> float | None:
+        """Return the interval (in seconds) at which diagnostic sensors are updated.
+
+        None means that the 'rssi', 'telegrams_received' and 'last_seen' sensors of a device
+        are updated on every telegram. Otherwise, the values are only collected per device and
+        reported every interval (and by 'flush_diagnostics'), for devices which were seen since.
+        """
+        return self.__diagnostics_interval
+
+    @diagnostics_interval.setter
+    def diagnostics_interval(self, interval: float | None) -> None:
+        """Set the interval (in seconds) at which diagnostic sensors are updated (None = on every telegram)."""
+        if interval is not None and interval <= 0:
+            raise ValueError("Diagnostics interval must be positive.")
+        if interval is None and self.__diagnostics_interval is not None:
+            self.flush_diagnostics()
+        self.__diagnostics_interval = interval
+        for device in self.__devices.values():
+            device.coalesce_diagnostics = interval is not None
+        self.__start_flushing_diagnostics()
+
+    def flush_diagnostics(self) -> int:
+        """Update the diagnostic sensors of all devices seen since their last update.
+
+        Returns the number of updated devices.
+        """
+        return sum(device.flush_diagnostics() for device in self.__devices.values())
+
+    def __start_flushing_diagnostics(self) -> None:
+        """Start the periodic update of diagnostic sensors (if coalesced and not yet running)."""
+        if (
+            self.__started
+            and self.__diagnostics_interval is not None
+            and not self.__flushing_diagnostics
+        ):
+            self.__flushing_diagnostics = True
+            self.__create_task(
+                self.__flush_diagnostics_periodically(), "EnOcean diagnostics"
+            )
+
+    async def __flush_diagnostics_periodically(self) -> None:
+        """Update the diagnostic sensors every interval until stopped or set to None."""
+        try:
+            while self.__started and self.__diagnostics_interval is not None:
+                await asyncio.sleep(self.__diagnostics_interval)
+                if self.__started:
+                    self.flush_diagnostics()
+        finally:
+            self.__flushing_diagnostics = False
+
+    @property
+    def recorder(self) -> EnOceanCaptureRecorder | None:
+        """Return the recorder for the data exchanged with the EnOcean module."""
+        return self.__communicator.recorder
+
+    @recorder.setter
+    def recorder(self, recorder: EnOceanCaptureRecorder | None) -> None:
+        """Record the data exchanged with the EnOcean module (None to stop recording)."""
+        self.__communicator.recorder = recorder
 
     @property
     def chip_version(self) -> int:
@@ -311,21 +583,91 @@ class EnOceanHomeAssistantGateway:
 
     def get_device_properties(self, enocean_id: EnOceanAddress) -> EnOceanDevice | None:
         """Return the device properties for a given EnOcean ID."""
-        return self.__devices.get(enocean_id)
+        return self.__devices.get(enocean_id.to_number())
 
-    def legacy_send_packet(self, packet: Packet) -> None:
+    def legacy_send_packet(self, packet: "Packet") -> None:
         """Send a packet through the EnOcean gateway (legacy method).
 
         This method is intended to provide compatibility with legacy Home Assistant EnOcean integration code and will be removed in the future."""
         self._send_packet(packet)
 
-    def _send_packet(self, packet: Packet) -> None:
-        """Send a packet through the EnOcean gateway."""
-        self.__communicator.send(packet)
+    async def send_and_confirm(
+        self, packet: "Packet", timeout: float = RESPONSE_TIMEOUT
+    ) -> int | None:
+        """Send a packet to the module and wait for its response.
+
+        The packet is sent immediately, bypassing the transmit scheduler (if any). Return the
+        module's return code (see 'RETURN_CODE', e.g. 0 for OK or 2 for NOT_SUPPORTED), or
+        None if the module did not answer within timeout seconds.
+        """
+        response = await self.__route(packet).request(packet, timeout)
+        if response is None:
+            return None
+        return response.response
+
+    def _send_packet(
+        self,
+        packet: "Packet",
+        priority: EnOceanTransmitPriority = EnOceanTransmitPriority.COMMAND,
+        coalesce_key: Hashable | None = None,
+    ) -> None:
+        """Send a packet through the EnOcean gateway.
+
+        With a transmit scheduler, the packet is queued with the given priority; a queued
+        packet with the same coalesce key is replaced. Otherwise, both are ignored.
+        """
+        if self.__transmit_scheduler:
+            self.__transmit_scheduler.submit(packet, priority, coalesce_key)
+        else:
+            self.__route(packet).send(packet)
+
+    def __route(self, packet: "Packet") -> EnOceanCommunicator:
+        """Return the communicator of the module via which the packet is sent.
+
+        Among the modules which may send with the packet's sender id, this is the one with
+        the best recent link to the destination; the primary module if there is none.
+        """
+        if len(self.__communicators) == 1 or packet.packet_type != PACKET.RADIO_ERP1:
+            return self.__communicator
+
+        sender = EnOceanAddress(int.from_bytes(bytes(packet.data[-5:-1])))
+        candidates = [
+            module
+            for module, sender_ids in enumerate(self.__module_sender_ids)
+            if sender_ids is not None and sender in sender_ids
+        ]
+        if not candidates:
+            return self.__communicator
+        destination = int.from_bytes(bytes(packet.optional[1:5]))
+        module = self.__link_table.best_module(destination, candidates)
+        return self.__communicators[candidates[0] if module is None else module]
+
+    def __create_module_callback(self, module: int) -> Callable[["Packet"], None]:
+        """Return the callback for packets received by the module with the given index."""
+
+        def handle_module_packet(packet: "Packet") -> None:
+            with self.__receive_lock:
+                self.__handle_packet(packet, module)
 
-    def __handle_packet(self, packet: Packet) -> None:
-        """Handle incoming EnOcean packet."""
-        if not isinstance(packet, RadioPacket):
+        return handle_module_packet
+
+    def __handle_packet(self, packet: "Packet", module: int = 0) -> None:
+        """Handle incoming EnOcean packet (received by the module with the given index)."""
+        if packet.packet_type != PACKET.RADIO_ERP1:
+            return
+
+        # only links to registered devices are used for sending, so neighbours' devices
+        # do not fill the link table
+        if self.__link_table and packet.sender_int in self.__devices:
+            self.__link_table.update(packet.sender_int, module, packet.dBm)
+
+        # copies received via repeaters only contribute their RSSI
+        if (
+            self.__deduplicator
+            and (best_rssi := self.__deduplicator.check(packet)) is not None
+        ):
+            if device := self.__devices.get(packet.sender_int):
+                device.update_best_rssi(best_rssi)
             return
 
         # in learning mode, let the gateway device handle the packet
@@ -336,7 +678,7 @@ class EnOceanHomeAssistantGateway:
                 return
 
         # else, find the device corresponding to the sender address
-        if device := self.__devices.get(EnOceanAddress(packet.sender_hex)):
+        if device := self.__devices.get(packet.sender_int):
             device.handle_packet(packet)
 
         # additionally, if a legacy callback is set, call it
@@ -345,137 +687,93 @@ class EnOceanHomeAssistantGateway:
 
     # Entity listings
     @property
-    def binary_sensor_entities(
-        self,
-    ) -> list[EnOceanEntityID, HomeAssistantEntityProperties]:
-        """Return the list of binary sensor entities."""
-        entities = {}
-
-        # iterate over all devices and get their binary sensor entities
-        for device in self.__devices.values():
-            for entity in device.binary_sensor_entities:
-                entity_id = EnOceanEntityID(
-                    device_address=device.enocean_id,
-                    unique_id=entity.unique_id,
-                )
-                entities[entity_id] = entity
-
+    def entities_version(self) -> int:
+        """Return the version of the entity listings, which changes whenever devices are added."""
+        return self.__entities_version
+
+    def __index_device_entities(self, devices: Iterable[EnOceanDevice]) -> None:
+        """Add the devices' entities to the per-platform entity index."""
+        for platform, entities in self.__entity_index.items():
+            for device in devices:
+                for entity in getattr(device, platform + "_entities"):
+                    entity_id = EnOceanEntityID(
+                        device_address=device.enocean_id,
+                        unique_id=entity.unique_id,
+                    )
+                    entities[entity_id] = entity
+
+        self.__entities_version += 1
+
+    def __get_entities(
+        self, platform: str
+    ) -> Mapping[EnOceanEntityID, HomeAssistantEntityProperties]:
+        """Return a read-only snapshot of a platform's entities, which is only rebuilt when devices were added."""
+        version, entities = self.__entity_snapshots.get(platform, (-1, None))
+        if version != self.__entities_version:
+            entities = MappingProxyType(dict(self.__entity_index[platform]))
+            self.__entity_snapshots[platform] = (self.__entities_version, entities)
         return entities
 
     @property
-    def button_entities(self) -> list[EnOceanEntityID, HomeAssistantEntityProperties]:
-        """Return the list of button entities."""
-        entities = {}
-
-        # iterate over all devices and get their button entities
-        for device in self.__devices.values():
-            for entity in device.button_entities:
-                entity_id = EnOceanEntityID(
-                    device_address=device.enocean_id,
-                    unique_id=entity.unique_id,
-                )
-                entities[entity_id] = entity
-
-        return entities
+    def binary_sensor_entities(
+        self,
+    ) -> Mapping[EnOceanEntityID, HomeAssistantEntityProperties]:
+        """Return the binary sensor entities."""
+        return self.__get_entities("binary_sensor")
 
     @property
-    def cover_entities(self) -> list[EnOceanEntityID, HomeAssistantEntityProperties]:
-        """Return the list of cover entities."""
-        entities = {}
-
-        # iterate over all devices and get their cover entities
-        for device in self.__devices.values():
-            for entity in device.cover_entities:
-                entity_id = EnOceanEntityID(
-                    device_address=device.enocean_id,
-                    unique_id=entity.unique_id,
-                )
-                entities[entity_id] = entity
-
-        return entities
+    def button_entities(
+        self,
+    ) -> Mapping[EnOceanEntityID, HomeAssistantEntityProperties]:
+        """Return the button entities."""
+        return self.__get_entities("button")
 
     @property
-    def number_entities(self) -> list[EnOceanEntityID, HomeAssistantEntityProperties]:
-        """Return the list of number entities."""
-        entities = {}
-
-        # iterate over all devices and get their number entities
-        for device in self.__devices.values():
-            for entity in device.number_entities:
-                entity_id = EnOceanEntityID(
-                    device_address=device.enocean_id,
-                    unique_id=entity.unique_id,
-                )
-                entities[entity_id] = entity
-
-        return entities
+    def cover_entities(
+        self,
+    ) -> Mapping[EnOceanEntityID, HomeAssistantEntityProperties]:
+        """Return the cover entities."""
+        return self.__get_entities("cover")
 
     @property
-    def select_entities(self) -> list[EnOceanEntityID, HomeAssistantEntityProperties]:
-        """Return the list of select entities."""
-        entities = {}
-        # iterate over all devices and get their select entities
-        for device in self.__devices.values():
-            for entity in device.select_entities:
-                entity_id = EnOceanEntityID(
-                    device_address=device.enocean_id,
-                    unique_id=entity.unique_id,
-                )
-                entities[entity_id] = entity
-
-        return entities
+    def number_entities(
+        self,
+    ) -> Mapping[EnOceanEntityID, HomeAssistantEntityProperties]:
+        """Return the number entities."""
+        return self.__get_entities("number")
 
     @property
-    def sensor_entities(self) -> list[EnOceanEntityID, HomeAssistantEntityProperties]:
-        """Return the list of sensor entities."""
-        entities = {}
-        # iterate over all devices and get their sensor entities
-        for device in self.__devices.values():
-            for entity in device.sensor_entities:
-                entity_id = EnOceanEntityID(
-                    device_address=device.enocean_id,
-                    unique_id=entity.unique_id,
-                )
-                entities[entity_id] = entity
-
-        return entities
+    def select_entities(
+        self,
+    ) -> Mapping[EnOceanEntityID, HomeAssistantEntityProperties]:
+        """Return the select entities."""
+        return self.__get_entities("select")
 
     @property
-    def switch_entities(self) -> list[EnOceanEntityID, HomeAssistantEntityProperties]:
-        """Return the list of switch entities."""
-        entities = {}
-
-        # iterate over all devices and get their switch entities
-        for device in self.__devices.values():
-            for entity in device.switch_entities:
-                entity_id = EnOceanEntityID(
-                    device_address=device.enocean_id,
-                    unique_id=entity.unique_id,
-                )
-                entities[entity_id] = entity
-
-        return entities
+    def sensor_entities(
+        self,
+    ) -> Mapping[EnOceanEntityID, HomeAssistantEntityProperties]:
+        """Return the sensor entities."""
+        return self.__get_entities("sensor")
 
     @property
-    def light_entities(self) -> list[EnOceanEntityID, HomeAssistantEntityProperties]:
-        """Return the list of light entities."""
-        entities = {}
-
-        # iterate over all devices and get their light entities
-        for device in self.__devices.values():
-            for entity in device.light_entities:
-                entity_id = EnOceanEntityID(
-                    device_address=device.enocean_id,
-                    unique_id=entity.unique_id,
-                )
-                entities[entity_id] = entity
+    def switch_entities(
+        self,
+    ) -> Mapping[EnOceanEntityID, HomeAssistantEntityProperties]:
+        """Return the switch entities."""
+        return self.__get_entities("switch")
 
-        return entities
+    @property
+    def light_entities(
+        self,
+    ) -> Mapping[EnOceanEntityID, HomeAssistantEntityProperties]:
+        """Return the light entities."""
+        return self.__get_entities("light")
 
     # button commands
     def press_button(self, enocean_entity_id: EnOceanEntityID) -> None:
         """Press a button entity."""
-        if device := self.__devices.get(enocean_entity_id.device_address):
+        if device := self.__devices.get(enocean_entity_id.device_address.to_number()):
             device.press_button(entity_uid=enocean_entity_id.unique_id)
 
     # cover commands
@@ -483,27 +781,58 @@ class EnOceanHomeAssistantGateway:
         self, enocean_entity_id: EnOceanEntityID, position: int
     ) -> None:
         """Set the position of a cover device (0 = closed, 100 = open)."""
-        if device := self.__devices.get(enocean_entity_id.device_address):
+        if device := self.__devices.get(enocean_entity_id.device_address.to_number()):
             device.set_cover_position(
                 entity_uid=enocean_entity_id.unique_id, position=position
             )
 
     def query_cover_position(self, enocean_entity_id: EnOceanEntityID) -> None:
         """Query the position of a cover device."""
-        if device := self.__devices.get(enocean_entity_id.device_address):
+        if device := self.__devices.get(enocean_entity_id.device_address.to_number()):
             device.query_cover_position(entity_uid=enocean_entity_id.unique_id)
 
     def stop_cover(self, enocean_entity_id: EnOceanEntityID) -> None:
         """Stop a cover device."""
-        if device := self.__devices.get(enocean_entity_id.device_address):
+        if device := self.__devices.get(enocean_entity_id.device_address.to_number()):
             device.stop_cover(entity_uid=enocean_entity_id.unique_id)
 
+    # group commands
+    def send_group(self, commands: Iterable[EnOceanGroupCommand]) -> int:
+        """Send commands to many entities at once, e.g. to close all covers.
+
+        The telegrams are built from pre-encoded templates and sent round-robin per device,
+        so that consecutive telegrams address different devices. With a transmit scheduler,
+        they are queued at once and sent as fast as its pacing allows. Commands to unknown
+        entities or with unsupported actions are skipped; return the number of sent commands.
+        """
+        queues: dict[int, deque[EnOceanGroupCommand]] = {}
+        for command in commands:
+            address = command.entity_id.device_address.to_number()
+            if address in self.__devices:
+                queues.setdefault(address, deque()).append(command)
+            else:
+                _LOGGER.warning(f"Skipping group command to unknown entity {command}.")
+
+        sent = 0
+        while queues:
+            for address, queue in list(queues.items()):
+                command = queue.popleft()
+                if not queue:
+                    del queues[address]
+                if self.__devices[address].send_group_command(
+                    command.entity_id.unique_id, command.action, command.value
+                ):
+                    sent += 1
+                else:
+                    _LOGGER.warning(f"Skipping unsupported group command {command}.")
+        return sent
+
     # number commands
     def set_number_value(
         self, enocean_entity_id: EnOceanEntityID, value: float
     ) -> None:
         """Set the value of a number entity."""
-        if device := self.__devices.get(enocean_entity_id.device_address):
+        if device := self.__devices.get(enocean_entity_id.device_address.to_number()):
             device.set_number_value(entity_uid=enocean_entity_id.unique_id, value=value)
 
     # light commands
@@ -514,7 +843,7 @@ class EnOceanHomeAssistantGateway:
         color_temp_kelvin: int | None = None,
     ) -> None:
         """Turn on a light device."""
-        if device := self.__devices.get(enocean_entity_id.device_address):
+        if device := self.__devices.get(enocean_entity_id.device_address.to_number()):
             device.light_turn_on(
                 entity_uid=enocean_entity_id.unique_id,
                 brightness=brightness,
@@ -523,22 +852,22 @@ class EnOceanHomeAssistantGateway:
 
     def light_turn_off(self, enocean_entity_id: EnOceanEntityID) -> None:
         """Turn off a light device."""
-        if device := self.__devices.get(enocean_entity_id.device_address):
+        if device := self.__devices.get(enocean_entity_id.device_address.to_number()):
             device.light_turn_off(entity_uid=enocean_entity_id.unique_id)
 
     # select commands
     def select_option(self, enocean_entity_id: EnOceanEntityID, option: str) -> None:
         """Set the option of a select entity."""
-        if device := self.__devices.get(enocean_entity_id.device_address):
+        if device := self.__devices.get(enocean_entity_id.device_address.to_number()):
             device.select_option(entity_uid=enocean_entity_id.unique_id, option=option)
 
     # switch commands
     def switch_turn_on(self, enocean_entity_id: EnOceanEntityID) -> None:
         """Turn on a switch device."""
-        if device := self.__devices.get(enocean_entity_id.device_address):
+        if device := self.__devices.get(enocean_entity_id.device_address.to_number()):
             device.switch_turn_on(entity_uid=enocean_entity_id.unique_id)
 
     def switch_turn_off(self, enocean_entity_id: EnOceanEntityID) -> None:
         """Turn off a switch device."""
-        if device := self.__devices.get(enocean_entity_id.device_address):
+        if device := self.__devices.get(enocean_entity_id.device_address.to_number()):
             device.switch_turn_off(entity_uid=enocean_entity_id.unique_id)
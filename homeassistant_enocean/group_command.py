@@ -0,0 +1,35 @@
+"""Commands sent to many entities at once (see 'EnOceanHomeAssistantGateway.send_group')."""
+
+from enum import Enum
+from typing import NamedTuple
+
+from .entity_id import EnOceanEntityID
+
+
+class EnOceanGroupAction(Enum):
+    """The actions of a group command."""
+
+    TURN_ON = 1
+    """Turn on a switch or light (with the brightness as value, if given)."""
+
+    TURN_OFF = 2
+    """Turn off a switch or light."""
+
+    SET_POSITION = 3
+    """Move a cover to the position given as value (0 = closed, 100 = open)."""
+
+    STOP = 4
+    """Stop a cover."""
+
+
+class EnOceanGroupCommand(NamedTuple):
+    """A command to one entity as part of a group command."""
+
+    entity_id: EnOceanEntityID
+    """The entity to which the command is sent."""
+
+    action: EnOceanGroupAction
+    """The action to be performed."""
+
+    value: int | None = None
+    """The brightness (1..255) for TURN_ON of a light or the position for SET_POSITION."""
@@ -0,0 +1,57 @@
+"""Signal strength of the links between devices and several EnOcean modules."""
+
+import time
+from typing import Iterable
+
+
+class EnOceanLinkTable:
+    """Recent signal strength (RSSI) of each device per receiving module.
+
+    Modules are identified by their index in the gateway's communicators (0 being the
+    primary one). A device's RSSI at a module is the last one received there; entries
+    older than 'max_age' seconds are not considered when choosing a module for sending.
+    """
+
+    def __init__(self, max_age: float = 600.0) -> None:
+        """Construct an empty link table with the maximum age (in seconds) of a usable entry."""
+        if max_age <= 0:
+            raise ValueError("Maximum age must be positive.")
+        self.__max_age = max_age
+        self.__links: dict[int, dict[int, tuple[int, float]]] = {}
+        """(RSSI, time received) per module index, per numeric device address."""
+
+    @property
+    def max_age(self) -> float:
+        """Return the maximum age (in seconds) of an entry used for choosing a module."""
+        return self.__max_age
+
+    def update(self, address: int, module: int, rssi: int) -> None:
+        """Record the RSSI (in dBm) of a telegram of the device received by the module."""
+        links = self.__links.get(address)
+        if links is None:
+            links = self.__links[address] = {}
+        links[module] = (rssi, time.monotonic())
+
+    def rssi(self, address: int) -> dict[int, int]:
+        """Return the last RSSI (in dBm) of the device per module index."""
+        return {
+            module: rssi for module, (rssi, _) in self.__links.get(address, {}).items()
+        }
+
+    def best_module(self, address: int, candidates: Iterable[int]) -> int | None:
+        """Return the candidate module with the best recent link to the device (None if unknown)."""
+        links = self.__links.get(address)
+        if not links:
+            return None
+
+        oldest = time.monotonic() - self.__max_age
+        best_module = None
+        best_rssi = None
+        for module in candidates:
+            link = links.get(module)
+            if link is None or link[1] < oldest:
+                continue
+            if best_rssi is None or link[0] > best_rssi:
+                best_module = module
+                best_rssi = link[0]
+        return best_module
@@ -0,0 +1,196 @@
+"""Replay of recorded ESP3 captures (see capture.py) into a gateway, without an EnOcean module.
+
+Received data ('rx' records) is fed into the same protocol as used for a serial port, either
+in real-time (scaled by a speed factor) or as fast as possible. Sent data ('tx' records) is
+not compared, but the replay waits until the gateway has written as many chunks as recorded
+before continuing, so that responses are only delivered after their commands have been sent.
+"""
+
+import asyncio
+import logging
+from typing import TYPE_CHECKING, Iterable
+
+from enocean.protocol.constants import PACKET
+
+from .asynccommunicator import EnOceanAsyncCommunicator, EnOceanSerialProtocol
+from .capture import TX, CaptureRecord
+from .response_correlator import RESPONSE_TIMEOUT
+
+if TYPE_CHECKING:
+    from enocean.protocol.packet import Packet
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class EnOceanReplayTransport(asyncio.Transport):
+    """asyncio transport feeding recorded data into a protocol."""
+
+    yield_interval: int = 64
+    """Number of records after which a replay at maximum speed yields to the event loop."""
+
+    def __init__(
+        self, loop: asyncio.AbstractEventLoop, protocol: asyncio.Protocol
+    ) -> None:
+        """Construct the transport and schedule the protocol's connection_made callback."""
+        super().__init__()
+        self._loop = loop
+        self._protocol = protocol
+        self._closing = False
+        self._writes = 0
+        self._written = asyncio.Event()
+        self._tasks: set[asyncio.Task] = set()
+
+        self._loop.call_soon(self._protocol.connection_made, self)
+
+    @property
+    def writes(self) -> int:
+        """Return the number of chunks written to the transport."""
+        return self._writes
+
+    async def replay(
+        self,
+        records: Iterable[CaptureRecord],
+        speed: float | None = 1.0,
+        tx_timeout: float = RESPONSE_TIMEOUT,
+    ) -> int:
+        """Replay the records and return the number of received chunks delivered.
+
+        With speed None, the timestamps are ignored and the records are delivered as fast
+        as possible. Otherwise, they are delivered in real-time, divided by speed.
+        """
+        start = self._loop.time()
+        expected_writes = self._writes
+        delivered = 0
+        for record in records:
+            if self._closing:
+                break
+
+            if record.direction == TX:
+                expected_writes += 1
+                await self._wait_for_writes(expected_writes, tx_timeout)
+                continue
+
+            if speed:
+                delay = start + record.timestamp / speed - self._loop.time()
+                if delay > 0:
+                    await asyncio.sleep(delay)
+            elif delivered % self.yield_interval == 0:
+                await asyncio.sleep(0)
+
+            self._protocol.data_received(record.data)
+            delivered += 1
+
+        return delivered
+
+    def start_replay(
+        self, records: Iterable[CaptureRecord], speed: float | None = 1.0
+    ) -> asyncio.Task[int]:
+        """Replay the records in a background task (cancelled when the transport is closed)."""
+        task = self._loop.create_task(self.replay(records, speed))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+        return task
+
+    async def _wait_for_writes(self, expected_writes: int, timeout: float) -> None:
+        while self._writes < expected_writes:
+            self._written.clear()
+            try:
+                await asyncio.wait_for(self._written.wait(), timeout)
+            except TimeoutError:
+                _LOGGER.warning(
+                    "Replay continues although the gateway did not send the recorded data."
+                )
+                return
+
+    def write(self, data: bytes | bytearray) -> None:
+        """Count the written data; it is not sent anywhere."""
+        if self._closing:
+            return
+        self._writes += 1
+        self._written.set()
+
+    def can_write_eof(self) -> bool:
+        return False
+
+    def is_closing(self) -> bool:
+        return self._closing
+
+    def get_protocol(self) -> asyncio.Protocol:
+        return self._protocol
+
+    def set_protocol(self, protocol: asyncio.Protocol) -> None:
+        self._protocol = protocol
+
+    def close(self) -> None:
+        """Stop replaying and close the transport."""
+        if self._closing:
+            return
+        self._closing = True
+        for task in self._tasks:
+            task.cancel()
+        self._loop.call_soon(self._protocol.connection_lost, None)
+
+    def abort(self) -> None:
+        self.close()
+
+
+class EnOceanReplayCommunicator(EnOceanAsyncCommunicator):
+    """Communicator replaying a capture instead of reading from a serial port.
+
+    The given records are replayed as soon as the communicator is started, so a capture
+    should start with the module's responses to the gateway's start-up commands (as recorded
+    from a real gateway). Telegrams received before a callback is set are held back and
+    delivered once it is set, so that they are not lost at maximum speed. Further captures
+    can be replayed with 'replay'.
+    """
+
+    def __init__(
+        self, records: Iterable[CaptureRecord] = (), speed: float | None = 1.0
+    ) -> None:
+        """Construct the communicator for the given records and speed (None for maximum speed)."""
+        super().__init__(port=None)
+        self._records = list(records)
+        self._speed = speed
+        self._held: list[Packet] = []
+        self._initial_replay: asyncio.Task[int] | None = None
+
+    def _create_transport(
+        self, loop: asyncio.AbstractEventLoop, protocol: EnOceanSerialProtocol
+    ) -> EnOceanReplayTransport:
+        transport = EnOceanReplayTransport(loop, protocol)
+        self._initial_replay = transport.start_replay(self._records, self._speed)
+        return transport
+
+    @property
+    def transport(self) -> EnOceanReplayTransport | None:
+        """Return the replay transport (None, if not yet started)."""
+        return self._transport
+
+    @EnOceanAsyncCommunicator.callback.setter
+    def callback(self, callback) -> None:
+        """Set the callback for received packets and deliver the packets held back so far."""
+        self._callback = callback
+        if callback:
+            held, self._held = self._held, []
+            for packet in held:
+                callback(packet)
+
+    def _packet_received(self, packet: "Packet") -> None:
+        if packet.packet_type != PACKET.RESPONSE and not self._callback:
+            self._held.append(packet)
+            return
+        super()._packet_received(packet)
+
+    async def wait_replayed(self) -> int:
+        """Wait until the records given on construction are replayed; return the number of received chunks."""
+        if self._initial_replay is None:
+            raise RuntimeError("Replay communicator is not started.")
+        return await self._initial_replay
+
+    async def replay(
+        self, records: Iterable[CaptureRecord], speed: float | None = None
+    ) -> int:
+        """Replay further records (by default at maximum speed); return the number of received chunks."""
+        if self._transport is None:
+            raise RuntimeError("Replay communicator is not started.")
+        return await self._transport.replay(records, speed)
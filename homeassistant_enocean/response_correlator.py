@@ -0,0 +1,166 @@
+"""Correlation of ESP3 RESPONSE packets with the commands sent to an EnOcean module."""
+
+import asyncio
+from collections import deque
+import logging
+import threading
+import time
+from typing import TYPE_CHECKING, Callable
+
+from enocean.protocol.constants import PACKET, RETURN_CODE
+
+from .types import COMMON_COMMAND
+
+if TYPE_CHECKING:
+    from enocean.protocol.packet import Packet
+
+_LOGGER = logging.getLogger(__name__)
+
+RESPONSE_TIMEOUT = 1
+"""Default time (in seconds) to wait for the module's response to a command."""
+
+
+class EnOceanResponseCorrelator:
+    """Correlate RESPONSE packets with the commands they answer.
+
+    An EnOcean module answers every command it receives with exactly one RESPONSE packet,
+    in the order in which the commands were received. Responses carry no reference to their
+    command, so the correlator keeps a FIFO of pending futures. Packets sent without waiting
+    for the response (see 'send') also take a place in the FIFO; an error returned for them is
+    logged.
+
+    If a request times out, its response (and those of all older entries) is considered lost
+    and these entries are dropped, so that the FIFO is in sync with the module again. Likewise,
+    entries of packets sent without waiting are dropped once they are older than the response
+    timeout. As packets may be sent from any thread, the FIFO is guarded by a lock, which is
+    also held while a packet is handed to the send function, so that the entries are in the
+    order in which the module receives the packets.
+    """
+
+    def __init__(
+        self,
+        loop: asyncio.AbstractEventLoop,
+        send: Callable[["Packet"], bool],
+        timeout: float = RESPONSE_TIMEOUT,
+    ) -> None:
+        """Construct a correlator for the given event loop, send function and response timeout."""
+        self.__loop = loop
+        self.__send = send
+        self.__timeout = timeout
+        self.__pending: deque[tuple[asyncio.Future[Packet] | None, float]] = deque()
+        """Pending requests and the time they were sent, in the order they were sent (None
+        for packets sent without waiting)."""
+        self.__lock = threading.Lock()
+
+    @property
+    def pending(self) -> int:
+        """Return the number of requests awaiting a response."""
+        return len(self.__pending)
+
+    def handle_response(self, packet: "Packet") -> None:
+        """Resolve the oldest pending request with the given RESPONSE packet (event loop only)."""
+        with self.__lock:
+            self.__drop_expired()
+            if not self.__pending:
+                _LOGGER.debug("Discarding unexpected response packet.")
+                return
+            future, _ = self.__pending.popleft()
+
+        if future is None:
+            if packet.response != RETURN_CODE.OK:
+                _LOGGER.warning(
+                    f"EnOcean module rejected a packet with return code {packet.response}."
+                )
+        elif not future.done():
+            future.set_result(packet)
+
+    def handle_response_threadsafe(self, packet: "Packet") -> None:
+        """Resolve the oldest pending request from a thread other than the event loop's."""
+        self.__loop.call_soon_threadsafe(self.handle_response, packet)
+
+    def send(self, packet: "Packet") -> bool:
+        """Send a packet without waiting for the module's response (may be called from any thread)."""
+        with self.__lock:
+            self.__drop_expired()
+            return self.__append_and_send(None, packet)
+
+    async def request(
+        self, packet: "Packet", timeout: float = RESPONSE_TIMEOUT
+    ) -> "Packet | None":
+        """Send a packet and wait for the module's response; return None on timeout."""
+        future = self.__loop.create_future()
+        with self.__lock:
+            if not self.__append_and_send(future, packet):
+                return None
+
+        try:
+            return await asyncio.wait_for(future, timeout)
+        except TimeoutError:
+            self.__resync(future)
+            return None
+
+    def __resync(self, future: "asyncio.Future[Packet]") -> None:
+        """Drop the timed out request and all older entries, as their responses are lost."""
+        with self.__lock:
+            if not any(pending is future for pending, _ in self.__pending):
+                return  # cancelled meanwhile
+
+            dropped = 0
+            while self.__pending:
+                dropped += 1
+                if self.__pending.popleft()[0] is future:
+                    break
+        _LOGGER.warning(
+            f"No response from the EnOcean module, dropped {dropped} pending request(s) to resync."
+        )
+
+    def __drop_expired(self) -> None:
+        """Drop the oldest entries of packets sent without waiting whose response is overdue (lock held)."""
+        expired = time.monotonic() - self.__timeout
+        dropped = 0
+        while self.__pending and self.__pending[0][0] is None:
+            if self.__pending[0][1] >= expired:
+                break
+            self.__pending.popleft()
+            dropped += 1
+        if dropped:
+            _LOGGER.debug(
+                f"Dropped {dropped} unanswered packet(s) sent without waiting."
+            )
+
+    def __append_and_send(
+        self, future: "asyncio.Future[Packet] | None", packet: "Packet"
+    ) -> bool:
+        """Append an entry and send the packet (lock held, so that both are in the same order)."""
+        self.__pending.append((future, time.monotonic()))
+        if not self.__send(packet):
+            self.__pending.pop()
+            return False
+        return True
+
+    async def common_command(
+        self, command: COMMON_COMMAND, response_length: int
+    ) -> list[int] | None:
+        """Send a common command and return the response data, if the module answered with OK."""
+        from enocean.protocol.packet import Packet
+
+        response = await self.request(
+            Packet(PACKET.COMMON_COMMAND, data=[command.value], optional=[])
+        )
+        if (
+            response is None
+            or response.response != RETURN_CODE.OK
+            or len(response.response_data) != response_length
+        ):
+            return None
+
+        return response.response_data
+
+    def cancel_all(self) -> None:
+        """Cancel all pending requests, e.g. when the connection is closed."""
+        with self.__lock:
+            pending = list(self.__pending)
+            self.__pending.clear()
+        for future, _ in pending:
+            if future:
+                future.cancel()
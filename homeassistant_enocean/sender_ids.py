@@ -0,0 +1,97 @@
+"""The addresses a gateway may use for sending telegrams."""
+
+from types import MappingProxyType
+from typing import Mapping
+
+from .address import EnOceanAddress
+from .types import ValueLabelDict
+
+NUMBER_OF_BASE_IDS = 128
+"""Number of consecutive sender addresses starting at a gateway's base id."""
+
+
+class EnOceanSenderIDs:
+    """The 129 valid sender ids of a gateway, i.e. its chip id and base id + 0..127.
+
+    The table is computed once (when the gateway's chip and base ids are known) and is
+    immutable. Besides the options in order (chip id, base id, base id + 1, ...), it
+    provides dictionaries to look up the address of an option label and the label of an
+    address.
+    """
+
+    __slots__ = ("__options", "__labels", "__address_by_label", "__label_by_address")
+
+    def __init__(self, chip_id: EnOceanAddress, base_id: EnOceanAddress) -> None:
+        """Compute the valid sender ids for the given chip and base id."""
+        addresses = [chip_id, base_id]
+        labels = [f"Chip ID ({chip_id})", f"Base ID ({base_id})"]
+
+        base_id_int = base_id.to_number()
+        for i in range(1, NUMBER_OF_BASE_IDS):
+            address = EnOceanAddress(base_id_int + i)
+            addresses.append(address)
+            labels.append(f"Base ID + {i:03d} ({address})")
+
+        self.__options: tuple[ValueLabelDict, ...] = tuple(
+            ValueLabelDict(value=address.to_string(), label=label)
+            for address, label in zip(addresses, labels)
+        )
+        self.__labels: tuple[str, ...] = tuple(labels)
+        self.__address_by_label: Mapping[str, EnOceanAddress] = MappingProxyType(
+            dict(zip(labels, addresses))
+        )
+        # reversed, so that the chip id keeps its label if it is within the base id range
+        self.__label_by_address: Mapping[EnOceanAddress, str] = MappingProxyType(
+            dict(zip(reversed(addresses), reversed(labels)))
+        )
+
+    @property
+    def options(self) -> tuple[ValueLabelDict, ...]:
+        """Return the value/label dictionaries of all valid sender ids (chip id first)."""
+        return self.__options
+
+    @property
+    def labels(self) -> tuple[str, ...]:
+        """Return the labels of all valid sender ids (chip id first)."""
+        return self.__labels
+
+    @property
+    def chip_id_option(self) -> ValueLabelDict:
+        """Return the value/label dictionary of the chip id."""
+        return self.__options[0]
+
+    @property
+    def base_id_option(self) -> ValueLabelDict:
+        """Return the value/label dictionary of the base id."""
+        return self.__options[1]
+
+    @property
+    def address_by_label(self) -> Mapping[str, EnOceanAddress]:
+        """Return a read-only dictionary from option label to sender address."""
+        return self.__address_by_label
+
+    @property
+    def label_by_address(self) -> Mapping[EnOceanAddress, str]:
+        """Return a read-only dictionary from sender address to option label."""
+        return self.__label_by_address
+
+    def address_of(self, label: str) -> EnOceanAddress | None:
+        """Return the sender address of an option label (or None if it is not valid)."""
+        return self.__address_by_label.get(label)
+
+    def label_of(self, address: EnOceanAddress) -> str | None:
+        """Return the option label of a sender address (or None if it is not valid)."""
+        return self.__label_by_address.get(address)
+
+    def __contains__(self, address: object) -> bool:
+        """Return True if the address may be used for sending."""
+        return address in self.__label_by_address
+
+    def __iter__(self):
+        return iter(self.__options)
+
+    def __len__(self) -> int:
+        return len(self.__options)
+
+    def __getitem__(self, index: int) -> ValueLabelDict:
+        return self.__options[index]
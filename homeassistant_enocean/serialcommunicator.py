@@ -1,72 +1,104 @@
-import datetime
+import asyncio
 import logging
-import queue
+import threading
 
 from enocean.communicators.serialcommunicator import SerialCommunicator
-from enocean.protocol.constants import PACKET, RETURN_CODE
-from enocean.protocol.packet import Packet
+from enocean.protocol.constants import PACKET
+from enocean.protocol.packet import Packet, UTETeachInPacket
+import serial
 
+from .capture import RX, TX, EnOceanCaptureRecorder
+from .esp3_framer import EnOceanESP3Framer
+from .response_correlator import RESPONSE_TIMEOUT, EnOceanResponseCorrelator
 from .types import COMMON_COMMAND, VersionInfo
 
 LOGGER = logging.getLogger("enocean.communicators.SerialCommunicator")
 
 
 class EnOceanSerialCommunicator(SerialCommunicator):
-    """Extends the original 'SerialCommunicator' class to provide version info fetching functionality (incl. chip ID)."""
+    """Extends the original 'SerialCommunicator' class to provide version info fetching functionality (incl. chip ID).
+
+    Responses of the module are not put into the receive queue, but handed to a response
+    correlator on the event loop, so that the module can be queried without blocking it.
+
+    The reader thread reads all bytes buffered by the operating system at once (instead of
+    16 byte chunks) and frames them with an 'EnOceanESP3Framer'. Packets are written to the
+    port by the sending thread (instead of being queued until the reader's next poll, which
+    may take up to the port's timeout). A recorder, if set, receives the raw byte stream.
+    """
+
+    max_read_size: int = 65536
+    """Maximum number of bytes read from the port at once."""
 
     def __init__(self, port: str = "/dev/ttyAMA0") -> None:
-        super().__init__(port=port)
+        self._callback = None
+        self._correlator: EnOceanResponseCorrelator | None = None
+        self.recorder: EnOceanCaptureRecorder | None = None
+        """Recorder for the data exchanged with the module."""
+        super().__init__(port=port, callback=self._packet_received)
         self._version_info: VersionInfo | None = None
+        self._framer = EnOceanESP3Framer()
+        # the port is private to the library's 'SerialCommunicator'
+        self._serial: serial.Serial = self._SerialCommunicator__ser
+        self._write_lock = threading.Lock()
+
+    def run(self) -> None:
+        """Frame the received bytes until stopped."""
+        LOGGER.info("SerialCommunicator started")
+        while not self._stop_flag.is_set():
+            try:
+                # blocks for at most the port's timeout if nothing is buffered
+                data = self._serial.read(
+                    min(max(self._serial.in_waiting, 1), self.max_read_size)
+                )
+            except (OSError, serial.SerialException):
+                LOGGER.error(
+                    "Serial port exception! (device disconnected or multiple access on port?)"
+                )
+                self.stop()
+                continue
+            if not data:
+                continue
+
+            if self.recorder:
+                self.recorder.record(RX, data)
+            for packet in self._framer.feed(data):
+                self._dispatch(packet)
+
+        with self._write_lock:
+            self._serial.close()
+        LOGGER.info("SerialCommunicator stopped")
+
+    def _dispatch(self, packet: Packet) -> None:
+        """Handle a framed packet as the library's 'Communicator.parse' does."""
+        if isinstance(packet, UTETeachInPacket) and self.teach_in:
+            LOGGER.info("Sending response to UTE teach-in.")
+            self.send(packet.create_response_packet(self.base_id))
+
+        callback = super().callback
+        if callback is None:
+            self.receive.put(packet)
+        else:
+            callback(packet)
+
+    @property
+    def callback(self):
+        """Return the callback for received packets (other than responses)."""
+        return self._callback
+
+    @callback.setter
+    def callback(self, callback) -> None:
+        """Set the callback for received packets (other than responses)."""
+        self._callback = callback
 
     @property
     def base_id(self):
-        """Fetches Base ID from the transmitter, if required. Otherwise, returns the currently set Base ID."""
-        # If base id is already set, return it.
-        if self._base_id is not None:
-            return self._base_id
-
-        start = datetime.datetime.now()
-
-        # Send COMMON_COMMAND 0x08, CO_RD_IDBASE request to the module
-        self.send(
-            Packet(
-                PACKET.COMMON_COMMAND,
-                data=[COMMON_COMMAND.CO_RD_IDBASE.value],
-                optional=[],
-            )
-        )
-
-        # wait at most 1 second for the response
-        while True:
-            seconds_elapsed = (datetime.datetime.now() - start).total_seconds()
-            if seconds_elapsed > 1:
-                self.logger.error(
-                    "Could not obtain base id from module within 1 second (timeout)."
-                )
-                break
-            try:
-                packet = self.receive.get(block=True, timeout=0.1)
-                # We're only interested in responses to the request in question.
-                if (
-                    packet.packet_type == PACKET.RESPONSE
-                    and packet.response == RETURN_CODE.OK
-                    and len(packet.response_data) == 4
-                ):
-                    # Base ID is set in the response data.
-                    self._base_id = packet.response_data
-                    # Put packet back to the Queue, so the user can also react to it if required...
-                    self.receive.put(packet)
-                    break
-                # Put other packets back to the Queue.
-                self.receive.put(packet)
-            except queue.Empty:
-                continue
-        # Return the current Base ID (might be None).
+        """Returns the currently set Base ID (None, if not yet fetched via 'fetch_base_id')."""
         return self._base_id
 
     @property
     def chip_id(self):
-        """Fetches Chip ID from the transmitter, if required. Otherwise returns the currently set Chip ID."""
+        """Returns the currently set Chip ID (None, if not yet fetched via 'fetch_version_info')."""
         if self.version_info is not None:
             return self.version_info.chip_id
 
@@ -74,66 +106,82 @@ class EnOceanSerialCommunicator(SerialCommunicator):
 
     @property
     def version_info(self):
-        """Fetches version info from the transmitter, if required. Otherwise returns the currently set version info."""
-
-        # If version info is already set, return it.
-        if self._version_info is not None:
-            return self._version_info
+        """Returns the currently set version info (None, if not yet fetched via 'fetch_version_info')."""
+        return self._version_info
 
-        start = datetime.datetime.now()
+    def send(self, packet: Packet) -> bool:
+        """Queue a packet for sending to the module (without waiting for its response)."""
+        if self._correlator:
+            return self._correlator.send(packet)
+        return self._transmit(packet)
+
+    async def request(
+        self, packet: Packet, timeout: float = RESPONSE_TIMEOUT
+    ) -> Packet | None:
+        """Send a packet and wait for the module's response; return None on timeout."""
+        return await self._get_correlator().request(packet, timeout)
+
+    def _transmit(self, packet: Packet) -> bool:
+        """Write a packet to the serial port."""
+        if not isinstance(packet, Packet):
+            LOGGER.error("Object to send must be an instance of Packet")
+            return False
+        data = bytes(packet.build())
+        with self._write_lock:
+            if self._stop_flag.is_set():
+                LOGGER.error("Cannot send packet, EnOcean communicator is stopped.")
+                return False
+            try:
+                self._serial.write(data)
+            except serial.SerialException:
+                LOGGER.error("Cannot write packet to serial port.")
+                self.stop()
+                return False
+            if self.recorder:
+                self.recorder.record(TX, data)
+        return True
+
+    def _packet_received(self, packet: Packet) -> None:
+        """Handle a packet on the communicator's thread."""
+        if packet.packet_type == PACKET.RESPONSE:
+            if self._correlator:
+                self._correlator.handle_response_threadsafe(packet)
+            return
+
+        if self._callback:
+            self._callback(packet)
+
+    def _get_correlator(self) -> EnOceanResponseCorrelator:
+        if self._correlator is None:
+            self._correlator = EnOceanResponseCorrelator(
+                asyncio.get_running_loop(), self._transmit
+            )
+        return self._correlator
 
-        # Send COMMON_COMMAND 0x03, CO_RD_VERSION request to the module
-        self.send(
-            Packet(
-                PACKET.COMMON_COMMAND,
-                data=[COMMON_COMMAND.CO_RD_VERSION.value],
-                optional=[],
+    async def fetch_base_id(self):
+        """Fetches Base ID from the transmitter, if required. Otherwise, returns the currently set Base ID."""
+        if self._base_id is None:
+            self._base_id = await self._get_correlator().common_command(
+                COMMON_COMMAND.CO_RD_IDBASE, 4
             )
-        )
+            if self._base_id is None:
+                LOGGER.error(
+                    f"Could not obtain base id from module within {RESPONSE_TIMEOUT} second(s)."
+                )
+
+        return self._base_id
 
-        # wait at most 1 second for the response
-        while True:
-            seconds_elapsed = (datetime.datetime.now() - start).total_seconds()
-            if seconds_elapsed > 1:
+    async def fetch_version_info(self):
+        """Fetches version info from the transmitter, if required. Otherwise returns the currently set version info."""
+        if self._version_info is None:
+            response_data = await self._get_correlator().common_command(
+                COMMON_COMMAND.CO_RD_VERSION, 32
+            )
+            if response_data is None:
                 LOGGER.warning(
-                    "Could not obtain version info from module within 1 second (timeout)."
+                    f"Could not obtain version info from module within {RESPONSE_TIMEOUT} second(s)."
                 )
-                break
+            else:
+                self._version_info = VersionInfo.from_response_data(response_data)
 
-            try:
-                packet = self.receive.get(block=True, timeout=0.1)
-                if (
-                    packet.packet_type == PACKET.RESPONSE
-                    and packet.response == RETURN_CODE.OK
-                    and len(packet.response_data) == 32
-                ):
-                    # interpret the version info
-                    self._version_info: VersionInfo = VersionInfo()
-                    res = packet.response_data
-
-                    self._version_info.app_version.main = res[0]
-                    self._version_info.app_version.beta = res[1]
-                    self._version_info.app_version.alpha = res[2]
-                    self._version_info.app_version.build = res[3]
-
-                    self._version_info.api_version.main = res[4]
-                    self._version_info.api_version.beta = res[5]
-                    self._version_info.api_version.alpha = res[6]
-                    self._version_info.api_version.build = res[7]
-
-                    self._version_info.chip_id = [res[8], res[9], res[10], res[11]]
-                    self._version_info.chip_version = int.from_bytes(res[12:15], "big")
-
-                    self._version_info.app_description = (
-                        bytearray(res[16:32]).decode("utf8").strip().split("\x00")[0]
-                    )
-
-                    # Put packet back to the Queue, so the user can also react to it if required...
-                    self.receive.put(packet)
-                    break
-                # Put other packets back to the Queue.
-                self.receive.put(packet)
-            except queue.Empty:
-                continue
-        # Return the current version info (might be None).
         return self._version_info
@@ -0,0 +1,251 @@
+"""Pre-encoded templates of outgoing telegrams.
+
+The enocean library's 'RadioPacket.create' navigates the XML profile description and sets
+every field by name on every call. A template is encoded once per profile, command and
+fixed field values as by 'RadioPacket.create' (from the precompiled profiles, see
+eep_profiles.py, or with 'RadioPacket.create' itself for other profiles); building a
+telegram from it only patches the destination, the sender and the variable fields into a
+copy of the template's bytes. Devices bind the templates to their addresses, so that only
+the variable fields remain to be set. The telegrams are byte-identical to those of
+'RadioPacket.create' (see scripts/verify_telegram_templates.py).
+"""
+
+import copy
+from functools import cache
+from typing import TYPE_CHECKING, Iterable
+
+from enocean.protocol.constants import PACKET, RORG
+
+from .eep_profiles import (
+    FIELD_ENUM,
+    FIELD_STATUS,
+    FIELD_VALUE,
+    EnOceanEEPData,
+    compile_field,
+    get_eep_profiles,
+)
+
+if TYPE_CHECKING:
+    from enocean.protocol.packet import RadioPacket
+
+_ADDRESS_PLACEHOLDER = [0x00, 0x00, 0x00, 0x00]
+
+
+class EnOceanTelegramTemplate:
+    """A pre-encoded telegram of one profile (RORG, FUNC, TYPE and command).
+
+    The fields given as 'fixed' are encoded into the template (enums are checked against
+    the profile, unknown fields are ignored, as by 'RadioPacket.create'), the fields listed in
+    'variable' are set when building a telegram. Variable fields are encoded as by
+    'RadioPacket.create': values are scaled and truncated to their raw value, enums are
+    set to the given raw value (which is not checked against the profile).
+    """
+
+    def __init__(
+        self,
+        rorg: int,
+        func: int,
+        type_: int,
+        command: int | None = None,
+        variable: Iterable[str] = (),
+        **fixed,
+    ) -> None:
+        """Encode the template and locate the variable fields."""
+        from enocean.protocol.packet import RadioPacket
+
+        variable = tuple(variable)
+        data = _find_data(rorg, func, type_, command)
+        if data is not None:
+            encoded, optional = _create(rorg, data, command, fixed)
+        else:
+            # not precompiled, see eep_profiles.py
+            packet = RadioPacket.create(
+                rorg=rorg,
+                rorg_func=func,
+                rorg_type=type_,
+                command=command,
+                destination=_ADDRESS_PLACEHOLDER,
+                sender=_ADDRESS_PLACEHOLDER,
+                **fixed,
+            )
+            encoded, optional = packet.data, packet.optional
+            data = _compile_data(rorg, func, type_, command)
+        self.__packet_class = RadioPacket
+        self.__data: tuple[int, ...] = tuple(encoded)
+        self.__optional: tuple[int, ...] = tuple(optional)
+        self.__number_of_bits = (len(encoded) - 6) * 8
+        self.__fields: dict[str, tuple] = self.__compile(data, variable)
+
+    @property
+    def variable(self) -> tuple[str, ...]:
+        """Return the shortcuts of the variable fields."""
+        return tuple(self.__fields)
+
+    def bind(
+        self, destination: list[int], sender: list[int]
+    ) -> "EnOceanTelegramTemplate":
+        """Return a copy of the template with the given destination and sender filled in."""
+        bound = copy.copy(self)
+        data = list(self.__data)
+        data[-5:-1] = sender
+        bound.__data = tuple(data)
+        optional = list(self.__optional)
+        optional[1:5] = destination
+        bound.__optional = tuple(optional)
+        return bound
+
+    def __compile(
+        self, data: EnOceanEEPData | None, variable: tuple[str, ...]
+    ) -> dict[str, tuple]:
+        """Return (kind, shift, mask, parameters) per variable field."""
+        fields = {}
+        for shortcut in variable:
+            target = data.find_field(shortcut) if data else None
+            if target is None or target[0] not in (FIELD_VALUE, FIELD_ENUM):
+                raise ValueError(f"Cannot find variable field '{shortcut}' in EEP.")
+            kind, _, offset, size, parameters = target
+            shift = self.__number_of_bits - offset - size
+            mask = (1 << size) - 1
+            if kind == FIELD_VALUE:
+                rng_min, rng_max, scl_min, scl_max = parameters
+                parameters = (rng_min, rng_max - rng_min, scl_min, scl_max - scl_min)
+                fields[shortcut] = (FIELD_VALUE, shift, mask, parameters)
+            else:
+                fields[shortcut] = (FIELD_ENUM, shift, mask, None)
+        return fields
+
+    def encode(self, values: dict[str, int | float]) -> list[int]:
+        """Return the telegram's data bytes for the given field values."""
+        data = list(self.__data)
+        if not values:
+            return data
+
+        end = len(data) - 5
+        bits = int.from_bytes(bytes(data[1:end]))
+        for shortcut, value in values.items():
+            kind, shift, mask, parameters = self.__fields[shortcut]
+            if kind == FIELD_VALUE:
+                # same order of operations as the enocean library, for identical rounding
+                rng_min, rng_span, scl_min, scl_span = parameters
+                raw_value = int((value - scl_min) * rng_span / scl_span + rng_min)
+            else:
+                raw_value = int(value)
+            bits = (bits & ~(mask << shift)) | ((raw_value & mask) << shift)
+        data[1:end] = bits.to_bytes(end - 1)
+        return data
+
+    def build(
+        self,
+        destination: list[int] | None = None,
+        sender: list[int] | None = None,
+        **values: int | float,
+    ) -> "RadioPacket":
+        """Build a telegram from the template with the given variable field values.
+
+        The destination and sender are filled in if given (i.e. if the template is not bound).
+        """
+        data = self.encode(values)
+        optional = list(self.__optional)
+        if sender is not None:
+            data[-5:-1] = sender
+        if destination is not None:
+            optional[1:5] = destination
+        return self.__packet_class(PACKET.RADIO_ERP1, data=data, optional=optional)
+
+
+@cache
+def get_telegram_template(
+    rorg: int,
+    func: int,
+    type_: int,
+    command: int | None = None,
+    variable: tuple[str, ...] = (),
+    fixed: tuple[tuple[str, int], ...] = (),
+) -> EnOceanTelegramTemplate:
+    """Return the (cached) template for the given profile, command and fields."""
+    return EnOceanTelegramTemplate(rorg, func, type_, command, variable, **dict(fixed))
+
+
+def _find_data(
+    rorg: int, func: int, type_: int, command: int | None
+) -> EnOceanEEPData | None:
+    """Return the precompiled data description (None if the profile is not precompiled)."""
+    profile = get_eep_profiles().get(rorg, func, type_)
+    return profile.find_data(None, command) if profile is not None else None
+
+
+def _compile_data(
+    rorg: int, func: int, type_: int, command: int | None
+) -> EnOceanEEPData | None:
+    """Return the data description compiled from the enocean library's EEP.xml."""
+    from enocean.protocol.packet import Packet
+
+    description = Packet.eep.find_profile(rorg, func, type_, None, command)
+    if description is None:
+        return None
+    fields = (compile_field(source) for source in description.contents)
+    return EnOceanEEPData(
+        None, None, None, tuple(field for field in fields if field is not None)
+    )
+
+
+def _create(
+    rorg: int, data: EnOceanEEPData, command: int | None, fixed: dict
+) -> tuple[list[int], list[int]]:
+    """Return the data and optional data 'RadioPacket.create' would encode (with placeholders)."""
+    if rorg in (RORG.RPS, RORG.BS1):
+        size = 1
+    elif rorg == RORG.BS4:
+        size = 4
+    elif rorg == RORG.VLD:
+        size = data.bits if data.bits is not None else 1
+    else:
+        raise ValueError("RORG not supported by this function.")
+
+    if command:
+        fixed = {**fixed, "CMD": command}
+
+    number_of_bits = size * 8
+    bits = 0
+    status = 0
+    for shortcut, value in fixed.items():
+        target = data.find_field(shortcut)
+        if target is None:
+            continue  # as 'RadioPacket.create', which only logs a warning
+        kind, _, offset, field_size, parameters = target
+        if kind == FIELD_STATUS:
+            mask = 1 << (7 - offset)
+            status = (status | mask) if value else (status & ~mask)
+            continue
+        if kind == FIELD_VALUE:
+            rng_min, rng_max, scl_min, scl_max = parameters
+            raw_value = int(
+                (value - scl_min) * (rng_max - rng_min) / (scl_max - scl_min) + rng_min
+            )
+        else:
+            raw_value = _enum_raw_value(parameters, value)
+        shift = number_of_bits - offset - field_size
+        mask = (1 << field_size) - 1
+        bits = (bits & ~(mask << shift)) | ((raw_value & mask) << shift)
+
+    encoded = [rorg, *bits.to_bytes(size), *_ADDRESS_PLACEHOLDER, status]
+    if rorg == RORG.BS1:
+        encoded[1] |= 1 << 3
+    elif rorg == RORG.BS4:
+        encoded[4] |= 1 << 3
+    return encoded, [3, *_ADDRESS_PLACEHOLDER, 0xFF, 0]
+
+
+def _enum_raw_value(parameters: tuple, value: int | str) -> int:
+    """Return the raw value of an enum given by raw value or description."""
+    items, range_items = parameters
+    if isinstance(value, int):
+        if value in items or any(
+            start <= value <= end for start, end, _ in range_items
+        ):
+            return value
+        raise ValueError(f'Enum value "{value}" not found in EEP.')
+    for raw_value, description in items.items():
+        if description == value:
+            return raw_value
+    raise ValueError(f'Enum description for value "{value}" not found in EEP.')
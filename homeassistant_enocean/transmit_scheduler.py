@@ -0,0 +1,280 @@
+"""Prioritized and paced transmission of telegrams to an EnOcean module."""
+
+import asyncio
+from collections import deque
+from enum import IntEnum
+import logging
+import threading
+import time
+from typing import TYPE_CHECKING, Awaitable, Callable, Hashable, NamedTuple
+
+from enocean.protocol.constants import RETURN_CODE
+
+if TYPE_CHECKING:
+    from enocean.protocol.packet import Packet
+
+_LOGGER = logging.getLogger(__name__)
+
+ERP1_BIT_RATE = 125000
+"""Radio bit rate (in bit/s) of EnOcean Radio Protocol 1 telegrams."""
+
+ERP1_OVERHEAD = 4
+"""Approximate number of bytes added to a telegram's data on air (preamble, length, checksum)."""
+
+ERP1_SUBTELEGRAMS = 3
+"""Number of subtelegrams transmitted per telegram."""
+
+
+class EnOceanTransmitPriority(IntEnum):
+    """Priority classes of outgoing telegrams (lower values are sent first)."""
+
+    COMMAND = 0
+    """Commands triggered by the user, e.g. switching a light or moving a cover."""
+
+    QUERY = 1
+    """Polls and queries of a device's state."""
+
+
+class EnOceanTransmitMetrics(NamedTuple):
+    """Metrics of a transmit scheduler."""
+
+    queued: int
+    """Number of telegrams waiting to be sent."""
+
+    sent: int
+    """Number of telegrams sent."""
+
+    coalesced: int
+    """Number of queued telegrams replaced by a newer telegram."""
+
+    failed: int
+    """Number of sent telegrams rejected by the module or not confirmed in time."""
+
+    mean_wait: float
+    """Mean time (in seconds) sent telegrams waited in the queue."""
+
+    max_wait: float
+    """Maximum time (in seconds) a sent telegram waited in the queue."""
+
+
+class _QueuedTelegram:
+    """A telegram waiting to be sent."""
+
+    __slots__ = ("packet", "coalesce_key", "queued_at")
+
+    def __init__(
+        self, packet: "Packet", coalesce_key: Hashable | None, queued_at: float
+    ) -> None:
+        self.packet = packet
+        self.coalesce_key = coalesce_key
+        self.queued_at = queued_at
+
+
+def estimate_airtime(packet: "Packet") -> float:
+    """Return the estimated time (in seconds) the telegram occupies the radio channel."""
+    return ERP1_SUBTELEGRAMS * (len(packet.data) + ERP1_OVERHEAD) * 8 / ERP1_BIT_RATE
+
+
+class EnOceanTransmitScheduler:
+    """Queue for outgoing telegrams with priority classes, pacing and coalescing.
+
+    Telegrams are sent in order of their priority (and in submission order within a
+    priority class), with at least 'min_interval' seconds in between. Additionally, the
+    transmission is paced by a token bucket of radio airtime, which is refilled at
+    'duty_cycle' seconds per second (e.g. 1% in the 868 MHz band) up to 'burst_airtime'
+    seconds, so that bursts are sent immediately while the long-term duty cycle is kept.
+
+    A telegram submitted with a coalesce key replaces a still queued telegram with the
+    same key (keeping its place in the queue), e.g. a newer cover position replaces an
+    older one which has not been sent yet.
+
+    Each telegram is only sent after the module confirmed (or failed to confirm) the
+    previous one, so the module's buffer is never overrun; meanwhile, telegrams queue up
+    here, where they can still be prioritized and coalesced.
+    """
+
+    def __init__(
+        self,
+        min_interval: float = 0.01,
+        duty_cycle: float = 0.01,
+        burst_airtime: float = 0.2,
+    ) -> None:
+        """Construct the scheduler with the given pacing parameters."""
+        if min_interval < 0:
+            raise ValueError("Minimum interval must not be negative.")
+        if not 0 < duty_cycle <= 1:
+            raise ValueError("Duty cycle must be in the range (0, 1].")
+        if burst_airtime <= 0:
+            raise ValueError("Burst airtime must be positive.")
+        self.__min_interval = min_interval
+        self.__duty_cycle = duty_cycle
+        self.__burst_airtime = burst_airtime
+
+        self.__queues: tuple[deque[_QueuedTelegram], ...] = tuple(
+            deque() for _ in EnOceanTransmitPriority
+        )
+        self.__coalescing: dict[Hashable, _QueuedTelegram] = {}
+        self.__airtime_tokens = burst_airtime
+        self.__refilled_at = time.monotonic()
+        self.__last_sent_at: float | None = None
+
+        self.__loop: asyncio.AbstractEventLoop | None = None
+        self.__loop_thread: int | None = None
+        self.__send: Callable[[Packet], Awaitable[int | None]] | None = None
+        self.__wakeup: asyncio.Event | None = None
+        self.__task: asyncio.Task | None = None
+
+        self.__sent = 0
+        self.__coalesced = 0
+        self.__failed = 0
+        self.__total_wait = 0.0
+        self.__max_wait = 0.0
+
+    @property
+    def queued(self) -> int:
+        """Return the number of telegrams waiting to be sent."""
+        return sum(len(queue) for queue in self.__queues)
+
+    def queued_by_priority(self) -> dict[EnOceanTransmitPriority, int]:
+        """Return the number of telegrams waiting to be sent per priority class."""
+        return {
+            priority: len(self.__queues[priority])
+            for priority in EnOceanTransmitPriority
+        }
+
+    @property
+    def metrics(self) -> EnOceanTransmitMetrics:
+        """Return the scheduler's metrics."""
+        return EnOceanTransmitMetrics(
+            queued=self.queued,
+            sent=self.__sent,
+            coalesced=self.__coalesced,
+            failed=self.__failed,
+            mean_wait=self.__total_wait / self.__sent if self.__sent else 0.0,
+            max_wait=self.__max_wait,
+        )
+
+    def start(self, send: Callable[["Packet"], Awaitable[int | None]]) -> None:
+        """Start sending queued telegrams on the running event loop.
+
+        The given coroutine function sends a telegram and returns the module's return code
+        (None if the module did not answer), e.g. 'EnOceanHomeAssistantGateway.send_and_confirm'.
+        """
+        self.__loop = asyncio.get_running_loop()
+        self.__loop_thread = threading.get_ident()
+        self.__send = send
+        self.__wakeup = asyncio.Event()
+        self.__task = self.__loop.create_task(self.__run())
+
+    def stop(self) -> None:
+        """Stop sending and discard the queued telegrams."""
+        if self.__task:
+            self.__task.cancel()
+            self.__task = None
+        for queue in self.__queues:
+            queue.clear()
+        self.__coalescing.clear()
+
+    def submit(
+        self,
+        packet: "Packet",
+        priority: EnOceanTransmitPriority = EnOceanTransmitPriority.COMMAND,
+        coalesce_key: Hashable | None = None,
+    ) -> None:
+        """Queue a telegram for sending (may be called from any thread)."""
+        if self.__loop is None:
+            raise RuntimeError("Transmit scheduler is not started.")
+        if threading.get_ident() == self.__loop_thread:
+            self.__enqueue(packet, priority, coalesce_key)
+        else:
+            self.__loop.call_soon_threadsafe(
+                self.__enqueue, packet, priority, coalesce_key
+            )
+
+    def __enqueue(
+        self,
+        packet: "Packet",
+        priority: EnOceanTransmitPriority,
+        coalesce_key: Hashable | None,
+    ) -> None:
+        """Queue a telegram (on the event loop)."""
+        if coalesce_key is not None:
+            if queued := self.__coalescing.get(coalesce_key):
+                queued.packet = packet
+                self.__coalesced += 1
+                return
+
+        telegram = _QueuedTelegram(packet, coalesce_key, time.monotonic())
+        if coalesce_key is not None:
+            self.__coalescing[coalesce_key] = telegram
+        self.__queues[priority].append(telegram)
+        self.__wakeup.set()
+
+    def __next(self) -> _QueuedTelegram | None:
+        """Remove and return the next telegram to be sent."""
+        for queue in self.__queues:
+            if queue:
+                telegram = queue.popleft()
+                if telegram.coalesce_key is not None:
+                    del self.__coalescing[telegram.coalesce_key]
+                return telegram
+        return None
+
+    def __peek(self) -> _QueuedTelegram | None:
+        """Return the next telegram to be sent."""
+        for queue in self.__queues:
+            if queue:
+                return queue[0]
+        return None
+
+    def __delay(self, airtime: float, now: float) -> float:
+        """Return the time to wait until a telegram with the given airtime may be sent."""
+        self.__airtime_tokens = min(
+            self.__burst_airtime,
+            self.__airtime_tokens + (now - self.__refilled_at) * self.__duty_cycle,
+        )
+        self.__refilled_at = now
+
+        delay = 0.0
+        if self.__last_sent_at is not None:
+            delay = self.__last_sent_at + self.__min_interval - now
+        # a telegram longer than the burst airtime is sent with a full bucket
+        missing = min(airtime, self.__burst_airtime) - self.__airtime_tokens
+        if missing > 0:
+            delay = max(delay, missing / self.__duty_cycle)
+        return delay
+
+    async def __run(self) -> None:
+        """Send the queued telegrams, paced by the minimum interval and the duty cycle."""
+        while True:
+            telegram = self.__peek()
+            if telegram is None:
+                self.__wakeup.clear()
+                await self.__wakeup.wait()
+                continue
+
+            now = time.monotonic()
+            delay = self.__delay(estimate_airtime(telegram.packet), now)
+            if delay > 0:
+                # a telegram of higher priority may be queued meanwhile
+                await asyncio.sleep(delay)
+                continue
+
+            telegram = self.__next()
+            try:
+                return_code = await self.__send(telegram.packet)
+            except Exception:
+                _LOGGER.exception("Failed to send EnOcean telegram.")
+                return_code = None
+            if return_code != RETURN_CODE.OK:
+                self.__failed += 1
+                _LOGGER.warning(
+                    f"EnOcean telegram not confirmed by module (return code {return_code})."
+                )
+
+            self.__airtime_tokens -= estimate_airtime(telegram.packet)
+            self.__last_sent_at = now
+            wait = now - telegram.queued_at
+            self.__sent += 1
+            self.__total_wait += wait
+            self.__max_wait = max(self.__max_wait, wait)
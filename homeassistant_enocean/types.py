@@ -2,8 +2,6 @@ from datetime import datetime
 from enum import IntEnum
 from typing import Any, Callable, Coroutine, TypedDict
 
-from enocean.protocol.packet import RadioPacket
-
 type EnOceanEntityUID = str | None
 """A string identifiying the entity uniquely within the context of an EnOcean device's platform.
 
@@ -13,7 +11,8 @@ Uniqueness is only per device and platform, thus, the same UID can be used for a
 type EnOceanDeviceIDString = str
 """An EnOcean device ID as string"""
 
-type EnOceanSendRadioPacket = Callable[[RadioPacket], None]
+type EnOceanSendRadioPacket = Callable[..., None]
+"""Function to send a radio packet, with optional 'priority' and 'coalesce_key' keyword arguments (see 'EnOceanTransmitScheduler')."""
 
 # Callbacks for state updates
 type EnOceanBinarySensorCallback = Callable[[bool], None]
@@ -66,5 +65,29 @@ class VersionInfo:
     chip_version = 0
     app_description = ""
 
+    @classmethod
+    def from_response_data(cls, res: list[int]) -> "VersionInfo":
+        """Interpret the 32 bytes of response data to a CO_RD_VERSION command."""
+        version_info = cls()
+        version_info.app_version = VersionIdentifier()
+        version_info.app_version.main = res[0]
+        version_info.app_version.beta = res[1]
+        version_info.app_version.alpha = res[2]
+        version_info.app_version.build = res[3]
+
+        version_info.api_version = VersionIdentifier()
+        version_info.api_version.main = res[4]
+        version_info.api_version.beta = res[5]
+        version_info.api_version.alpha = res[6]
+        version_info.api_version.build = res[7]
+
+        version_info.chip_id = [res[8], res[9], res[10], res[11]]
+        version_info.chip_version = int.from_bytes(res[12:15], "big")
+
+        version_info.app_description = (
+            bytearray(res[16:32]).decode("utf8").strip().split("\x00")[0]
+        )
+        return version_info
+
 
 type HomeAssistantTaskCreator = Callable[[Coroutine[Any, Any, Any], str | None], None]
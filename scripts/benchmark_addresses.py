@@ -0,0 +1,81 @@
+"""Benchmark memory and speed of the address, EEP and entity ID value objects.
+
+Usage: python scripts/benchmark_addresses.py [number_of_addresses]
+
+Memory (with tracemalloc) and time are measured for distinct addresses and entity IDs
+(including the intern caches) and for repeatedly constructing the same objects, as done
+when parsing configuration entries or telegrams and when listing entities.
+"""
+
+import sys
+import time
+import tracemalloc
+
+from homeassistant_enocean.address import EnOceanAddress, EnOceanDeviceAddress
+from homeassistant_enocean.eep import EEP
+from homeassistant_enocean.entity_id import EnOceanEntityID
+
+
+def measure(label: str, number: int, create) -> list:
+    """Print the time and memory per object needed by create(i).
+
+    Memory is measured for i in range(number), time (without tracemalloc) for the next
+    number values of i.
+    """
+    tracemalloc.start()
+    objects = [create(i) for i in range(number)]
+    memory = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+
+    start = time.perf_counter()
+    objects += [create(i) for i in range(number, 2 * number)]
+    elapsed = time.perf_counter() - start
+    print(
+        f"  {label:<46} {elapsed / number * 1e9:8.0f} ns {memory / number:8.1f} B (per object)"
+    )
+    return objects
+
+
+def main() -> None:
+    number = int(sys.argv[1]) if len(sys.argv) > 1 else 100000
+
+    print(f"{number} objects")
+    addresses = measure(
+        "distinct EnOceanDeviceAddress", number, lambda i: EnOceanDeviceAddress(i)
+    )
+    measure(
+        "1000 EnOceanDeviceAddress, constructed repeatedly",
+        number,
+        lambda i: EnOceanDeviceAddress(i % 1000),
+    )
+    measure(
+        "EnOceanAddress from string",
+        number,
+        lambda i: EnOceanAddress(
+            f"00:{(i >> 16) & 0xFF:02X}:{(i >> 8) & 0xFF:02X}:{i & 0xFF:02X}"
+        ),
+    )
+    measure(
+        "distinct EnOceanEntityID",
+        number,
+        lambda i: EnOceanEntityID(addresses[i], "temperature"),
+    )
+    measure(
+        "1000 EnOceanEntityID, constructed repeatedly",
+        number,
+        lambda i: EnOceanEntityID(addresses[i % 1000], "temperature"),
+    )
+    measure("EEP, constructed repeatedly", number, lambda i: EEP(0xA5, 0x02, i % 32))
+
+    lookup = {address: None for address in addresses}
+    start = time.perf_counter()
+    for i in range(number):
+        lookup.get(EnOceanDeviceAddress(i))
+    elapsed = time.perf_counter() - start
+    print(
+        f"  {'construct + dict lookup':<46} {elapsed / number * 1e9:8.0f} ns (per lookup)"
+    )
+
+
+if __name__ == "__main__":
+    main()
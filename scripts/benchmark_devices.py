@@ -0,0 +1,68 @@
+"""Benchmark the construction time and memory of devices.
+
+Usage: python scripts/benchmark_devices.py [number_of_devices]
+
+Devices of all supported device types (round robin) are added to a gateway created on a
+pseudo terminal (without being started), so no EnOcean module is required. Memory is
+measured with tracemalloc in a separate run and includes the gateway's entity listings.
+"""
+
+import os
+import sys
+import time
+import tracemalloc
+
+from homeassistant_enocean.address import EnOceanDeviceAddress
+from homeassistant_enocean.device_registration import (
+    EnOceanDeviceConfig,
+    EnOceanDeviceRegistrationResult,
+)
+from homeassistant_enocean.device_type import EnOceanDeviceType
+from homeassistant_enocean.gateway import EnOceanHomeAssistantGateway
+
+
+def add_devices(
+    configs: list[EnOceanDeviceConfig],
+) -> tuple[EnOceanHomeAssistantGateway, EnOceanDeviceRegistrationResult]:
+    """Create a gateway with the given devices."""
+    _, slave = os.openpty()
+    gateway = EnOceanHomeAssistantGateway(
+        os.ttyname(slave), create_task=lambda target, name=None: None, use_asyncio=True
+    )
+    result = gateway.add_devices(configs)
+    # build the entity listing, as Home Assistant would
+    gateway.sensor_entities
+    return gateway, result
+
+
+def main() -> None:
+    number_of_devices = int(sys.argv[1]) if len(sys.argv) > 1 else 5000
+
+    device_types = list(EnOceanDeviceType.get_supported_device_types().values())
+    configs = [
+        EnOceanDeviceConfig(
+            EnOceanDeviceAddress(0x01000000 + i), device_types[i % len(device_types)]
+        )
+        for i in range(number_of_devices)
+    ]
+
+    # compile EEP decoders and entity templates outside of the measurements
+    add_devices(configs[: len(device_types)])
+
+    start = time.perf_counter()
+    _, result = add_devices(configs)
+    elapsed = time.perf_counter() - start
+
+    tracemalloc.start()
+    gateway, _ = add_devices(configs)
+    memory = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+
+    added = len(result.added)
+    print(f"{added} devices ({len(result.failed)} device types without EEP handler)")
+    print(f"  construction: {elapsed / added * 1e6:8.2f} µs/device")
+    print(f"  memory:       {memory / added:8.0f} B/device")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,130 @@
+"""Micro-benchmark for the gateway's packet dispatch at a large number of registered devices.
+
+Usage: python scripts/benchmark_dispatch.py [number_of_devices] [number_of_telegrams]
+
+The gateway is created on a pseudo terminal (without being started), so no EnOcean
+module is required. Radio telegrams are dispatched directly to the gateway's packet
+handler, once keyed by numeric sender address (current implementation) and once via
+the previous per-telegram 'EnOceanAddress(packet.sender_hex)' lookup for comparison.
+
+Additionally, the handling of A5-08-01 telegrams by a single device is timed without
+subscribers, with a single subscribed entity and with all entities subscribed (with
+diagnostic sensors updated on every telegram and coalesced).
+"""
+
+import os
+import random
+import sys
+import time
+
+from enocean.protocol.packet import RadioPacket
+
+from homeassistant_enocean.address import EnOceanAddress, EnOceanDeviceAddress
+from homeassistant_enocean.device_type import EnOceanDeviceType
+from homeassistant_enocean.entity_id import EnOceanEntityID
+from homeassistant_enocean.gateway import EnOceanHomeAssistantGateway
+
+
+def benchmark_device_handling(number_of_telegrams: int) -> None:
+    """Time the handling of A5-08-01 telegrams depending on the subscribed entities."""
+    _, slave = os.openpty()
+    gateway = EnOceanHomeAssistantGateway(
+        os.ttyname(slave), create_task=lambda target, name=None: None, use_asyncio=True
+    )
+    address = EnOceanDeviceAddress(0x01000000)
+    gateway.add_device(
+        address, EnOceanDeviceType.get_supported_device_types()["A5-08-01"]
+    )
+    device = gateway.get_device_properties(address)
+    packets = [
+        RadioPacket(
+            0x01,
+            data=[0xA5, 0x80, i & 0xFF, 0x66, 0x0F, 0x01, 0x00, 0x00, 0x00, 0x00],
+            optional=[0x01, 0xFF, 0xFF, 0xFF, 0xFF, 0x40, 0x00],
+        )
+        for i in range(number_of_telegrams)
+    ]
+
+    def callback(value) -> None:
+        pass
+
+    def measure(label: str) -> None:
+        start = time.perf_counter()
+        for packet in packets:
+            device.handle_packet(packet)
+        elapsed = time.perf_counter() - start
+        print(f"  {label:<41} {elapsed / number_of_telegrams * 1e6:8.3f} µs/telegram")
+
+    print(f"A5-08-01 device handling, {number_of_telegrams} telegrams")
+    measure("no subscribers:")
+    gateway.register_sensor_callback(EnOceanEntityID(address, "temperature"), callback)
+    measure("temperature subscribed:")
+    for entity_id in gateway.binary_sensor_entities:
+        gateway.register_binary_sensor_callback(entity_id, callback)
+    for entity_id in gateway.sensor_entities:
+        gateway.register_sensor_callback(entity_id, callback)
+    measure("all entities subscribed:")
+    device.coalesce_diagnostics = True
+    measure("all subscribed, coalesced diagnostics:")
+
+
+def main() -> None:
+    number_of_devices = int(sys.argv[1]) if len(sys.argv) > 1 else 10000
+    number_of_telegrams = int(sys.argv[2]) if len(sys.argv) > 2 else 100000
+
+    _, slave = os.openpty()
+    gateway = EnOceanHomeAssistantGateway(
+        os.ttyname(slave), create_task=lambda target, name=None: None, use_asyncio=True
+    )
+
+    device_type = EnOceanDeviceType.get_supported_device_types()["F6-02-01"]
+    addresses = [0x01000000 + i for i in range(number_of_devices)]
+    for address in addresses:
+        gateway.add_device(EnOceanDeviceAddress(address), device_type)
+
+    packets = []
+    for address in random.choices(addresses, k=number_of_telegrams):
+        sender = [(address >> shift) & 0xFF for shift in (24, 16, 8, 0)]
+        packets.append(
+            RadioPacket(
+                0x01,
+                data=[0xF6, 0x30] + sender + [0x30],
+                optional=[0x01, 0xFF, 0xFF, 0xFF, 0xFF, 0x40, 0x00],
+            )
+        )
+
+    handle_packet = gateway._EnOceanHomeAssistantGateway__handle_packet
+    start = time.perf_counter()
+    for packet in packets:
+        handle_packet(packet)
+    elapsed = time.perf_counter() - start
+
+    devices_by_address = {EnOceanAddress(address): None for address in addresses}
+    devices_by_number = {address: None for address in addresses}
+
+    start = time.perf_counter()
+    for packet in packets:
+        devices_by_address.get(EnOceanAddress(packet.sender_hex))
+    elapsed_address_lookup = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for packet in packets:
+        devices_by_number.get(packet.sender_int)
+    elapsed_number_lookup = time.perf_counter() - start
+
+    print(f"{number_of_devices} devices, {number_of_telegrams} telegrams")
+    print(
+        f"  gateway dispatch (incl. device handling): {elapsed / number_of_telegrams * 1e6:8.3f} µs/telegram"
+    )
+    print(
+        f"  lookup via EnOceanAddress(sender_hex):    {elapsed_address_lookup / number_of_telegrams * 1e6:8.3f} µs/telegram"
+    )
+    print(
+        f"  lookup via sender_int:                    {elapsed_number_lookup / number_of_telegrams * 1e6:8.3f} µs/telegram"
+    )
+
+    benchmark_device_handling(number_of_telegrams)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,76 @@
+"""Benchmark for the cold start of the EEP profiles, from EEP.xml and from the precompiled database.
+
+Usage: python scripts/benchmark_eep_profiles.py [runs]
+
+In a fresh interpreter, the decoders of all EEPs supported by the gateway and the telegram
+templates of its commands are compiled once from the enocean library's EEP.xml (as before
+the database, by pointing 'EEP_PROFILES_PATH' to a missing file) and once from
+'eep_profiles.json'. Both include the import of the enocean library's packet module, which
+the gateway needs anyway and which parses EEP.xml. The best time of the given number of runs
+(default: 5) is printed for each.
+"""
+
+import os
+import subprocess
+import sys
+
+CODE = """
+import logging
+import time
+start = time.perf_counter()
+from homeassistant_enocean import eep_profiles
+if {xml}:
+    eep_profiles.EEP_PROFILES_PATH = "/nonexistent/eep_profiles.json"
+from enocean.protocol.packet import Packet
+imported = time.perf_counter()
+from homeassistant_enocean.eep_decoder import get_eep_decoder
+from homeassistant_enocean.eep_registry import get_eep_registry
+from homeassistant_enocean.telegram_template import get_telegram_template
+logging.getLogger("enocean").setLevel(logging.ERROR)
+compiling = time.perf_counter()
+for eep in get_eep_registry().eeps():
+    get_eep_decoder(eep.rorg, eep.func, eep.type).fields
+get_telegram_template(0xD2, 0x01, 0x01, 0x01, ("IO", "OV"), (("DV", 0),))
+get_telegram_template(0xD2, 0x05, 0x00, 1, ("POS",))
+get_telegram_template(0xD2, 0x05, 0x00, 2)
+get_telegram_template(0xD2, 0x05, 0x00, 3)
+get_telegram_template(
+    0xA5, 0x38, 0x08, 2, ("EDIM", "RMP"), (("COM", 2), ("EDIMR", 1), ("STR", 0), ("SW", 1))
+)
+end = time.perf_counter()
+print((imported - start) * 1000, (end - compiling) * 1000)
+"""
+
+
+def run(xml: bool) -> tuple[float, float]:
+    """Return the import and the compile time (in ms) of a fresh interpreter."""
+    repository = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    environment = dict(os.environ, PYTHONPATH=repository)
+    result = subprocess.run(
+        [sys.executable, "-c", CODE.format(xml=xml)],
+        capture_output=True,
+        text=True,
+        check=True,
+        env=environment,
+    )
+    imported, compiled = result.stdout.split()
+    return float(imported), float(compiled)
+
+
+def main() -> None:
+    runs = int(sys.argv[1]) if len(sys.argv) > 1 else 5
+    results = {}
+    for label, xml in (("EEP.xml:", True), ("eep_profiles.json:", False)):
+        times = [run(xml) for _ in range(runs)]
+        imported = min(time[0] for time in times)
+        compiled = min(time[1] for time in times)
+        results[xml] = compiled
+        print(
+            f"{label:<20} compile {compiled:7.1f} ms "
+            f"(+ {imported:.1f} ms importing the enocean library), best of {runs}"
+        )
+    print(f"speed-up of the compilation: {results[True] / results[False]:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
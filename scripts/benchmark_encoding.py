@@ -0,0 +1,84 @@
+"""Micro-benchmark for the encoding of outgoing telegrams.
+
+Usage: python scripts/benchmark_encoding.py [number_of_telegrams]
+
+For a D2-05-00 position, a D2-05-00 stop and an A5-38-08 dimming command, the time per
+telegram is measured for 'RadioPacket.create' (as used by the device handlers before),
+for a shared template (patching destination, sender and values) and for a template bound
+to the device (patching the values only, as used by the device handlers now).
+"""
+
+import logging
+import sys
+import time
+
+from enocean.protocol.packet import RadioPacket
+
+from homeassistant_enocean.telegram_template import get_telegram_template
+
+DESTINATION = [0x01, 0xA2, 0xB3, 0xC4]
+SENDER = [0xFF, 0x80, 0x00, 0x05]
+
+COMMANDS: list[tuple[str, tuple, dict, dict]] = [
+    # (label, profile and command, fixed fields, variable fields)
+    ("D2-05-00 set position", (0xD2, 0x05, 0x00, 1), {}, {"POS": 42}),
+    ("D2-05-00 stop", (0xD2, 0x05, 0x00, 2), {}, {}),
+    (
+        "A5-38-08 dim",
+        (0xA5, 0x38, 0x08, 2),
+        {"COM": 2, "EDIMR": 1, "STR": 0, "SW": 1},
+        {"EDIM": 42.5, "RMP": 1},
+    ),
+]
+
+
+def measure(label: str, build, number_of_telegrams: int) -> float:
+    """Print and return the time per telegram (in µs)."""
+    start = time.perf_counter()
+    for _ in range(number_of_telegrams):
+        build()
+    elapsed = (time.perf_counter() - start) / number_of_telegrams * 1e6
+    print(f"  {label:<30} {elapsed:10.2f} µs/telegram")
+    return elapsed
+
+
+def main() -> None:
+    number_of_telegrams = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+    logging.getLogger("enocean").setLevel(logging.ERROR)
+
+    for label, (rorg, func, type_, command), fixed, variable in COMMANDS:
+        print(f"{label}, {number_of_telegrams} telegrams")
+        template = get_telegram_template(
+            rorg, func, type_, command, tuple(variable), tuple(fixed.items())
+        )
+        bound = template.bind(DESTINATION, SENDER)
+
+        reference = measure(
+            "RadioPacket.create:",
+            lambda: RadioPacket.create(
+                rorg=rorg,
+                rorg_func=func,
+                rorg_type=type_,
+                command=command,
+                destination=DESTINATION,
+                sender=SENDER,
+                **fixed,
+                **variable,
+            ),
+            max(1, number_of_telegrams // 20),
+        )
+        shared = measure(
+            "shared template:",
+            lambda: template.build(DESTINATION, SENDER, **variable),
+            number_of_telegrams,
+        )
+        device = measure(
+            "bound template:", lambda: bound.build(**variable), number_of_telegrams
+        )
+        print(
+            f"  speed-up: {reference / shared:.0f}x (shared), {reference / device:.0f}x (bound)"
+        )
+
+
+if __name__ == "__main__":
+    main()
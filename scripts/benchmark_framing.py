@@ -0,0 +1,106 @@
+"""Benchmark for the framing of ESP3 packets from the byte stream received from a module.
+
+Usage: python scripts/benchmark_framing.py [number_of_packets]
+
+A synthetic stream of radio telegrams (4BS, VLD and 1BS), responses and events is framed by
+the enocean library's 'Packet.parse_msg' (in 16 byte reads, as by the library's reader thread,
+and in 4096 byte reads, as by the asyncio communicator before) and by the
+'EnOceanESP3Framer' (in 4096 and 65536 byte reads). The stream is framed once as is and
+once with a noise byte (every fifth packet a 0x55) between packets. The throughput is
+printed in MB/s, together with the number of framed packets.
+"""
+
+import logging
+import random
+import sys
+import time
+
+from enocean.protocol.constants import PACKET, PARSE_RESULT
+from enocean.protocol.packet import Packet
+
+from homeassistant_enocean.esp3_framer import EnOceanESP3Framer
+
+SENDER = [0x01, 0xA2, 0xB3, 0xC4]
+OPTIONAL = [0x01, 0xFF, 0xFF, 0xFF, 0xFF, 0x40, 0x00]
+
+PACKETS = [
+    Packet(
+        PACKET.RADIO_ERP1, [0xA5, 0x00, 0x00, 0x68, 0x08] + SENDER + [0x00], OPTIONAL
+    ),
+    Packet(PACKET.RADIO_ERP1, [0xD2, 0x04, 0x60, 0x80] + SENDER + [0x00], OPTIONAL),
+    Packet(PACKET.RADIO_ERP1, [0xD5, 0x09] + SENDER + [0x00], OPTIONAL),
+    Packet(
+        PACKET.RADIO_ERP1, [0xD2, 0x32, 0x00, 0x00, 0x04] + SENDER + [0x00], OPTIONAL
+    ),
+    Packet(PACKET.RESPONSE, [0x00], []),
+    Packet(PACKET.EVENT, [0x02, 0x01], []),
+]
+
+
+def create_stream(number_of_packets: int, noise: bool) -> bytes:
+    """Return the ESP3 encoded packets (with a sync byte as noise every fifth packet)."""
+    encoded = [bytes(packet.build()) for packet in PACKETS]
+    random.seed(0)
+    stream = bytearray()
+    for i in range(number_of_packets):
+        if noise and i % 5 == 0:
+            stream.append(0x55)
+        stream += random.choice(encoded)
+    return bytes(stream)
+
+
+def parse_msg(stream: bytes, read_size: int) -> int:
+    """Frame the stream with 'Packet.parse_msg'; return the number of packets."""
+    count = 0
+    buffer = []
+    for start in range(0, len(stream), read_size):
+        buffer.extend(stream[start : start + read_size])
+        while True:
+            status, buffer, packet = Packet.parse_msg(buffer)
+            if status == PARSE_RESULT.INCOMPLETE:
+                break
+            if status == PARSE_RESULT.OK and packet:
+                count += 1
+    return count
+
+
+def framer(stream: bytes, read_size: int) -> int:
+    """Frame the stream with an 'EnOceanESP3Framer'; return the number of packets."""
+    count = 0
+    esp3_framer = EnOceanESP3Framer()
+    view = memoryview(stream)
+    for start in range(0, len(stream), read_size):
+        count += len(esp3_framer.feed(view[start : start + read_size]))
+    return count
+
+
+def measure(label: str, frame, stream: bytes, read_size: int) -> float:
+    """Print and return the throughput (in MB/s)."""
+    start = time.perf_counter()
+    count = frame(stream, read_size)
+    elapsed = time.perf_counter() - start
+    throughput = len(stream) / elapsed / 1e6
+    print(f"  {label:<36} {throughput:8.2f} MB/s  ({count} packets)")
+    return throughput
+
+
+def main() -> None:
+    number_of_packets = int(sys.argv[1]) if len(sys.argv) > 1 else 50000
+    # the enocean library logs every checksum mismatch
+    logging.getLogger("enocean").setLevel(logging.CRITICAL)
+
+    for noise in (False, True):
+        stream = create_stream(number_of_packets, noise)
+        print(
+            f"{number_of_packets} packets, {len(stream)} bytes"
+            + (", with noise" if noise else "")
+        )
+        reference = measure("Packet.parse_msg, 16 byte reads:", parse_msg, stream, 16)
+        measure("Packet.parse_msg, 4096 byte reads:", parse_msg, stream, 4096)
+        measure("EnOceanESP3Framer, 4096 byte reads:", framer, stream, 4096)
+        best = measure("EnOceanESP3Framer, 65536 byte reads:", framer, stream, 65536)
+        print(f"  speed-up: {best / reference:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,204 @@
+"""Benchmark the complete receive path of the gateway for every supported device type.
+
+Usage: python scripts/benchmark_replay.py [telegrams_per_device_type] [seed]
+
+For each supported device type, a synthetic capture of random telegrams of the device's EEP
+is replayed at maximum speed into a started gateway (using the 'EnOceanReplayCommunicator'),
+with a callback registered for every entity. The benchmark reports:
+ - telegrams/s: throughput of the replay, i.e. framing, dispatch, decoding and callbacks
+ - p50/p99: latency of 'data_received' per telegram (framing until all callbacks returned)
+ - B/telegram: transient memory allocated per telegram (tracemalloc peak, separate run)
+"""
+
+import asyncio
+import random
+import statistics
+import sys
+import time
+import tracemalloc
+
+from enocean.protocol.constants import PACKET
+from enocean.protocol.packet import Packet, RadioPacket
+
+from homeassistant_enocean.address import EnOceanDeviceAddress
+from homeassistant_enocean.capture import RX, TX, CaptureRecord
+from homeassistant_enocean.device_type import EnOceanDeviceType
+from homeassistant_enocean.gateway import EnOceanHomeAssistantGateway
+from homeassistant_enocean.replay import EnOceanReplayCommunicator
+from homeassistant_enocean.types import COMMON_COMMAND
+
+DEVICE_ADDRESS = 0x01020304
+
+
+def build(packet: Packet) -> bytes:
+    """Return the ESP3 encoding of a packet."""
+    return bytes(packet.build())
+
+
+def common_command(command: COMMON_COMMAND) -> bytes:
+    return build(Packet(PACKET.COMMON_COMMAND, data=[command.value], optional=[]))
+
+
+def response(data: list[int]) -> bytes:
+    return build(Packet(PACKET.RESPONSE, data=data, optional=[]))
+
+
+def startup_records() -> list[CaptureRecord]:
+    """Return the gateway's start-up commands and the module's responses."""
+    version = [2, 11, 1, 0, 2, 6, 3, 0, 0x01, 0x9A, 0xBC, 0xDE, 0, 0, 0, 0]
+    version += list(b"GATEWAYCTRL".ljust(16, b"\x00"))
+    return [
+        CaptureRecord(0.0, TX, common_command(COMMON_COMMAND.CO_RD_VERSION)),
+        CaptureRecord(0.0, TX, common_command(COMMON_COMMAND.CO_RD_IDBASE)),
+        CaptureRecord(0.0, RX, response([0, *version])),
+        CaptureRecord(0.0, RX, response([0, 0xFF, 0x80, 0x00, 0x00])),
+    ]
+
+
+def random_payload(device_type: EnOceanDeviceType, rng: random.Random) -> list[int]:
+    """Return random user data (without RORG) matching the device type's EEP."""
+    eep = device_type.eep
+    if eep.rorg == 0xA5:
+        # data telegram, i.e. learn bit set
+        return [rng.randrange(256) for _ in range(3)] + [rng.randrange(256) | 0x08]
+    if eep.rorg == 0xF6:
+        return [rng.choice([0x00, 0x10, 0x30, 0x50, 0x70, 0xC0, 0xE0, 0xF0])]
+    if (eep.rorg, eep.func) == (0xD2, 0x01):
+        # actuator status response
+        return [0x04, rng.randrange(2), rng.randrange(101)]
+    if (eep.rorg, eep.func) == (0xD2, 0x05):
+        # reply position and angle
+        return [rng.randrange(101), rng.randrange(101), 0x00, 0x04]
+    return [rng.randrange(256)]
+
+
+def telegram_records(
+    device_type: EnOceanDeviceType, count: int, rng: random.Random
+) -> list[CaptureRecord]:
+    """Return a capture of random telegrams sent by a device of the given type."""
+    sender = list(DEVICE_ADDRESS.to_bytes(4))
+    status = 0x30 if device_type.eep.rorg == 0xF6 else 0x00
+    return [
+        CaptureRecord(
+            0.0,
+            RX,
+            build(
+                RadioPacket(
+                    PACKET.RADIO_ERP1,
+                    data=[
+                        device_type.eep.rorg,
+                        *random_payload(device_type, rng),
+                        *sender,
+                        status,
+                    ],
+                    optional=[0x01, 0xFF, 0xFF, 0xFF, 0xFF, rng.randrange(40, 96), 0],
+                )
+            ),
+        )
+        for _ in range(count)
+    ]
+
+
+class TimingProtocol:
+    """Protocol wrapper measuring each 'data_received' call."""
+
+    def __init__(self, protocol, trace_memory: bool) -> None:
+        self.protocol = protocol
+        self.trace_memory = trace_memory
+        self.durations: list[float] = []
+        self.allocated: list[int] = []
+
+    def connection_lost(self, exc) -> None:
+        self.protocol.connection_lost(exc)
+
+    def data_received(self, data: bytes) -> None:
+        if self.trace_memory:
+            tracemalloc.reset_peak()
+            before = tracemalloc.get_traced_memory()[0]
+            self.protocol.data_received(data)
+            self.allocated.append(tracemalloc.get_traced_memory()[1] - before)
+            return
+
+        start = time.perf_counter()
+        self.protocol.data_received(data)
+        self.durations.append(time.perf_counter() - start)
+
+
+async def run(
+    device_type: EnOceanDeviceType, records: list[CaptureRecord], trace_memory: bool
+) -> tuple[float, TimingProtocol] | None:
+    """Replay the records into a gateway with a single device; None if the device type is not handled."""
+    communicator = EnOceanReplayCommunicator(startup_records(), speed=None)
+    gateway = EnOceanHomeAssistantGateway(
+        "", create_task=lambda target, name=None: None, communicator=communicator
+    )
+    address = EnOceanDeviceAddress(DEVICE_ADDRESS)
+    gateway.add_device(address, device_type)
+    if gateway.get_device_properties(address) is None:
+        return None
+
+    def callback(*args, **kwargs) -> None:
+        pass
+
+    registrations = {
+        "binary_sensor": gateway.register_binary_sensor_callback,
+        "cover": gateway.register_cover_callback,
+        "light": gateway.register_light_callback,
+        "sensor": gateway.register_sensor_callback,
+        "switch": gateway.register_switch_callback,
+    }
+    for platform, register in registrations.items():
+        for entity_id in getattr(gateway, platform + "_entities"):
+            register(entity_id, callback)
+
+    await gateway.start()
+    await communicator.wait_replayed()
+
+    timing = TimingProtocol(communicator.transport.get_protocol(), trace_memory)
+    communicator.transport.set_protocol(timing)
+    if trace_memory:
+        tracemalloc.start()
+    start = time.perf_counter()
+    await communicator.replay(records)
+    elapsed = time.perf_counter() - start
+    if trace_memory:
+        tracemalloc.stop()
+
+    gateway.stop()
+    return elapsed, timing
+
+
+def main() -> int:
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 5000
+    rng = random.Random(int(sys.argv[2]) if len(sys.argv) > 2 else 0)
+
+    print(
+        f"{'device type':<20} {'telegrams/s':>12} {'p50 [µs]':>9} {'p99 [µs]':>9} {'B/telegram':>11}"
+    )
+    failures = 0
+    device_types = EnOceanDeviceType.get_supported_device_types()
+    for unique_id, device_type in device_types.items():
+        records = telegram_records(device_type, count, rng)
+        try:
+            result = asyncio.run(run(device_type, records, False))
+            if result is None:
+                print(f"{unique_id:<20} no EEP handler")
+                continue
+            elapsed, timing = result
+            _, memory = asyncio.run(run(device_type, records, True))
+        except Exception as e:
+            failures += 1
+            print(f"{unique_id:<20} failed: {e!r}")
+            continue
+
+        quantiles = statistics.quantiles(timing.durations, n=100)
+        print(
+            f"{unique_id:<20} {len(records) / elapsed:12.0f} {quantiles[49] * 1e6:9.2f} "
+            f"{quantiles[98] * 1e6:9.2f} {statistics.mean(memory.allocated):11.0f}"
+        )
+
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
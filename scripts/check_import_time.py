@@ -0,0 +1,99 @@
+"""Check that importing the gateway module defers the expensive modules (regression check).
+
+Usage: python scripts/check_import_time.py [budget_in_ms]
+
+'homeassistant_enocean.gateway' is imported in a fresh interpreter with 'python -X importtime',
+after the standard library modules which Home Assistant has loaded anyway (asyncio, logging).
+The script fails (non-zero exit status) if the import loads any of the modules which are
+meant to be imported on first use only: the enocean library's protocol stack (which parses
+the EEP profiles with BeautifulSoup when imported), its communicators and the device handlers
+of the EEP registry. The import time (the best of 5 runs) is printed; as it depends on the
+machine, it is only checked if a budget is given.
+"""
+
+import os
+import subprocess
+import sys
+
+from homeassistant_enocean.eep_registry import get_eep_registry
+
+MODULE = "homeassistant_enocean.gateway"
+PRELOADED = ("asyncio", "logging")
+DEFERRED = (
+    "enocean.protocol.packet",
+    "enocean.communicators",
+    "bs4",
+    *(
+        f"homeassistant_enocean.devices.{module}"
+        for module in sorted(
+            {
+                registration.handler.rsplit(".", 1)[0]
+                for registration in get_eep_registry()
+            }
+        )
+    ),
+)
+RUNS = 5
+
+
+def import_once() -> tuple[float, set[str]]:
+    """Return the import time (in ms) and the names of the modules imported."""
+    code = f"import {', '.join(PRELOADED)}; import {MODULE}"
+    repository = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    environment = dict(os.environ, PYTHONPATH=repository)
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        capture_output=True,
+        text=True,
+        check=True,
+        env=environment,
+    )
+
+    modules = set()
+    total = None
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        _, cumulative, name = line.split("|")
+        if not cumulative.strip().isdigit():
+            continue  # header line
+        modules.add(name.strip())
+        if name.strip() == MODULE:
+            total = int(cumulative) / 1000
+    if total is None:
+        raise RuntimeError(f"{MODULE} was not imported.")
+    return total, modules
+
+
+def main() -> int:
+    budget = float(sys.argv[1]) if len(sys.argv) > 1 else None
+
+    times = []
+    modules: set[str] = set()
+    for _ in range(RUNS):
+        total, modules = import_once()
+        times.append(total)
+    best = min(times)
+
+    deferred = sorted(
+        module
+        for module in modules
+        if any(
+            module == name or module.startswith(name.rstrip(".") + ".")
+            for name in DEFERRED
+        )
+    )
+    print(
+        f"import {MODULE}: {best:.1f} ms (best of {RUNS})"
+        + (f", budget {budget:.0f} ms" if budget is not None else "")
+    )
+    if deferred:
+        print(f"Imported modules which should be deferred: {', '.join(deferred)}")
+    over_budget = budget is not None and best > budget
+    if over_budget:
+        print("Import time exceeds the budget.")
+    return 1 if deferred or over_budget else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
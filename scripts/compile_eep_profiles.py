@@ -0,0 +1,38 @@
+"""Compile the profiles of all EEPs in the registry (see eep_registry.py) into 'eep_profiles.json'.
+
+Usage: python scripts/compile_eep_profiles.py [output_path]
+
+The profiles are read from the EEP.xml of the installed enocean library, so the script has
+to be run again (and the result committed) whenever the library is updated or EEPs are added;
+the database is ignored at runtime if the library's version does not match.
+"""
+
+import json
+import sys
+
+from homeassistant_enocean.eep_profiles import EEP_PROFILES_PATH, compile_eep_profiles
+from homeassistant_enocean.eep_registry import get_eep_registry
+
+
+def main() -> int:
+    path = sys.argv[1] if len(sys.argv) > 1 else EEP_PROFILES_PATH
+    eeps = get_eep_registry().eeps()
+    document = compile_eep_profiles(eeps)
+    if document["enocean_version"] is None:
+        print("Cannot determine the version of the enocean library.")
+        return 1
+
+    with open(path, "w", encoding="utf-8") as file:
+        json.dump(document, file, separators=(",", ":"))
+        file.write("\n")
+
+    missing = len(eeps) - len(document["profiles"])
+    print(
+        f"{len(document['profiles'])} profiles (enocean {document['enocean_version']}) "
+        f"written to {path}" + (f", {missing} not in EEP.xml" if missing else "")
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
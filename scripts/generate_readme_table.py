@@ -0,0 +1,60 @@
+"""Generate the table of supported EEPs in README.md from the EEP registry.
+
+Usage: python scripts/generate_readme_table.py [--check]
+
+The table between the 'supported-eeps' markers in README.md is replaced by one row per EEP
+of the registry (see homeassistant_enocean/eep_registry.py). With '--check', README.md is
+not changed and the script fails (non-zero exit status) if the table is outdated.
+"""
+
+import os
+import sys
+
+from homeassistant_enocean.eep_registry import get_eep_registry
+
+README_PATH = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "README.md"
+)
+BEGIN = (
+    "<!-- supported-eeps:begin (generated by scripts/generate_readme_table.py) -->\n"
+)
+END = "<!-- supported-eeps:end -->\n"
+
+
+def generate_table() -> str:
+    """Return the table in Markdown."""
+    lines = [
+        "| EEP | Description | Home Assistant Component(s) | Tested Device(s) |\n",
+        "|-----|-------------|----------|----------|\n",
+    ]
+    for registration in get_eep_registry():
+        for eep in registration.eeps():
+            tested = registration.tested.get(eep.type, "none (untested)")
+            lines.append(
+                f"| {eep.to_string()} | {registration.model(eep.type)} "
+                f"| {registration.component(eep.type)} | {tested} |\n"
+            )
+    return "".join(lines)
+
+
+def main() -> int:
+    with open(README_PATH, encoding="utf-8") as file:
+        readme = file.read()
+    start = readme.index(BEGIN) + len(BEGIN)
+    end = readme.index(END, start)
+    updated = readme[:start] + generate_table() + readme[end:]
+
+    if "--check" in sys.argv[1:]:
+        if updated != readme:
+            print("The table of supported EEPs in README.md is outdated.")
+            return 1
+        print("The table of supported EEPs in README.md is up to date.")
+        return 0
+
+    with open(README_PATH, "w", encoding="utf-8") as file:
+        file.write(updated)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
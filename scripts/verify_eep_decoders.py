@@ -0,0 +1,108 @@
+"""Verify that the precompiled EEP decoders are bit-identical to the enocean library's 'parse_eep'.
+
+Usage: python scripts/verify_eep_decoders.py [telegrams_per_profile] [seed]
+
+For every profile decoded by a device handler, a corpus of random telegrams (including all
+edge values of single-byte payloads) is decoded with both implementations. The script exits
+with a non-zero status if any raw value, value or field order differs.
+"""
+
+import random
+import sys
+
+from enocean.protocol.packet import RadioPacket
+
+from homeassistant_enocean.eep_decoder import EEPDecoder, get_eep_decoder
+
+OPTIONAL = [0x01, 0xFF, 0xFF, 0xFF, 0xFF, 0x45, 0x00]
+SENDER = [0x01, 0x02, 0x03, 0x04]
+
+PROFILES: list[tuple[int, int, int, int | None, range]] = (
+    # (rorg, func, type, command, payload lengths)
+    [
+        (0xA5, 0x02, t, None, range(4, 5))
+        for t in [*range(0x01, 0x0C), *range(0x10, 0x1C), 0x20, 0x30]
+    ]
+    + [(0xA5, 0x04, t, None, range(4, 5)) for t in range(0x01, 0x05)]
+    + [
+        (0xA5, 0x06, 0x01, None, range(4, 5)),
+        (0xA5, 0x07, 0x03, None, range(4, 5)),
+        (0xA5, 0x08, 0x01, None, range(4, 5)),
+        (0xA5, 0x38, 0x08, 0x02, range(4, 5)),
+        (0xF6, 0x10, 0x00, None, range(1, 2)),
+    ]
+    + [(0xD2, 0x01, t, None, range(1, 10)) for t in range(0x00, 0x15)]
+)
+
+
+def corpus(rorg: int, lengths: range, count: int, rng: random.Random):
+    """Yield random telegrams (plus edge values) for the given RORG."""
+    for _ in range(count):
+        length = rng.choice(lengths)
+        payload = [rng.randrange(256) for _ in range(length)]
+        status = rng.randrange(256)
+        yield payload, status
+    for value in (0x00, 0x01, 0x7F, 0x80, 0xFE, 0xFF):
+        yield [value] * lengths[-1], value
+
+
+def decode(method, data: list[int], optional: list[int]):
+    """Decode a fresh packet with the given method, returning None if decoding fails."""
+    try:
+        return method(RadioPacket(0x01, data=list(data), optional=list(optional)))
+    except ValueError:
+        return None
+
+
+def compare(decoder: EEPDecoder, data: list[int], optional: list[int]) -> str | None:
+    """Return a description of the first difference, if any."""
+    compiled = decode(decoder.decode, data, optional)
+    reference = decode(decoder.parse, data, optional)
+
+    if compiled is None or reference is None:
+        if compiled is reference:
+            return None
+        return f"only one implementation failed: {compiled} != {reference}"
+    if list(compiled) != list(reference):
+        return f"fields differ: {list(compiled)} != {list(reference)}"
+    for shortcut, value in reference.items():
+        if compiled[shortcut] != value or type(compiled[shortcut].value) is not type(
+            value.value
+        ):
+            return f"{shortcut}: {compiled[shortcut]} != {value}"
+    return None
+
+
+def main() -> int:
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+    rng = random.Random(int(sys.argv[2]) if len(sys.argv) > 2 else 0)
+
+    failures = 0
+    telegrams = 0
+    for rorg, func, type_, command, lengths in PROFILES:
+        decoder = get_eep_decoder(rorg, func, type_, command=command)
+        for payload, status in corpus(rorg, lengths, count, rng):
+            if rorg == 0xD2:
+                data = [rorg, *payload, *SENDER]
+                optional = OPTIONAL[:-1] + [status]
+                data.append(0)
+            else:
+                data = [rorg, *payload, *SENDER, status]
+                optional = OPTIONAL
+            telegrams += 1
+
+            difference = compare(decoder, data, optional)
+            if difference:
+                failures += 1
+                print(
+                    f"{rorg:02X}-{func:02X}-{type_:02X} data={[hex(b) for b in data]}: {difference}"
+                )
+
+    print(
+        f"{telegrams} telegrams in {len(PROFILES)} profiles verified, {failures} differences."
+    )
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
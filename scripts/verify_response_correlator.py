@@ -0,0 +1,144 @@
+"""Verify that the response correlator stays in sync with the module after lost responses.
+
+Usage: python scripts/verify_response_correlator.py
+
+A fake module answers (or does not answer) the packets sent through an
+'EnOceanResponseCorrelator': after an unanswered request, subsequent requests must receive
+their own responses; a late response must not be attributed to a later request; a request
+after a burst of packets sent without waiting (also from other threads) must receive its own
+response; and the entries of unanswered packets sent without waiting must expire. The script
+exits with a non-zero status if any check fails.
+"""
+
+import asyncio
+import logging
+import sys
+import threading
+
+from enocean.protocol.constants import PACKET
+from enocean.protocol.packet import Packet, ResponsePacket
+
+from homeassistant_enocean.response_correlator import EnOceanResponseCorrelator
+
+TIMEOUT = 0.2
+"""Response timeout of the correlator (in seconds)."""
+
+
+class FakeModule:
+    """Send function answering every packet (unless muted) with a distinct response."""
+
+    def __init__(self, loop: asyncio.AbstractEventLoop) -> None:
+        self.loop = loop
+        self.correlator: EnOceanResponseCorrelator | None = None
+        self.muted = False
+        self.return_code = 0x00
+        self.responses: list[Packet] = []
+
+    def __call__(self, packet: Packet) -> bool:
+        if not self.muted:
+            response = self.response(len(self.responses), self.return_code)
+            self.loop.call_soon_threadsafe(self.correlator.handle_response, response)
+        return True
+
+    def response(self, number: int, return_code: int = 0x00) -> Packet:
+        response = ResponsePacket(PACKET.RESPONSE, [return_code, number & 0xFF], [])
+        self.responses.append(response)
+        return response
+
+
+def command() -> Packet:
+    return Packet(PACKET.COMMON_COMMAND, data=[0x08], optional=[])
+
+
+async def verify() -> list[str]:
+    failures = []
+    module = FakeModule(asyncio.get_running_loop())
+    correlator = module.correlator = EnOceanResponseCorrelator(
+        module.loop, module, TIMEOUT
+    )
+
+    # a lost response
+    module.muted = True
+    if await correlator.request(command(), timeout=0.05) is not None:
+        failures.append("unanswered request returned a response")
+    if correlator.pending:
+        failures.append(f"{correlator.pending} entries pending after a timeout")
+
+    # subsequent requests receive their own responses
+    module.muted = False
+    for i in range(3):
+        response = await correlator.request(command(), timeout=0.5)
+        if response is None or response is not module.responses[-1]:
+            failures.append(f"request {i} after a timeout got a wrong response")
+    if correlator.pending:
+        failures.append(f"{correlator.pending} entries pending after answered requests")
+
+    # a late response after a timeout is discarded
+    module.muted = True
+    await correlator.request(command(), timeout=0.05)
+    correlator.handle_response(module.response(0xEE))
+    module.muted = False
+    response = await correlator.request(command(), timeout=0.5)
+    if response is None or response is not module.responses[-1]:
+        failures.append("late response was attributed to a subsequent request")
+
+    # a request after a burst of answered packets sent without waiting
+    for _ in range(200):
+        correlator.send(command())
+    module.return_code = 0x02
+    response = await correlator.request(command(), timeout=0.5)
+    module.return_code = 0x00
+    if response is None or response.response != 0x02:
+        failures.append("request after a burst got the response of another packet")
+
+    # requests while other threads send without waiting
+    threads = [
+        threading.Thread(
+            target=lambda: [correlator.send(command()) for _ in range(500)]
+        )
+        for _ in range(4)
+    ]
+    for thread in threads:
+        thread.start()
+    for i in range(50):
+        module.return_code = 0x02 + i % 2
+        response = await correlator.request(command(), timeout=0.5)
+        if response is None or response.response != module.return_code:
+            failures.append(f"request {i} during concurrent sends got a wrong response")
+            break
+    module.return_code = 0x00
+    for thread in threads:
+        thread.join()
+    await asyncio.sleep(0.05)
+    if correlator.pending:
+        failures.append(f"{correlator.pending} entries pending after concurrent sends")
+
+    # unanswered packets sent without waiting expire after the timeout
+    module.muted = True
+    for _ in range(500):
+        correlator.send(command())
+    await asyncio.sleep(TIMEOUT * 1.5)
+    correlator.send(command())
+    if correlator.pending != 1:
+        failures.append(f"{correlator.pending} entries pending after they expired")
+    await asyncio.sleep(TIMEOUT * 1.5)
+    module.muted = False
+    if await correlator.request(command(), timeout=0.5) is None:
+        failures.append("request after unanswered packets sent without waiting failed")
+
+    return failures
+
+
+def main() -> int:
+    # the correlator logs every resync
+    logging.getLogger("homeassistant_enocean").setLevel(logging.ERROR)
+
+    failures = asyncio.run(verify())
+    for failure in failures:
+        print(failure)
+    print(f"{len(failures)} failures.")
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
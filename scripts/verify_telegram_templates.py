@@ -0,0 +1,188 @@
+"""Verify that the telegrams built from pre-encoded templates are byte-identical to 'RadioPacket.create'.
+
+Usage: python scripts/verify_telegram_templates.py
+
+The commands of the D2-01, D2-05-00 and A5-38-08 device handlers are sent to a capturing
+send function and compared with the telegrams built by 'RadioPacket.create' from the same
+fields (as the handlers did before templates were introduced). Profiles which the enocean
+library cannot encode are reported as skipped. The script exits with a non-zero status if
+any telegram differs.
+"""
+
+import logging
+import sys
+
+from enocean.protocol.constants import RORG
+from enocean.protocol.packet import RadioPacket
+
+from homeassistant_enocean.address import EnOceanAddress, EnOceanDeviceAddress
+from homeassistant_enocean.device_type import EnOceanDeviceType
+from homeassistant_enocean.devices.a53808_device import EnOceanA53808Device
+from homeassistant_enocean.devices.d201xx_device import EnOceanD201XXDevice
+from homeassistant_enocean.devices.d20500_device import EnOceanD20500Device
+
+DESTINATION = EnOceanDeviceAddress("01:A2:B3:C4")
+SENDER = EnOceanAddress("FF:80:00:05")
+
+
+class Capture:
+    """Send function collecting the sent telegrams."""
+
+    def __init__(self) -> None:
+        self.packets: list[RadioPacket] = []
+
+    def __call__(self, packet: RadioPacket, **kwargs) -> None:
+        self.packets.append(packet)
+
+    def pop(self) -> bytes:
+        return bytes(self.packets.pop().build())
+
+
+def reference(rorg: int, func: int, type_: int, command: int, **fields) -> bytes:
+    """Build a telegram with 'RadioPacket.create'."""
+    return bytes(
+        RadioPacket.create(
+            rorg=rorg,
+            rorg_func=func,
+            rorg_type=type_,
+            command=command,
+            destination=DESTINATION.to_bytelist(),
+            sender=SENDER.to_bytelist(),
+            **fields,
+        ).build()
+    )
+
+
+def device(device_class, eep: str, capture: Capture):
+    """Create a device handler sending to the capture."""
+    return device_class(
+        enocean_id=DESTINATION,
+        device_type=EnOceanDeviceType.get_supported_device_types()[eep],
+        send_packet=capture,
+        sender_id=SENDER,
+    )
+
+
+def verify_d201xx(capture: Capture) -> tuple[int, int, list[str]]:
+    failures = 0
+    telegrams = 0
+    skipped = []
+    for eep in EnOceanDeviceType.get_supported_device_types():
+        if not eep.startswith("D2-01-"):
+            continue
+        type_ = int(eep[-2:], 16)
+        try:
+            reference(RORG.VLD, 0x01, type_, 0x01, DV=0, IO=0, OV=0)
+        except Exception:
+            skipped.append(eep)
+            continue
+
+        switch = device(EnOceanD201XXDevice, eep, capture)
+        for entity in switch.switch_entities:
+            channel = switch._get_channel_from_entity_uid(entity.unique_id)
+            for method, output_value in (
+                (switch.switch_turn_on, 100),
+                (switch.switch_turn_off, 0),
+            ):
+                method(entity.unique_id)
+                telegrams += 1
+                expected = reference(
+                    RORG.VLD, 0x01, type_, 0x01, DV=0, IO=channel, OV=output_value
+                )
+                if capture.pop() != expected:
+                    failures += 1
+                    print(f"{eep} channel {channel} output {output_value} differs")
+    return telegrams, failures, skipped
+
+
+def verify_d20500(capture: Capture) -> tuple[int, int]:
+    failures = 0
+    telegrams = 0
+    cover = device(EnOceanD20500Device, "D2-05-00", capture)
+    for position in range(101):
+        cover.set_cover_position(None, position)
+        telegrams += 1
+        if capture.pop() != reference(RORG.VLD, 0x05, 0x00, 1, POS=100 - position):
+            failures += 1
+            print(f"D2-05-00 position {position} differs")
+    for method, command in ((cover.stop_cover, 2), (cover.query_cover_position, 3)):
+        method(None)
+        telegrams += 1
+        if capture.pop() != reference(RORG.VLD, 0x05, 0x00, command):
+            failures += 1
+            print(f"D2-05-00 command {command} differs")
+    return telegrams, failures
+
+
+def verify_a53808(capture: Capture) -> tuple[int, int]:
+    failures = 0
+    telegrams = 0
+    light = device(EnOceanA53808Device, "A5-38-08", capture)
+    for min_brightness, max_brightness in ((0, 100), (10, 90), (33, 67)):
+        light.set_number_value("min_brightness", min_brightness)
+        light.set_number_value("max_brightness", max_brightness)
+        for ramping_time in (0, 1, 17, 255):
+            light.set_number_value("ramping_time", ramping_time)
+            for brightness in range(256):
+                light.light_turn_on(None, brightness)
+                telegrams += 1
+                edim = 100 * (
+                    light.convert_absolute_home_assistant_brightness_to_relative_device_brightness(
+                        brightness
+                    )
+                )
+                expected = reference(
+                    0xA5,
+                    0x38,
+                    0x08,
+                    0x02,
+                    COM=0x02,
+                    EDIM=edim,
+                    RMP=ramping_time,
+                    EDIMR=1,
+                    STR=0,
+                    SW=1,
+                )
+                if capture.pop() != expected:
+                    failures += 1
+                    print(f"A5-38-08 on {brightness} ramping {ramping_time} differs")
+
+            light.light_turn_off(None)
+            telegrams += 1
+            expected = reference(
+                0xA5,
+                0x38,
+                0x08,
+                0x02,
+                COM=0x02,
+                EDIM=0,
+                RMP=ramping_time,
+                EDIMR=0,
+                STR=0,
+                SW=0,
+            )
+            if capture.pop() != expected:
+                failures += 1
+                print(f"A5-38-08 off ramping {ramping_time} differs")
+    return telegrams, failures
+
+
+def main() -> int:
+    # the enocean library logs every profile or field it cannot find
+    logging.getLogger("enocean").setLevel(logging.ERROR)
+
+    capture = Capture()
+    d201_telegrams, d201_failures, skipped = verify_d201xx(capture)
+    d205_telegrams, d205_failures = verify_d20500(capture)
+    a538_telegrams, a538_failures = verify_a53808(capture)
+
+    telegrams = d201_telegrams + d205_telegrams + a538_telegrams
+    failures = d201_failures + d205_failures + a538_failures
+    if skipped:
+        print(f"Skipped (not encodable by the enocean library): {', '.join(skipped)}")
+    print(f"{telegrams} telegrams verified, {failures} differences.")
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())